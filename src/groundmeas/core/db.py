@@ -9,8 +9,9 @@ CRUD operations on Location, Measurement, and MeasurementItem models.
 """
 
 import logging
-from typing import List, Optional, Dict, Any, Tuple
+from typing import List, Optional, Dict, Any, Sequence, Tuple
 
+import numpy as np
 from sqlalchemy import and_, text
 from sqlalchemy.exc import SQLAlchemyError
 from sqlalchemy.orm import selectinload, Session
@@ -72,6 +73,55 @@ def _get_session() -> Session:
     return Session(_engine)
 
 
+def _filter_clauses(model: Any, filters: Dict[str, Any]) -> List[Any]:
+    """
+    Translate keyword filters with suffix operators into SQL clauses.
+
+    Parameters
+    ----------
+    model : type
+        SQLModel table class whose columns are filtered.
+    filters : dict
+        Field lookups, e.g., ``measurement_id=1``, ``frequency_hz__gte=50``.
+
+    Returns
+    -------
+    list
+        SQLAlchemy boolean clauses, to be combined with ``and_``.
+
+    Raises
+    ------
+    ValueError
+        On unknown fields or unsupported filter operators.
+    """
+    clauses = []
+    for key, val in filters.items():
+        if "__" in key:
+            field, op = key.split("__", 1)
+        else:
+            field, op = key, "eq"
+        col = getattr(model, field, None)
+        if col is None:
+            raise ValueError(f"Unknown filter field: {field}")
+        if op == "eq":
+            clauses.append(col == val)
+        elif op == "ne":
+            clauses.append(col != val)
+        elif op == "lt":
+            clauses.append(col < val)
+        elif op == "lte":
+            clauses.append(col <= val)
+        elif op == "gt":
+            clauses.append(col > val)
+        elif op == "gte":
+            clauses.append(col >= val)
+        elif op == "in":
+            clauses.append(col.in_(val))
+        else:
+            raise ValueError(f"Unsupported filter operator: {op}")
+    return clauses
+
+
 def create_measurement(data: Dict[str, Any]) -> int:
     """
     Insert a Measurement, optionally with a nested Location.
@@ -233,31 +283,7 @@ def read_measurements_by(**filters: Any) -> Tuple[List[Dict[str, Any]], List[int
         selectinload(Measurement.items),
         selectinload(Measurement.location),
     )
-    clauses = []
-    for key, val in filters.items():
-        if "__" in key:
-            field, op = key.split("__", 1)
-        else:
-            field, op = key, "eq"
-        col = getattr(Measurement, field, None)
-        if col is None:
-            raise ValueError(f"Unknown filter field: {field}")
-        if op == "eq":
-            clauses.append(col == val)
-        elif op == "ne":
-            clauses.append(col != val)
-        elif op == "lt":
-            clauses.append(col < val)
-        elif op == "lte":
-            clauses.append(col <= val)
-        elif op == "gt":
-            clauses.append(col > val)
-        elif op == "gte":
-            clauses.append(col >= val)
-        elif op == "in":
-            clauses.append(col.in_(val))
-        else:
-            raise ValueError(f"Unsupported filter operator: {op}")
+    clauses = _filter_clauses(Measurement, filters)
     if clauses:
         stmt = stmt.where(and_(*clauses))
 
@@ -307,31 +333,7 @@ def read_items_by(**filters: Any) -> Tuple[List[Dict[str, Any]], List[int]]:
         On database errors.
     """
     stmt = select(MeasurementItem)
-    clauses = []
-    for key, val in filters.items():
-        if "__" in key:
-            field, op = key.split("__", 1)
-        else:
-            field, op = key, "eq"
-        col = getattr(MeasurementItem, field, None)
-        if col is None:
-            raise ValueError(f"Unknown filter field: {field}")
-        if op == "eq":
-            clauses.append(col == val)
-        elif op == "ne":
-            clauses.append(col != val)
-        elif op == "lt":
-            clauses.append(col < val)
-        elif op == "lte":
-            clauses.append(col <= val)
-        elif op == "gt":
-            clauses.append(col > val)
-        elif op == "gte":
-            clauses.append(col >= val)
-        elif op == "in":
-            clauses.append(col.in_(val))
-        else:
-            raise ValueError(f"Unsupported filter operator: {op}")
+    clauses = _filter_clauses(MeasurementItem, filters)
     if clauses:
         stmt = stmt.where(and_(*clauses))
 
@@ -350,6 +352,104 @@ def read_items_by(**filters: Any) -> Tuple[List[Dict[str, Any]], List[int]]:
     return records, ids
 
 
+def read_item_columns(
+    columns: Sequence[str], order_by: Optional[Sequence[str]] = None, **filters: Any
+) -> List[Tuple[Any, ...]]:
+    """
+    Retrieve selected measurement item columns as plain tuples.
+
+    Issues a Core ``SELECT`` over only the requested columns, so no
+    ``MeasurementItem`` objects are constructed. Use this on read-heavy paths
+    (e.g. plotting) that need a few fields from many rows.
+
+    Parameters
+    ----------
+    columns : sequence[str]
+        Column names to select, e.g., ``("frequency_hz", "value")``.
+    order_by : sequence[str], optional
+        Column names to sort by (ascending), applied in the database.
+    **filters : Any
+        Field lookups with the same suffix operators as ``read_items_by``.
+
+    Returns
+    -------
+    list[tuple]
+        One tuple per matching row, ordered like ``columns``.
+
+    Raises
+    ------
+    ValueError
+        On unknown columns or unsupported filter operators.
+    RuntimeError
+        On database errors.
+    """
+    def _column(name: str) -> Any:
+        col = getattr(MeasurementItem, name, None)
+        if col is None:
+            raise ValueError(f"Unknown column: {name}")
+        return col
+
+    stmt = select(*[_column(name) for name in columns])
+    clauses = _filter_clauses(MeasurementItem, filters)
+    if clauses:
+        stmt = stmt.where(and_(*clauses))
+    if order_by:
+        stmt = stmt.order_by(*[_column(name) for name in order_by])
+
+    try:
+        with _get_session() as session:
+            rows = session.execute(stmt).all()
+    except Exception as e:
+        logger.exception("Failed to execute read_item_columns query")
+        raise RuntimeError(f"Could not read item columns: {e}") from e
+
+    return [tuple(row) for row in rows]
+
+
+def read_item_arrays(
+    columns: Sequence[str], order_by: Optional[Sequence[str]] = None, **filters: Any
+) -> Dict[str, np.ndarray]:
+    """
+    Retrieve selected measurement item columns as NumPy arrays.
+
+    Columnar counterpart of ``read_item_columns``: each requested column is
+    returned as one array, so callers can mask and convert whole profiles at
+    once instead of walking per-row dicts.
+
+    Parameters
+    ----------
+    columns : sequence[str]
+        Column names to select, e.g., ``("measurement_distance_m", "value")``.
+    order_by : sequence[str], optional
+        Column names to sort by (ascending), applied in the database.
+    **filters : Any
+        Field lookups with the same suffix operators as ``read_items_by``.
+
+    Returns
+    -------
+    dict[str, numpy.ndarray]
+        ``{column: array}``. Numeric columns are ``float64`` with NaN for
+        missing values; columns that cannot be cast to float stay ``object``.
+
+    Raises
+    ------
+    ValueError
+        On unknown columns or unsupported filter operators.
+    RuntimeError
+        On database errors.
+    """
+    rows = read_item_columns(columns, order_by=order_by, **filters)
+    # Transpose once; an empty result still yields one empty column per name
+    column_values = list(zip(*rows)) if rows else [()] * len(columns)
+    arrays: Dict[str, np.ndarray] = {}
+    for name, raw in zip(columns, column_values):
+        try:
+            arrays[name] = np.array(raw, dtype=np.float64)
+        except (TypeError, ValueError):
+            arrays[name] = np.array(raw, dtype=object)
+    return arrays
+
+
 def update_measurement(measurement_id: int, updates: Dict[str, Any]) -> bool:
     """
     Update a measurement by ID.
@@ -16,7 +16,6 @@ value, value_real/value_imag, and value_angle_deg fields.
 
 import logging
 import math
-import numpy as np
 from datetime import datetime, timezone
 from typing import Optional, List, Literal
 
@@ -230,7 +229,7 @@ def _compute_magnitude(mapper, connection, target: MeasurementItem):
                 r = target.value_real or 0.0
                 i = target.value_imag or 0.0
                 target.value = math.hypot(r, i)
-                target.value_angle_deg = float(np.degrees(np.arctan2(i, r)))
+                target.value_angle_deg = math.degrees(math.atan2(i, r))
             else:
                 logger.error(
                     "MeasurementItem %s lacks both magnitude and real/imag components",
@@ -10,6 +10,8 @@ create_item = _db.create_item
 read_measurements = _db.read_measurements
 read_measurements_by = _db.read_measurements_by
 read_items_by = _db.read_items_by
+read_item_columns = _db.read_item_columns
+read_item_arrays = _db.read_item_arrays
 update_measurement = _db.update_measurement
 update_item = _db.update_item
 delete_measurement = _db.delete_measurement
@@ -23,6 +25,8 @@ __all__ = [
     "read_measurements",
     "read_measurements_by",
     "read_items_by",
+    "read_item_columns",
+    "read_item_arrays",
     "update_measurement",
     "update_item",
     "delete_measurement",
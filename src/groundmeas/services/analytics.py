@@ -7,17 +7,25 @@ process impedance and resistivity data for earthing measurements, and to fit
 and evaluate rho–f models.
 """
 
+import functools
 import itertools
 import logging
 import math
 import os
 import warnings
+from collections import defaultdict
 from dataclasses import dataclass
 from typing import Any, Callable, Dict, List, Literal, Optional, Sequence, Tuple, Union
 
 import numpy as np
+from numpy.linalg import lstsq as _lstsq
 
-from ..core.db import read_items_by, read_measurements_by
+from ..core.db import (
+    read_item_arrays,
+    read_item_columns,
+    read_items_by,
+    read_measurements_by,
+)
 
 # configure module‐level logger
 logger = logging.getLogger(__name__)
@@ -30,44 +38,149 @@ except Exception:
     _MLX_AVAILABLE = False
 
 try:
+    from scipy import optimize as _scipy_optimize  # type: ignore
     from scipy import special as _scipy_special  # type: ignore
     _SCIPY_AVAILABLE = True
 except Exception:
+    _scipy_optimize = None  # type: ignore
     _scipy_special = None  # type: ignore
     _SCIPY_AVAILABLE = False
 
 
-def _resolve_math_backend(
-    backend: Literal["auto", "numpy", "mlx"] = "auto",
-) -> Tuple[str, Any]:
-    """
-    Resolve the math backend (NumPy or MLX) for lightweight computations.
-
-    The backend can be set explicitly or via ``GROUNDMEAS_MATH_BACKEND`` when
-    ``backend="auto"``. MLX is optional and only used if installed.
-    """
+@functools.lru_cache(maxsize=None)
+def _backend_name(
+    backend: str, env: Optional[str], mlx_available: bool
+) -> Tuple[str, bool]:
+    """Return ``(backend_name, fell_back)`` for one resolver input combination."""
     backend_key = backend.strip().lower()
     if backend_key == "auto":
-        env = os.environ.get("GROUNDMEAS_MATH_BACKEND")
         if env:
             backend_key = env.strip().lower()
-        elif _MLX_AVAILABLE:
+        elif mlx_available:
             backend_key = "mlx"
         else:
             backend_key = "numpy"
 
     if backend_key == "mlx":
-        if not _MLX_AVAILABLE:
-            warnings.warn(
-                "MLX backend requested but not installed; falling back to NumPy",
-                UserWarning,
-            )
-            return "numpy", np
-        return "mlx", mx
+        if not mlx_available:
+            return "numpy", True
+        return "mlx", False
+    return "numpy", False
+
+
+def _resolve_math_backend(
+    backend: Literal["auto", "numpy", "mlx"] = "auto",
+) -> Tuple[str, Any]:
+    """
+    Resolve the math backend (NumPy or MLX) for lightweight computations.
+
+    The backend can be set explicitly or via ``GROUNDMEAS_MATH_BACKEND`` when
+    ``backend="auto"``. MLX is optional and only used if installed.
 
+    Notes
+    -----
+    Resolution is memoized on ``(backend, env value, MLX availability)``, so
+    changing the environment variable takes effect on the next call. The
+    fallback warning is emitted on every call that falls back.
+    """
+    name, fell_back = _backend_name(
+        backend, os.environ.get("GROUNDMEAS_MATH_BACKEND"), _MLX_AVAILABLE
+    )
+    if fell_back:
+        warnings.warn(
+            "MLX backend requested but not installed; falling back to NumPy",
+            UserWarning,
+            stacklevel=3,
+        )
+    if name == "mlx":
+        return "mlx", mx
     return "numpy", np
 
 
+def _coerce_float_array(raw: Sequence[Any]) -> Tuple[np.ndarray, np.ndarray]:
+    """
+    Convert raw values to ``float64`` in one pass where possible.
+
+    Returns the array (NaN for ``None`` and unconvertible entries) and a mask
+    of entries that were present but could not be converted.
+    """
+    try:
+        arr = np.array(raw, dtype=np.float64)
+        return arr, np.zeros(len(raw), dtype=bool)
+    except (TypeError, ValueError):
+        pass
+
+    arr = np.full(len(raw), np.nan)
+    bad = np.zeros(len(raw), dtype=bool)
+    for idx, item in enumerate(raw):
+        if item is None:
+            continue
+        try:
+            arr[idx] = float(item)
+        except (TypeError, ValueError):
+            bad[idx] = True
+    return arr, bad
+
+
+def _item_fields(items: Sequence[Dict[str, Any]], *keys: str) -> Tuple[List[Any], ...]:
+    """
+    Extract several fields from item dicts in one pass, one list per key.
+
+    Missing keys yield None. ``dict.get`` is bound once per item instead of
+    being looked up once per item and field.
+    """
+    if not items:
+        return tuple([] for _ in keys)
+    rows = [tuple(map(item.get, keys)) for item in items]
+    return tuple(list(col) for col in zip(*rows))
+
+
+def _item_ids(items: Sequence[Dict[str, Any]], mask: np.ndarray) -> str:
+    """Comma-joined ``id`` values of the items selected by ``mask``."""
+    return ", ".join(str(items[idx].get("id")) for idx in np.flatnonzero(mask))
+
+
+def _group_by_measurement(items: Sequence[Dict[str, Any]]) -> Dict[Any, List[Dict[str, Any]]]:
+    """Group item dicts by their ``measurement_id``, keeping fetch order."""
+    grouped: Dict[Any, List[Dict[str, Any]]] = defaultdict(list)
+    for item in items:
+        grouped[item.get("measurement_id")].append(item)
+    return grouped
+
+
+def _impedance_map(mid: int, items: Sequence[Dict[str, Any]]) -> Dict[float, float]:
+    """Convert one measurement's impedance items to ``{frequency_hz: value}``."""
+    if not items:
+        warnings.warn(
+            f"No earthing_impedance measurements found for measurement_id={mid}",
+            UserWarning,
+            stacklevel=3,
+        )
+        return {}
+
+    freq_raw, val_raw = _item_fields(items, "frequency_hz", "value")
+    freq, freq_bad = _coerce_float_array(freq_raw)
+    val, val_bad = _coerce_float_array(val_raw)
+    missing = np.fromiter((f is None for f in freq_raw), dtype=bool, count=len(items))
+    # Like float(None), a missing value counts as a failed conversion
+    bad = ~missing & (freq_bad | val_bad | np.isnan(val))
+    keep = ~(missing | bad)
+
+    if missing.any():
+        warnings.warn(
+            f"MeasurementItem id={_item_ids(items, missing)} missing frequency_hz; skipping",
+            UserWarning,
+            stacklevel=3,
+        )
+    if bad.any():
+        warnings.warn(
+            f"Could not convert item {_item_ids(items, bad)} to floats; skipping",
+            UserWarning,
+            stacklevel=3,
+        )
+    return dict(zip(freq[keep].tolist(), val[keep].tolist()))
+
+
 def impedance_over_frequency(
     measurement_ids: Union[int, List[int]],
 ) -> Union[Dict[float, float], Dict[int, Dict[float, float]]]:
@@ -91,49 +204,83 @@ def impedance_over_frequency(
         If database access fails.
     """
     single = isinstance(measurement_ids, int)
-    ids: List[int] = [measurement_ids] if single else list(measurement_ids)
-    all_results: Dict[int, Dict[float, float]] = {}
+    # Repeated IDs are fetched and processed once (order-preserving dedupe)
+    ids: List[int] = [measurement_ids] if single else list(dict.fromkeys(measurement_ids))
 
-    for mid in ids:
-        try:
-            items, _ = read_items_by(
-                measurement_id=mid, measurement_type="earthing_impedance"
+    # One query for all IDs; items are grouped by measurement in Python
+    try:
+        if single:
+            fetched, _ = read_items_by(
+                measurement_id=ids[0], measurement_type="earthing_impedance"
             )
-        except Exception as e:
-            logger.error("Error reading impedance items for measurement %s: %s", mid, e)
-            raise RuntimeError(
-                f"Failed to load impedance data for measurement {mid}"
-            ) from e
-
-        if not items:
-            warnings.warn(
-                f"No earthing_impedance measurements found for measurement_id={mid}",
-                UserWarning,
+        else:
+            fetched, _ = read_items_by(
+                measurement_id__in=ids, measurement_type="earthing_impedance"
             )
-            all_results[mid] = {}
-            continue
+    except Exception as e:
+        mids = ids[0] if single else ids
+        logger.error("Error reading impedance items for measurement %s: %s", mids, e)
+        raise RuntimeError(
+            f"Failed to load impedance data for measurement {mids}"
+        ) from e
 
-        freq_imp_map: Dict[float, float] = {}
-        for item in items:
-            freq = item.get("frequency_hz")
-            value = item.get("value")
-            if freq is None:
-                warnings.warn(
-                    f"MeasurementItem id={item.get('id')} missing frequency_hz; skipping",
-                    UserWarning,
-                )
-                continue
-            try:
-                freq_imp_map[float(freq)] = float(value)
-            except Exception:
-                warnings.warn(
-                    f"Could not convert item {item.get('id')} to floats; skipping",
-                    UserWarning,
-                )
+    if single:
+        return _impedance_map(ids[0], fetched)
+    items_by_id = _group_by_measurement(fetched)
+    result: Dict[int, Dict[float, float]] = {}
+    for mid in ids:
+        result[mid] = _impedance_map(mid, items_by_id.get(mid, []))
+    return result
 
-        all_results[mid] = freq_imp_map
 
-    return all_results[ids[0]] if single else all_results
+def _real_imag_map(
+    mid: int, items: Sequence[Dict[str, Any]]
+) -> Dict[float, Dict[str, Optional[float]]]:
+    """Convert one measurement's impedance items to ``{frequency_hz: {"real", "imag"}}``."""
+    if not items:
+        warnings.warn(
+            f"No earthing_impedance measurements found for measurement_id={mid}",
+            UserWarning,
+            stacklevel=3,
+        )
+        return {}
+
+    freq_raw, real_raw, imag_raw = _item_fields(
+        items, "frequency_hz", "value_real", "value_imag"
+    )
+    freq, freq_bad = _coerce_float_array(freq_raw)
+    real, real_bad = _coerce_float_array(real_raw)
+    imag, imag_bad = _coerce_float_array(imag_raw)
+    missing = np.fromiter((f is None for f in freq_raw), dtype=bool, count=len(items))
+    bad = ~missing & (freq_bad | real_bad | imag_bad)
+    keep = np.flatnonzero(~(missing | bad)).tolist()
+    missing_ids = [str(items[idx].get("id")) for idx in np.flatnonzero(missing)]
+    bad_ids = [str(items[idx].get("id")) for idx in np.flatnonzero(bad)]
+
+    # Missing components stay None rather than NaN
+    freq_list, real_list, imag_list = freq.tolist(), real.tolist(), imag.tolist()
+    freq_map: Dict[float, Dict[str, Optional[float]]] = {
+        freq_list[idx]: {
+            "real": None if real_raw[idx] is None else real_list[idx],
+            "imag": None if imag_raw[idx] is None else imag_list[idx],
+        }
+        for idx in keep
+    }
+
+    # One summary warning per category instead of one per item
+    if missing_ids:
+        warnings.warn(
+            f"MeasurementItem id={', '.join(missing_ids)} missing frequency_hz; skipping",
+            UserWarning,
+            stacklevel=3,
+        )
+    if bad_ids:
+        warnings.warn(
+            f"Could not convert real/imag for item {', '.join(bad_ids)}; skipping",
+            UserWarning,
+            stacklevel=3,
+        )
+    return freq_map
 
 
 def real_imag_over_frequency(
@@ -162,53 +309,156 @@ def real_imag_over_frequency(
         If database access fails.
     """
     single = isinstance(measurement_ids, int)
-    ids: List[int] = [measurement_ids] if single else list(measurement_ids)
-    all_results: Dict[int, Dict[float, Dict[str, Optional[float]]]] = {}
+    ids: List[int] = [measurement_ids] if single else list(dict.fromkeys(measurement_ids))
 
-    for mid in ids:
-        try:
-            items, _ = read_items_by(
-                measurement_id=mid, measurement_type="earthing_impedance"
+    # One query for all IDs; items are grouped by measurement in Python
+    try:
+        if single:
+            fetched, _ = read_items_by(
+                measurement_id=ids[0], measurement_type="earthing_impedance"
             )
-        except Exception as e:
-            logger.error("Error reading impedance items for measurement %s: %s", mid, e)
-            raise RuntimeError(
-                f"Failed to load impedance data for measurement {mid}"
-            ) from e
-
-        if not items:
-            warnings.warn(
-                f"No earthing_impedance measurements found for measurement_id={mid}",
-                UserWarning,
+        else:
+            fetched, _ = read_items_by(
+                measurement_id__in=ids, measurement_type="earthing_impedance"
             )
-            all_results[mid] = {}
-            continue
+    except Exception as e:
+        mids = ids[0] if single else ids
+        logger.error("Error reading impedance items for measurement %s: %s", mids, e)
+        raise RuntimeError(
+            f"Failed to load impedance data for measurement {mids}"
+        ) from e
 
-        freq_map: Dict[float, Dict[str, Optional[float]]] = {}
-        for item in items:
-            freq = item.get("frequency_hz")
-            r = item.get("value_real")
-            i = item.get("value_imag")
-            if freq is None:
-                warnings.warn(
-                    f"MeasurementItem id={item.get('id')} missing frequency_hz; skipping",
-                    UserWarning,
-                )
-                continue
-            try:
-                freq_map[float(freq)] = {
-                    "real": float(r) if r is not None else None,
-                    "imag": float(i) if i is not None else None,
-                }
-            except Exception:
-                warnings.warn(
-                    f"Could not convert real/imag for item {item.get('id')}; skipping",
-                    UserWarning,
-                )
+    if single:
+        return _real_imag_map(ids[0], fetched)
+    items_by_id = _group_by_measurement(fetched)
+    result: Dict[int, Dict[float, Dict[str, Optional[float]]]] = {}
+    for mid in ids:
+        result[mid] = _real_imag_map(mid, items_by_id.get(mid, []))
+    return result
 
-        all_results[mid] = freq_map
 
-    return all_results[ids[0]] if single else all_results
+# --- Distance-profile reduction algorithms -----------------------------------
+# Each takes the deduplicated, distance-sorted profile plus its column arrays
+# and returns ``(value, distance_m, details)``.
+
+_ProfileResult = Tuple[float, float, Dict[str, Any]]
+
+
+def _profile_maximum(
+    points: List[Dict[str, Any]],
+    distances: np.ndarray,
+    values: np.ndarray,
+    **_: Any,
+) -> _ProfileResult:
+    best = points[int(np.argmax(values))]
+    return best["value"], best["distance_m"], {"point": best}
+
+
+def _profile_62_percent(
+    points: List[Dict[str, Any]],
+    distances: np.ndarray,
+    values: np.ndarray,
+    *,
+    injection_distance: Optional[float],
+    **_: Any,
+) -> _ProfileResult:
+    if injection_distance is None:
+        raise ValueError(
+            "distance_to_current_injection_m is required for the 62_percent algorithm"
+        )
+    target = 0.62 * float(injection_distance)
+    # Three nearest points (stable on ties), back in distance order; the
+    # profile is sorted with unique distances after deduplication
+    nearest = np.sort(np.argsort(np.abs(distances - target), kind="stable")[:3])
+    if len(nearest) < 2:
+        raise ValueError(
+            "Need at least two unique distances for 62_percent interpolation"
+        )
+    ordered = [points[i] for i in nearest]
+    interpolated = float(np.interp(target, distances[nearest], values[nearest]))
+    return interpolated, target, {
+        "target_distance_m": target,
+        "used_points": ordered,
+    }
+
+
+def _profile_minimum_gradient(
+    points: List[Dict[str, Any]],
+    distances: np.ndarray,
+    values: np.ndarray,
+    **_: Any,
+) -> _ProfileResult:
+    if len(points) < 2:
+        raise ValueError("minimum_gradient requires at least two points")
+    gradients = np.gradient(values, distances)
+    idx = int(np.argmin(np.abs(gradients)))
+    return points[idx]["value"], points[idx]["distance_m"], {
+        "distance_m": points[idx]["distance_m"],
+        "gradient": float(gradients[idx]),
+    }
+
+
+def _profile_minimum_stddev(
+    points: List[Dict[str, Any]],
+    distances: np.ndarray,
+    values: np.ndarray,
+    *,
+    window: int,
+    **_: Any,
+) -> _ProfileResult:
+    if window < 2:
+        raise ValueError("window must be >= 2 for minimum_stddev")
+    if len(points) < window:
+        raise ValueError(
+            f"minimum_stddev requires at least {window} points; have {len(points)}"
+        )
+    # One row per window; argmin keeps the first window on ties
+    windows = np.lib.stride_tricks.sliding_window_view(values, window)
+    stds = windows.std(axis=1)
+    start = int(np.argmin(stds))
+    best_std = float(stds[start])
+    best_window = points[start : start + window]
+    # First maximum within the chosen window, as max() picked before
+    peak = best_window[int(np.argmax(windows[start]))]
+    return peak["value"], peak["distance_m"], {
+        "window_size": window,
+        "stddev": best_std,
+        "window_points": best_window,
+    }
+
+
+def _profile_inverse(
+    points: List[Dict[str, Any]],
+    distances: np.ndarray,
+    values: np.ndarray,
+    **_: Any,
+) -> _ProfileResult:
+    if len(points) < 2:
+        raise ValueError("inverse algorithm requires at least two points")
+    if np.any(distances == 0) or np.any(values == 0):
+        raise ValueError("Distances and values must be non-zero for inverse algorithm")
+    x = 1.0 / distances
+    y = 1.0 / values
+    # Closed-form straight-line fit on centred data (what polyfit(x, y, 1) solves)
+    x_c = x - x.mean()
+    sxx = float(x_c @ x_c)
+    if sxx == 0:
+        raise ValueError("inverse algorithm requires at least two distinct distances")
+    slope = float(x_c @ (y - y.mean())) / sxx
+    intercept = float(y.mean() - slope * x.mean())
+    if intercept == 0:
+        raise ValueError("Inverse fit produced zero intercept; cannot compute limit")
+    limit_value = 1.0 / intercept
+    return limit_value, float("inf"), {"slope": slope, "intercept": intercept}
+
+
+_PROFILE_ALGORITHMS: Dict[str, Callable[..., _ProfileResult]] = {
+    "maximum": _profile_maximum,
+    "62_percent": _profile_62_percent,
+    "minimum_gradient": _profile_minimum_gradient,
+    "minimum_stddev": _profile_minimum_stddev,
+    "inverse": _profile_inverse,
+}
 
 
 def distance_profile_value(
@@ -249,6 +499,12 @@ def distance_profile_value(
     ValueError
         On missing data or unsupported algorithm.
     """
+    algo_key = algorithm.lower().strip().replace(" ", "_").replace("-", "_")
+    if algo_key == "62%":
+        algo_key = "62_percent"
+    if algo_key not in _PROFILE_ALGORITHMS:
+        raise ValueError(f"Unsupported algorithm '{algorithm}'")
+
     try:
         items, _ = read_items_by(
             measurement_id=measurement_id, measurement_type=measurement_type
@@ -268,14 +524,14 @@ def distance_profile_value(
     injection_candidates: List[float] = []
     units: List[str] = []
 
+    missing_ids: List[str] = []
+    bad_inj_ids: List[str] = []
+    bad_ids: List[str] = []
     for item in items:
         dist = item.get("measurement_distance_m")
         val = item.get("value")
         if dist is None or val is None:
-            warnings.warn(
-                f"MeasurementItem id={item.get('id')} missing distance or value; skipping",
-                UserWarning,
-            )
+            missing_ids.append(str(item.get("id")))
             continue
 
         inj = item.get("distance_to_current_injection_m")
@@ -283,10 +539,7 @@ def distance_profile_value(
             try:
                 injection_candidates.append(float(inj))
             except Exception:
-                warnings.warn(
-                    f"MeasurementItem id={item.get('id')} has invalid distance_to_current_injection_m; skipping that field",
-                    UserWarning,
-                )
+                bad_inj_ids.append(str(item.get("id")))
 
         if item.get("unit"):
             units.append(str(item.get("unit")))
@@ -303,26 +556,49 @@ def distance_profile_value(
                 "description": item.get("description"),
             }
         except Exception:
-            warnings.warn(
-                f"Could not convert MeasurementItem id={item.get('id')} to floats; skipping",
-                UserWarning,
-            )
+            bad_ids.append(str(item.get("id")))
             continue
         points.append(point)
 
+    # One summary warning per category instead of one per item
+    if missing_ids:
+        warnings.warn(
+            f"MeasurementItem id={', '.join(missing_ids)} missing distance or value; skipping",
+            UserWarning,
+            stacklevel=2,
+        )
+    if bad_inj_ids:
+        warnings.warn(
+            f"MeasurementItem id={', '.join(bad_inj_ids)} has invalid distance_to_current_injection_m; skipping that field",
+            UserWarning,
+            stacklevel=2,
+        )
+    if bad_ids:
+        warnings.warn(
+            f"Could not convert MeasurementItem id={', '.join(bad_ids)} to floats; skipping",
+            UserWarning,
+            stacklevel=2,
+        )
+
     if not points:
         raise ValueError(
             f"No {measurement_type} items with distance/value found for measurement {measurement_id}"
         )
 
-    points.sort(key=lambda p: p["distance_m"])
+    # Profiles are usually stored in distance order; only sort when they are not
+    raw_distances = np.fromiter(
+        (p["distance_m"] for p in points), dtype=float, count=len(points)
+    )
+    if not (raw_distances[1:] >= raw_distances[:-1]).all():
+        points = [points[i] for i in np.argsort(raw_distances, kind="stable")]
 
     def _dedupe_by_interpolation(raw_points: List[Dict[str, Any]]) -> List[Dict[str, Any]]:
         """For duplicate distances, keep the point closest to linear interpolation."""
         by_dist: Dict[float, List[Dict[str, Any]]] = {}
         for p in raw_points:
             by_dist.setdefault(p["distance_m"], []).append(p)
-        distances = sorted(by_dist.keys())
+        # Input is sorted, so insertion order is already ascending
+        distances = list(by_dist)
 
         def _mean_val(d: float) -> float:
             vals = [pp["value"] for pp in by_dist[d] if pp.get("value") is not None]
@@ -364,10 +640,13 @@ def distance_profile_value(
             best = min(group, key=lambda p: abs(p["value"] - expected))
             selected.append(best)
 
-        selected.sort(key=lambda p: p["distance_m"])
+        # Built in ascending distance order already
         return selected
 
     points = _dedupe_by_interpolation(points)
+    # Column views of the profile, shared by the array-based algorithms
+    distances_arr = np.fromiter((p["distance_m"] for p in points), dtype=float, count=len(points))
+    values_arr = np.fromiter((p["value"] for p in points), dtype=float, count=len(points))
 
     # Determine a consistent injection distance if provided
     injection_distance = None
@@ -378,112 +657,23 @@ def distance_profile_value(
             warnings.warn(
                 "distance_to_current_injection_m is not consistent across items; using the first value",
                 UserWarning,
+                stacklevel=2,
             )
 
-    def _algo_maximum() -> Tuple[float, float, Dict[str, Any]]:
-        best = max(points, key=lambda p: p["value"])
-        return best["value"], best["distance_m"], {"point": best}
-
-    def _algo_62_percent() -> Tuple[float, float, Dict[str, Any]]:
-        if injection_distance is None:
-            raise ValueError(
-                "distance_to_current_injection_m is required for the 62_percent algorithm"
-            )
-        target = 0.62 * float(injection_distance)
-        nearest = sorted(points, key=lambda p: abs(p["distance_m"] - target))[:3]
-        # ensure strictly increasing x for np.interp
-        ordered = []
-        seen: set[float] = set()
-        for p in sorted(nearest, key=lambda p: p["distance_m"]):
-            if p["distance_m"] in seen:
-                continue
-            seen.add(p["distance_m"])
-            ordered.append(p)
-        if len(ordered) < 2:
-            raise ValueError(
-                "Need at least two unique distances for 62_percent interpolation"
-            )
-        xs = [p["distance_m"] for p in ordered]
-        ys = [p["value"] for p in ordered]
-        interpolated = float(np.interp(target, xs, ys))
-        return interpolated, target, {
-            "target_distance_m": target,
-            "used_points": ordered,
-        }
-
-    def _algo_minimum_gradient() -> Tuple[float, float, Dict[str, Any]]:
-        if len(points) < 2:
-            raise ValueError("minimum_gradient requires at least two points")
-        distances = np.array([p["distance_m"] for p in points], dtype=float)
-        values = np.array([p["value"] for p in points], dtype=float)
-        gradients = np.gradient(values, distances)
-        idx = int(np.argmin(np.abs(gradients)))
-        return points[idx]["value"], points[idx]["distance_m"], {
-            "distance_m": points[idx]["distance_m"],
-            "gradient": float(gradients[idx]),
-        }
-
-    def _algo_minimum_stddev() -> Tuple[float, float, Dict[str, Any]]:
-        if window < 2:
-            raise ValueError("window must be >= 2 for minimum_stddev")
-        if len(points) < window:
-            raise ValueError(
-                f"minimum_stddev requires at least {window} points; have {len(points)}"
-            )
-        best_std = float("inf")
-        best_window: List[Dict[str, Any]] | None = None
-        for start in range(0, len(points) - window + 1):
-            segment = points[start : start + window]
-            vals = [p["value"] for p in segment]
-            std = float(np.std(vals))
-            if std < best_std:
-                best_std = std
-                best_window = segment
-        assert best_window is not None
-        peak = max(best_window, key=lambda p: p["value"])
-        return peak["value"], peak["distance_m"], {
-            "window_size": window,
-            "stddev": best_std,
-            "window_points": best_window,
-        }
-
-    def _algo_inverse() -> Tuple[float, float, Dict[str, Any]]:
-        if len(points) < 2:
-            raise ValueError("inverse algorithm requires at least two points")
-        distances = np.array([p["distance_m"] for p in points], dtype=float)
-        values = np.array([p["value"] for p in points], dtype=float)
-        if np.any(distances == 0) or np.any(values == 0):
-            raise ValueError("Distances and values must be non-zero for inverse algorithm")
-        x = 1.0 / distances
-        y = 1.0 / values
-        coeffs = np.polyfit(x, y, 1)
-        slope, intercept = float(coeffs[0]), float(coeffs[1])
-        if intercept == 0:
-            raise ValueError("Inverse fit produced zero intercept; cannot compute limit")
-        limit_value = 1.0 / intercept
-        return limit_value, float("inf"), {"slope": slope, "intercept": intercept}
-
-    algo_key = algorithm.lower().strip().replace(" ", "_").replace("-", "_")
-    if algo_key == "62%":
-        algo_key = "62_percent"
-    algo_map: Dict[str, Callable[[], Tuple[float, float, Dict[str, Any]]]] = {
-        "maximum": _algo_maximum,
-        "62_percent": _algo_62_percent,
-        "minimum_gradient": _algo_minimum_gradient,
-        "minimum_stddev": _algo_minimum_stddev,
-        "inverse": _algo_inverse,
-    }
-
-    if algo_key not in algo_map:
-        raise ValueError(f"Unsupported algorithm '{algorithm}'")
-
-    result_value, result_distance, details = algo_map[algo_key]()
+    result_value, result_distance, details = _PROFILE_ALGORITHMS[algo_key](
+        points,
+        distances_arr,
+        values_arr,
+        injection_distance=injection_distance,
+        window=window,
+    )
 
     unit = units[0] if units else None
     if units and len(set(units)) > 1:
         warnings.warn(
             "Mixed units across items; using the first one for output",
             UserWarning,
+            stacklevel=2,
         )
 
     return {
@@ -557,12 +747,11 @@ def _design_inverse_fir(
     c_max = int(js.max() + ks.max())
     cs = np.arange(c_min, c_max + 1, dtype=int)
 
+    # Convolution matrix: C[c - c_min, k - k_min] = a_{c - k}, one diagonal per tap
     C = np.zeros((len(cs), len(ks)), dtype=float)
-    for p, c_idx in enumerate(cs):
-        for r, k_idx in enumerate(ks):
-            j_needed = c_idx - k_idx
-            if j_needed in direct_coeffs:
-                C[p, r] = direct_coeffs[j_needed]
+    cols = np.arange(len(ks))
+    for j, aj in direct_coeffs.items():
+        C[j + ks - c_min, cols] = aj
 
     d = np.zeros(len(cs), dtype=float)
     d[int(0 - c_min)] = 1.0
@@ -574,7 +763,7 @@ def _design_inverse_fir(
         D2[i, i + 2] = 1.0
 
     A = np.vstack([C, np.sqrt(reg) * D2])
-    b = np.linalg.lstsq(A, np.r_[d, np.zeros(D2.shape[0])], rcond=None)[0]
+    b = _lstsq(A, np.r_[d, np.zeros(D2.shape[0])], rcond=None)[0]
     return {int(k): float(b[i]) for i, k in enumerate(ks)}
 
 
@@ -602,12 +791,12 @@ def _apply_filter(values: np.ndarray, coeffs: Dict[int, float]) -> np.ndarray:
 
     vp = _loglog_extrapolate(values, n_left=pad_left, n_right=pad_right)
 
-    out = np.zeros_like(values, dtype=float)
-    for m in range(len(values)):
-        acc = 0.0
-        for j, aj in coeffs.items():
-            acc += aj * vp[pad_left + m - j]
-        out[m] = acc
+    # out[m] = sum_j a_j * vp[pad_left + m - j], accumulated one tap at a time
+    n = len(values)
+    out = np.zeros(n, dtype=float)
+    for j, aj in coeffs.items():
+        start = pad_left - j
+        out += aj * vp[start : start + n]
     return out
 
 
@@ -945,15 +1134,23 @@ def soil_resistivity_profile_detailed(
         raise ValueError(f"No soil_resistivity data for measurement {measurement_id}")
 
     raw_points: List[Dict[str, Any]] = []
+    mn_effective: List[float] = []
+    # Skip reason -> item ids, reported as one warning per reason after the loop
+    skipped: Dict[str, List[str]] = {}
+
+    def _skip(item: Dict[str, Any], reason: str) -> None:
+        skipped.setdefault(reason, []).append(str(item.get("id")))
+
+    # Loop invariants, resolved once instead of per item
+    is_schlumberger = method_key == "schlumberger"
+    halve_ab = is_schlumberger and ab_is_full
+    auto_kind = kind == "auto"
 
     for item in items:
         spacing = item.get("measurement_distance_m")
         raw_value = item.get("value")
         if spacing is None or raw_value is None:
-            warnings.warn(
-                f"MeasurementItem id={item.get('id')} missing spacing or value; skipping",
-                UserWarning,
-            )
+            _skip(item, "missing spacing or value; skipping")
             continue
 
         try:
@@ -961,24 +1158,18 @@ def soil_resistivity_profile_detailed(
             if spacing_m <= 0:
                 raise ValueError("non-positive spacing")
         except Exception:
-            warnings.warn(
-                f"MeasurementItem id={item.get('id')} has invalid spacing; skipping",
-                UserWarning,
-            )
+            _skip(item, "has invalid spacing; skipping")
             continue
 
         try:
             value = float(raw_value)
         except Exception:
-            warnings.warn(
-                f"MeasurementItem id={item.get('id')} has invalid value; skipping",
-                UserWarning,
-            )
+            _skip(item, "has invalid value; skipping")
             continue
 
         unit = item.get("unit")
         local_kind = kind
-        if kind == "auto":
+        if auto_kind:
             local_kind = "resistivity"
             if unit:
                 unit_text = str(unit)
@@ -988,13 +1179,11 @@ def soil_resistivity_profile_detailed(
             else:
                 local_kind = "resistance"
 
-        effective_spacing_m = spacing_m
-        if method_key == "schlumberger" and ab_is_full:
-            effective_spacing_m = spacing_m / 2.0
+        effective_spacing_m = spacing_m / 2.0 if halve_ab else spacing_m
 
         mn_m = None
         mn_effective_m = None
-        if method_key == "schlumberger":
+        if is_schlumberger:
             mn_raw = item.get("distance_to_current_injection_m")
             if mn_raw is not None:
                 try:
@@ -1003,52 +1192,30 @@ def soil_resistivity_profile_detailed(
                         raise ValueError("non-positive MN")
                 except Exception:
                     if local_kind == "resistance":
-                        warnings.warn(
-                            f"MeasurementItem id={item.get('id')} has invalid MN spacing; skipping",
-                            UserWarning,
-                        )
+                        _skip(item, "has invalid MN spacing; skipping")
                     mn_m = None
                 else:
                     mn_effective_m = mn_m / 2.0 if mn_is_full else mn_m
                     if mn_effective_m <= 0:
                         if local_kind == "resistance":
-                            warnings.warn(
-                                f"MeasurementItem id={item.get('id')} has invalid MN spacing; skipping",
-                                UserWarning,
-                            )
+                            _skip(item, "has invalid MN spacing; skipping")
                         mn_m = None
                         mn_effective_m = None
-        rho_ohm_m = None
-        source = None
         if local_kind == "resistivity":
-            rho_ohm_m = value
             source = "direct"
+        elif not is_schlumberger:
+            source = "wenner"
         else:
-            if method_key == "wenner":
-                rho_ohm_m = 2.0 * math.pi * spacing_m * value
-                source = "wenner"
-            else:
-                if mn_effective_m is None:
-                    warnings.warn(
-                        f"MeasurementItem id={item.get('id')} missing MN spacing for Schlumberger; skipping",
-                        UserWarning,
-                    )
-                    continue
-                rho_ohm_m = (
-                    math.pi
-                    * ((effective_spacing_m ** 2 - mn_effective_m ** 2) / (2.0 * mn_effective_m))
-                    * value
-                )
-                source = "schlumberger"
-
-        if rho_ohm_m is None:
-            continue
+            if mn_effective_m is None:
+                _skip(item, "missing MN spacing for Schlumberger; skipping")
+                continue
+            source = "schlumberger"
 
         depth_m = effective_spacing_m * depth_factor_used
         raw_points.append(
             {
                 "depth_m": float(depth_m),
-                "rho_ohm_m": float(rho_ohm_m),
+                "rho_ohm_m": value,
                 "spacing_m": float(spacing_m),
                 "effective_spacing_m": float(effective_spacing_m),
                 "mn_m": None if mn_m is None else float(mn_m),
@@ -1062,6 +1229,36 @@ def soil_resistivity_profile_detailed(
                 "item_id": item.get("id"),
             }
         )
+        mn_effective.append(np.nan if mn_effective_m is None else mn_effective_m)
+
+    for reason, skipped_ids in skipped.items():
+        warnings.warn(
+            f"MeasurementItem id={', '.join(skipped_ids)} {reason}",
+            UserWarning,
+            stacklevel=2,
+        )
+
+    # Apparent resistivity for all points in one pass; "direct" keeps the value
+    if raw_points:
+        n_raw = len(raw_points)
+        sources_arr = np.array([p["source"] for p in raw_points])
+        spacing_arr = np.fromiter((p["spacing_m"] for p in raw_points), float, n_raw)
+        eff_arr = np.fromiter((p["effective_spacing_m"] for p in raw_points), float, n_raw)
+        value_arr = np.fromiter((p["rho_ohm_m"] for p in raw_points), float, n_raw)
+        mn_arr = np.asarray(mn_effective, dtype=float)
+        rho_arr = np.where(
+            sources_arr == "wenner",
+            2.0 * math.pi * spacing_arr * value_arr,
+            value_arr,
+        )
+        schl = sources_arr == "schlumberger"
+        if schl.any():
+            mn_s = mn_arr[schl]
+            rho_arr[schl] = (
+                math.pi * ((eff_arr[schl] ** 2 - mn_s ** 2) / (2.0 * mn_s)) * value_arr[schl]
+            )
+        for point, rho in zip(raw_points, rho_arr.tolist()):
+            point["rho_ohm_m"] = rho
 
     if not raw_points:
         raise ValueError(
@@ -1351,6 +1548,7 @@ def invert_layered_earth(
     ab_is_full: bool = True,
     mn_is_full: bool = True,
     backend: Literal["auto", "numpy", "mlx"] = "auto",
+    solver: Literal["gauss_newton", "scipy"] = "gauss_newton",
 ) -> Dict[str, Any]:
     """
     Invert a 1D layered model using a damped Gauss-Newton scheme in log space.
@@ -1392,14 +1590,26 @@ def invert_layered_earth(
         Interpret MN as full MN for Schlumberger.
     backend : {"auto", "numpy", "mlx"}, default "auto"
         Math backend for the transform.
+    solver : {"gauss_newton", "scipy"}, default "gauss_newton"
+        "gauss_newton" runs the built-in damped loop. "scipy" hands the same
+        log-space residuals to ``scipy.optimize.least_squares`` (MINPACK
+        Levenberg-Marquardt, or "trf" when there are fewer points than
+        parameters) with ``max_iter * (n_params + 1)`` evaluations; ``damping``,
+        ``step_max`` and ``tol`` only apply to "gauss_newton".
 
     Returns
     -------
     dict
         Contains fitted layers, thicknesses, predicted curve, and misfit stats.
+        ``misfit["iterations"]`` counts forward evaluations for ``solver="scipy"``.
     """
     if layers not in {1, 2, 3}:
         raise ValueError("layers must be 1, 2, or 3")
+    solver_key = solver.strip().lower()
+    if solver_key not in {"gauss_newton", "scipy"}:
+        raise ValueError("solver must be 'gauss_newton' or 'scipy'")
+    if solver_key == "scipy" and not _SCIPY_AVAILABLE:
+        raise RuntimeError("solver='scipy' requires scipy to be installed")
 
     spacings = np.asarray(spacings_m, dtype=float)
     rho_obs_arr = np.asarray(rho_obs, dtype=float)
@@ -1451,91 +1661,77 @@ def invert_layered_earth(
     n_params = m.size
     eps = 1e-3
     eps_pos = 1e-12
+    log_obs = np.log(rho_obs_arr)
+
+    def _forward(m_vec: np.ndarray) -> np.ndarray:
+        """Clipped forward response for log-space parameters ``m_vec``."""
+        pred = layered_earth_forward(
+            spacings,
+            np.exp(m_vec[:layers]),
+            thicknesses_m=list(np.exp(m_vec[layers:])) if layers > 1 else None,
+            method=method,
+            mn_m=None if mn_arr is None else mn_arr,
+            ab_is_full=ab_is_full,
+            mn_is_full=mn_is_full,
+            forward=forward,
+            dx=dx,
+            n_lam=n_lam,
+            backend=backend,
+        )
+        return np.clip(np.array(pred), eps_pos, np.inf)
 
     prev_rmse = None
     iteration = 0
-    for iteration in range(1, max_iter + 1):
-        rho_layers = np.exp(m[:layers])
-        thicknesses = np.exp(m[layers:]) if layers > 1 else []
-        rho_pred = np.array(
-            layered_earth_forward(
-                spacings,
-                rho_layers,
-                thicknesses_m=list(thicknesses) if layers > 1 else None,
-                method=method,
-                mn_m=None if mn_arr is None else mn_arr,
-                ab_is_full=ab_is_full,
-                mn_is_full=mn_is_full,
-                forward=forward,
-                dx=dx,
-                n_lam=n_lam,
-                backend=backend,
-            )
+    rho_pred = None
+    if solver_key == "scipy":
+        fit = _scipy_optimize.least_squares(
+            lambda m_vec: log_obs - np.log(_forward(m_vec)),
+            m,
+            method="lm" if spacings.size >= n_params else "trf",
+            diff_step=eps,
+            max_nfev=max_iter * (n_params + 1),
         )
-
-        rho_pred = np.clip(rho_pred, eps_pos, np.inf)
-        residual = np.log(rho_obs_arr) - np.log(rho_pred)
+        m = fit.x
+        iteration = int(fit.nfev)
+
+    # The built-in loop is skipped entirely when scipy did the fit
+    gn_iters = 0 if solver_key == "scipy" else max_iter
+    for iteration in range(1, gn_iters + 1):
+        rho_pred = _forward(m)
+        log_pred = np.log(rho_pred)
+        residual = log_obs - log_pred
         rmse = float(np.sqrt(np.mean(residual ** 2)))
         if prev_rmse is not None and abs(prev_rmse - rmse) < tol:
             break
         prev_rmse = rmse
 
+        # One-sided differences: P extra forward calls around the shared baseline
         J = np.zeros((spacings.size, n_params), dtype=float)
         for idx in range(n_params):
             m_pert = m.copy()
             m_pert[idx] += eps
-            rho_layers_p = np.exp(m_pert[:layers])
-            thicknesses_p = np.exp(m_pert[layers:]) if layers > 1 else []
-            rho_pred_p = np.array(
-                layered_earth_forward(
-                    spacings,
-                    rho_layers_p,
-                    thicknesses_m=list(thicknesses_p) if layers > 1 else None,
-                    method=method,
-                    mn_m=None if mn_arr is None else mn_arr,
-                    ab_is_full=ab_is_full,
-                    mn_is_full=mn_is_full,
-                    forward=forward,
-                    dx=dx,
-                    n_lam=n_lam,
-                    backend=backend,
-                )
-            )
-            rho_pred_p = np.clip(rho_pred_p, eps_pos, np.inf)
-            J[:, idx] = (np.log(rho_pred_p) - np.log(rho_pred)) / eps
+            J[:, idx] = (np.log(_forward(m_pert)) - log_pred) / eps
 
         lhs = J.T @ J + (damping ** 2) * np.eye(n_params)
         rhs = J.T @ residual
         try:
             delta = np.linalg.solve(lhs, rhs)
         except np.linalg.LinAlgError:
-            delta, *_ = np.linalg.lstsq(lhs, rhs, rcond=None)
+            delta, *_ = _lstsq(lhs, rhs, rcond=None)
 
         max_step = np.max(np.abs(delta)) if delta.size else 0.0
         if max_step > step_max:
             delta = delta * (step_max / max_step)
 
         m = m + delta
+        rho_pred = None
 
     rho_layers = np.exp(m[:layers])
     thicknesses = np.exp(m[layers:]) if layers > 1 else []
-    rho_pred = np.array(
-        layered_earth_forward(
-            spacings,
-            rho_layers,
-            thicknesses_m=list(thicknesses) if layers > 1 else None,
-            method=method,
-            mn_m=None if mn_arr is None else mn_arr,
-            ab_is_full=ab_is_full,
-            mn_is_full=mn_is_full,
-            forward=forward,
-            dx=dx,
-            n_lam=n_lam,
-            backend=backend,
-        )
-    )
+    # On convergence the last prediction already belongs to the final model
+    if rho_pred is None:
+        rho_pred = _forward(m)
 
-    rho_pred = np.clip(rho_pred, eps_pos, np.inf)
     residual = np.log(rho_obs_arr) - np.log(rho_pred)
     misfit = {
         "rmse_log": float(np.sqrt(np.mean(residual ** 2))),
@@ -1643,6 +1839,7 @@ def invert_soil_resistivity_layers(
                     warnings.warn(
                         "Some MN values are missing; MN will be ignored for forward modeling.",
                         UserWarning,
+                        stacklevel=2,
                     )
 
         if forward == "integral" and mn_values is None:
@@ -1675,6 +1872,82 @@ def invert_soil_resistivity_layers(
     return result
 
 
+_NORMAL_EQ_MAX_COND = 1e10
+
+
+def _solve_small_lstsq(A: np.ndarray, y: np.ndarray) -> np.ndarray:
+    """
+    Least-squares solve for a tall matrix with a handful of columns.
+
+    Uses the column-scaled normal equations (a tiny ``solve`` instead of an
+    SVD of the full design); falls back to ``lstsq`` when the system
+    is underdetermined, ill-conditioned, or the solution is not finite.
+    """
+    n_rows, n_cols = A.shape
+    if n_rows >= n_cols:
+        scale = np.linalg.norm(A, axis=0)
+        if np.all(scale > 0):
+            As = A / scale
+            gram = As.T @ As
+            # Near rank-deficient designs (e.g. one rho) need lstsq's min-norm answer
+            if np.linalg.cond(gram) < _NORMAL_EQ_MAX_COND:
+                k = np.linalg.solve(gram, As.T @ y) / scale
+                if np.all(np.isfinite(k)):
+                    return k
+    k, *_ = _lstsq(A, y, rcond=None)
+    return k
+
+
+def _assemble_rho_f_system(
+    samples: Tuple[Tuple[float, float, float, float], ...],
+) -> Tuple[np.ndarray, np.ndarray, np.ndarray, np.ndarray]:
+    """Build the rho–f design matrices from ``(rho, f, R, X)`` samples."""
+    # Stream the flat samples straight into one float64 buffer
+    flat = np.fromiter(
+        itertools.chain.from_iterable(samples), dtype=float, count=4 * len(samples)
+    )
+    rho, f, R_vec, X_vec = flat.reshape(-1, 4).T
+    rho_f = rho * f
+    A_R = np.column_stack((rho, f, rho_f))
+    A_X = np.column_stack((f, rho_f))
+    return A_R, np.ascontiguousarray(R_vec), A_X, np.ascontiguousarray(X_vec)
+
+
+@functools.lru_cache(maxsize=128)
+def _select_rho_depths(
+    depth_choices: Tuple[Tuple[float, ...], ...],
+) -> Tuple[float, ...]:
+    """
+    Pick one depth per measurement so the chosen depths have minimal spread.
+
+    Memoized on the per-measurement depth tuples (the soil data fingerprint),
+    so repeated fits of the same measurements skip the product search.
+    """
+    best_combo: Tuple[float, ...] = ()
+    best_spread = float("inf")
+    for combo in itertools.product(*depth_choices):
+        spread = max(combo) - min(combo)
+        if spread < best_spread:
+            best_spread, best_combo = spread, combo
+    return best_combo
+
+
+@functools.lru_cache(maxsize=128)
+def _fit_rho_f(
+    samples: Tuple[Tuple[float, float, float, float], ...],
+) -> Tuple[float, float, float, float, float]:
+    """
+    Solve the rho–f least-squares problems for ``(rho, f, R, X)`` samples.
+
+    Memoized on the sample tuple, which already carries the selected soil
+    resistivities, so re-fitting unchanged data is a dictionary lookup.
+    """
+    A_R, R_vec, A_X, X_vec = _assemble_rho_f_system(samples)
+    k1, k2, k4 = _solve_small_lstsq(A_R, R_vec)
+    k3, k5 = _solve_small_lstsq(A_X, X_vec)
+    return float(k1), float(k2), float(k3), float(k4), float(k5)
+
+
 def rho_f_model(
     measurement_ids: List[int],
 ) -> Tuple[float, float, float, float, float]:
@@ -1709,19 +1982,23 @@ def rho_f_model(
 
     # 2) Gather available depths → ρ
     rho_map: Dict[int, Dict[float, float]] = {}
-    depth_choices: List[List[float]] = []
+    depth_choices: List[Tuple[float, ...]] = []
 
-    for mid in measurement_ids:
-        try:
-            items, _ = read_items_by(
-                measurement_id=mid, measurement_type="soil_resistivity"
-            )
-        except Exception as e:
-            logger.error("Error reading soil_resistivity for %s: %s", mid, e)
-            raise RuntimeError(
-                f"Failed to load soil_resistivity for measurement {mid}"
-            ) from e
+    # One query for all IDs; soil items are grouped by measurement in Python
+    try:
+        soil_items, _ = read_items_by(
+            measurement_id__in=list(measurement_ids), measurement_type="soil_resistivity"
+        )
+    except Exception as e:
+        logger.error("Error reading soil_resistivity for %s: %s", measurement_ids, e)
+        raise RuntimeError(
+            f"Failed to load soil_resistivity for measurement {measurement_ids}"
+        ) from e
+
+    soil_by_id = _group_by_measurement(soil_items)
 
+    for mid in measurement_ids:
+        items = soil_by_id.get(mid, [])
         dt = {
             float(it["measurement_distance_m"]): float(it["value"])
             for it in items
@@ -1731,53 +2008,41 @@ def rho_f_model(
         if not dt:
             raise ValueError(f"No soil_resistivity data for measurement {mid}")
         rho_map[mid] = dt
-        depth_choices.append(list(dt.keys()))
+        depth_choices.append(tuple(dt))
 
     # 3) Select depths minimizing spread
-    best_combo, best_spread = None, float("inf")
-    for combo in itertools.product(*depth_choices):
-        spread = max(combo) - min(combo)
-        if spread < best_spread:
-            best_spread, best_combo = spread, combo
+    best_combo = _select_rho_depths(tuple(depth_choices))
 
     selected_rhos = {
         mid: rho_map[mid][depth] for mid, depth in zip(measurement_ids, best_combo)
     }
 
     # 4) Assemble design matrices & response vectors
-    A_R, yR, A_X, yX = [], [], [], []
-
-    for mid in measurement_ids:
-        rho = selected_rhos[mid]
-        for f, comp in rimap.get(mid, {}).items():
-            R = comp.get("real")
-            X = comp.get("imag")
-            if R is None or X is None:
-                continue
-            A_R.append([rho, f, rho * f])
-            yR.append(R)
-            A_X.append([f, rho * f])
-            yX.append(X)
-
-    if not A_R:
+    # Only measurements present in both data sets can contribute samples
+    overlap = selected_rhos.keys() & rimap.keys()
+    samples = tuple(
+        (selected_rhos[mid], f, comp["real"], comp["imag"])
+        for mid in measurement_ids
+        if mid in overlap
+        for f, comp in rimap[mid].items()
+        if comp.get("real") is not None and comp.get("imag") is not None
+    )
+    if not samples:
         raise ValueError("No overlapping impedance data available for fitting")
 
     try:
-        A_R = np.vstack(A_R)
-        A_X = np.vstack(A_X)
-        R_vec = np.asarray(yR)
-        X_vec = np.asarray(yX)
-
-        kR, *_ = np.linalg.lstsq(A_R, R_vec, rcond=None)  # [k1, k2, k4]
-        kX, *_ = np.linalg.lstsq(A_X, X_vec, rcond=None)  # [k3, k5]
+        return _fit_rho_f(samples)
     except Exception as e:
         logger.error("Least-squares solve failed: %s", e)
         raise RuntimeError("Failed to solve rho-f least-squares problem") from e
 
-    k1, k2, k4 = kR
-    k3, k5 = kX
 
-    return float(k1), float(k2), float(k3), float(k4), float(k5)
+_VT_EPR_TYPES = (
+    "earthing_impedance",
+    "earthing_current",
+    "prospective_touch_voltage",
+    "touch_voltage",
+)
 
 
 def voltage_vt_epr(
@@ -1804,39 +2069,48 @@ def voltage_vt_epr(
         If multiple IDs: nested dict keyed by measurement_id.
     """
     single = isinstance(measurement_ids, int)
-    ids = [measurement_ids] if single else list(measurement_ids)
+    ids = [measurement_ids] if single else list(dict.fromkeys(measurement_ids))
     results: Dict[int, Dict[str, float]] = {}
 
+    # One query for all IDs and item types; partitioned per (measurement, type).
+    # A failed read leaves every measurement without data, so each is warned
+    # about and skipped below, as with per-measurement reads.
+    try:
+        fetched, _ = read_items_by(
+            measurement_id__in=ids,
+            measurement_type__in=list(_VT_EPR_TYPES),
+            frequency_hz=frequency,
+        )
+    except Exception as e:
+        logger.error("Error reading voltage items for measurement %s: %s", ids, e)
+        fetched = []
+
+    by_key: Dict[Tuple[Any, Any], List[Dict[str, Any]]] = defaultdict(list)
+    for item in fetched:
+        by_key[(item.get("measurement_id"), item.get("measurement_type"))].append(item)
+
     for mid in ids:
         # 1) Mandatory: impedance Z (V/A) at this frequency
         try:
-            imp_items, _ = read_items_by(
-                measurement_id=mid,
-                measurement_type="earthing_impedance",
-                frequency_hz=frequency,
-            )
-            Z = float(imp_items[0]["value"])
+            Z = float(by_key[(mid, "earthing_impedance")][0]["value"])
         except Exception:
             warnings.warn(
                 f"Measurement {mid}: missing earthing_impedance@{frequency}Hz → skipping",
                 UserWarning,
+                stacklevel=2,
             )
             continue
 
         # 2) Mandatory: current I (A) at this frequency
         try:
-            cur_items, _ = read_items_by(
-                measurement_id=mid,
-                measurement_type="earthing_current",
-                frequency_hz=frequency,
-            )
-            I = float(cur_items[0]["value"])
+            I = float(by_key[(mid, "earthing_current")][0]["value"])
             if I == 0:
                 raise ValueError("zero current")
         except Exception:
             warnings.warn(
                 f"Measurement {mid}: missing or zero earthing_current@{frequency}Hz → skipping",
                 UserWarning,
+                stacklevel=2,
             )
             continue
 
@@ -1847,34 +2121,29 @@ def voltage_vt_epr(
 
         # 4) Optional: prospective touch voltage (V/A)
         try:
-            vtp_items, _ = read_items_by(
-                measurement_id=mid,
-                measurement_type="prospective_touch_voltage",
-                frequency_hz=frequency,
-            )
-            vtp_vals = [float(it["value"]) / I for it in vtp_items]
+            vtp_vals = [
+                float(it["value"]) / I
+                for it in by_key[(mid, "prospective_touch_voltage")]
+            ]
             entry["vtp_min"] = min(vtp_vals)
             entry["vtp_max"] = max(vtp_vals)
         except Exception:
             warnings.warn(
                 f"Measurement {mid}: no prospective_touch_voltage@{frequency}Hz",
                 UserWarning,
+                stacklevel=2,
             )
 
         # 5) Optional: actual touch voltage (V/A)
         try:
-            vt_items, _ = read_items_by(
-                measurement_id=mid,
-                measurement_type="touch_voltage",
-                frequency_hz=frequency,
-            )
-            vt_vals = [float(it["value"]) / I for it in vt_items]
+            vt_vals = [float(it["value"]) / I for it in by_key[(mid, "touch_voltage")]]
             entry["vt_min"] = min(vt_vals)
             entry["vt_max"] = max(vt_vals)
         except Exception:
             warnings.warn(
                 f"Measurement {mid}: no touch_voltage@{frequency}Hz",
                 UserWarning,
+                stacklevel=2,
             )
 
         results[mid] = entry
@@ -1915,6 +2184,43 @@ def _current_item_to_complex(item: Dict[str, Any]) -> complex:
     )
 
 
+def _current_items_to_complex_array(items: Sequence[Dict[str, Any]]) -> np.ndarray:
+    """
+    Vectorized counterpart of ``_current_item_to_complex`` for many items.
+
+    Rows with a real or imaginary part use the rectangular form (missing parts
+    count as 0); the rest use magnitude/angle with a missing angle taken as 0.
+    """
+    n = len(items)
+    real_raw, imag_raw, mag_raw, angle_raw = _item_fields(
+        items, "value_real", "value_imag", "value", "value_angle_deg"
+    )
+    real, real_bad = _coerce_float_array(real_raw)
+    imag, imag_bad = _coerce_float_array(imag_raw)
+    mag, mag_bad = _coerce_float_array(mag_raw)
+    angle, angle_bad = _coerce_float_array(angle_raw)
+    rect = np.fromiter(
+        (r is not None or i is not None for r, i in zip(real_raw, imag_raw)),
+        dtype=bool,
+        count=n,
+    )
+    polar = ~rect
+    missing = polar & np.fromiter((m is None for m in mag_raw), dtype=bool, count=n)
+    invalid = (rect & (real_bad | imag_bad)) | (polar & ~missing & (mag_bad | angle_bad))
+    for idx in np.flatnonzero(missing | invalid)[:1]:
+        item_id = items[idx].get("id")
+        if missing[idx]:
+            raise ValueError(f"MeasurementItem id={item_id} has no current value")
+        raise ValueError(f"Invalid magnitude/angle for MeasurementItem id={item_id}")
+
+    # Fill real and imaginary planes separately; no complex temporaries
+    angle_rad = np.radians(np.nan_to_num(angle, nan=0.0))
+    out = np.empty(n, dtype=complex)
+    out.real = np.where(rect, np.nan_to_num(real, nan=0.0), mag * np.cos(angle_rad))
+    out.imag = np.where(rect, np.nan_to_num(imag, nan=0.0), mag * np.sin(angle_rad))
+    return out
+
+
 def shield_currents_for_location(
     location_id: int, frequency_hz: float | None = None
 ) -> List[Dict[str, Any]]:
@@ -1938,6 +2244,20 @@ def shield_currents_for_location(
     RuntimeError
         If reading measurements fails.
     """
+    candidates = _collect_shield_currents(location_id, frequency_hz)
+    if not candidates:
+        warnings.warn(
+            f"No shield_current items found for location_id={location_id}",
+            UserWarning,
+            stacklevel=2,
+        )
+    return candidates
+
+
+def _collect_shield_currents(
+    location_id: int, frequency_hz: float | None
+) -> List[Dict[str, Any]]:
+    """Read and filter shield-current items for ``shield_currents_for_location``."""
     try:
         measurements, _ = read_measurements_by(location_id=location_id)
     except Exception as e:
@@ -1948,38 +2268,33 @@ def shield_currents_for_location(
             f"Failed to read measurements for location_id={location_id}"
         ) from e
 
-    candidates: List[Dict[str, Any]] = []
-    for meas in measurements:
-        mid = meas.get("id")
-        for item in meas.get("items", []):
-            if item.get("measurement_type") != "shield_current":
-                continue
-            if frequency_hz is not None:
-                freq = item.get("frequency_hz")
-                try:
-                    if freq is None or float(freq) != float(frequency_hz):
-                        continue
-                except Exception:
-                    continue
-            candidate = {
-                "id": item.get("id"),
-                "measurement_id": mid,
-                "frequency_hz": item.get("frequency_hz"),
-                "value": item.get("value"),
-                "value_angle_deg": item.get("value_angle_deg"),
-                "value_real": item.get("value_real"),
-                "value_imag": item.get("value_imag"),
-                "unit": item.get("unit"),
-                "description": item.get("description"),
-            }
-            candidates.append(candidate)
+    target = None if frequency_hz is None else float(frequency_hz)
 
-    if not candidates:
-        warnings.warn(
-            f"No shield_current items found for location_id={location_id}",
-            UserWarning,
-        )
-    return candidates
+    def _matches_frequency(item: Dict[str, Any]) -> bool:
+        if target is None:
+            return True
+        try:
+            return float(item["frequency_hz"]) == target
+        except Exception:
+            # Missing or non-numeric frequency never matches a filter
+            return False
+
+    return [
+        {
+            "id": item.get("id"),
+            "measurement_id": meas.get("id"),
+            "frequency_hz": item.get("frequency_hz"),
+            "value": item.get("value"),
+            "value_angle_deg": item.get("value_angle_deg"),
+            "value_real": item.get("value_real"),
+            "value_imag": item.get("value_imag"),
+            "unit": item.get("unit"),
+            "description": item.get("description"),
+        }
+        for meas in measurements
+        for item in meas.get("items", [])
+        if item.get("measurement_type") == "shield_current" and _matches_frequency(item)
+    ]
 
 
 def calculate_split_factor(
@@ -2043,15 +2358,16 @@ def calculate_split_factor(
     missing = [sid for sid in shield_current_ids if sid not in found_ids]
     if missing:
         warnings.warn(
-            f"shield_current IDs not found and skipped: {missing}", UserWarning
+            f"shield_current IDs not found and skipped: {missing}",
+            UserWarning,
+            stacklevel=2,
         )
 
     earth_current = _current_item_to_complex(earth_items[0])
     if abs(earth_current) == 0:
         raise ValueError("Earth fault current magnitude is zero; cannot compute split factor")
 
-    shield_vectors = [_current_item_to_complex(it) for it in shield_items]
-    shield_sum = sum(shield_vectors, 0 + 0j)
+    shield_sum = complex(_current_items_to_complex_array(shield_items).sum())
 
     split_factor = 1 - (abs(shield_sum) / abs(earth_current))
     local_current = earth_current - shield_sum
@@ -2102,34 +2418,32 @@ def value_over_distance(
         If single ID: ``{distance_m: value}``; if multiple: ``{measurement_id: {distance_m: value}}``.
     """
     single = isinstance(measurement_ids, int)
-    ids: List[int] = [measurement_ids] if single else list(measurement_ids)
-    all_results: Dict[int, Dict[float, float]] = {}
+    ids: List[int] = [measurement_ids] if single else list(dict.fromkeys(measurement_ids))
 
-    for mid in ids:
-        try:
-            items, _ = read_items_by(
-                measurement_id=mid, measurement_type=measurement_type
-            )
-        except Exception as e:
-            logger.error("Error reading items for measurement %s: %s", mid, e)
-            raise RuntimeError(
-                f"Failed to load data for measurement {mid}"
-            ) from e
-
-        dist_val_map: Dict[float, float] = {}
-        for item in items:
-            dist = item.get("measurement_distance_m")
-            value = item.get("value")
-
-            if dist is None or value is None:
-                continue
+    # One columnar query for all IDs; id order keeps "last item wins" on duplicates
+    try:
+        cols = read_item_arrays(
+            ("measurement_id", "measurement_distance_m", "value"),
+            order_by=("measurement_id", "id"),
+            measurement_id__in=ids,
+            measurement_type=measurement_type,
+        )
+    except Exception as e:
+        mids = ids[0] if single else ids
+        logger.error("Error reading items for measurement %s: %s", mids, e)
+        raise RuntimeError(f"Failed to load data for measurement {mids}") from e
 
-            try:
-                dist_val_map[float(dist)] = float(value)
-            except Exception:
-                continue
+    # Columns that are not all numeric come back as object arrays; coerce them
+    # so unconvertible rows turn into NaN and are skipped like missing ones
+    mid_col = cols["measurement_id"]
+    dist, _ = _coerce_float_array(cols["measurement_distance_m"])
+    val, _ = _coerce_float_array(cols["value"])
+    valid = ~(np.isnan(dist) | np.isnan(val))
 
-        all_results[mid] = dist_val_map
+    all_results: Dict[int, Dict[float, float]] = {}
+    for mid in ids:
+        mask = valid & (mid_col == mid)
+        all_results[mid] = dict(zip(dist[mask].tolist(), val[mask].tolist()))
 
     return all_results[ids[0]] if single else all_results
 
@@ -2155,40 +2469,33 @@ def value_over_distance_detailed(
         if multiple: dict keyed by measurement_id with lists of points.
     """
     single = isinstance(measurement_ids, int)
-    ids: List[int] = [measurement_ids] if single else list(measurement_ids)
-    all_results: Dict[int, List[Dict[str, Any]]] = {}
+    ids: List[int] = [measurement_ids] if single else list(dict.fromkeys(measurement_ids))
 
-    for mid in ids:
-        try:
-            items, _ = read_items_by(
-                measurement_id=mid, measurement_type=measurement_type
-            )
-        except Exception as e:
-            logger.error("Error reading items for measurement %s: %s", mid, e)
-            raise RuntimeError(
-                f"Failed to load data for measurement {mid}"
-            ) from e
-
-        data_points: List[Dict[str, Any]] = []
-        for item in items:
-            dist = item.get("measurement_distance_m")
-            value = item.get("value")
-            freq = item.get("frequency_hz")
-
-            if dist is None or value is None:
-                continue
-
-            try:
-                data_points.append(
-                    {
-                        "distance": float(dist),
-                        "value": float(value),
-                        "frequency": float(freq) if freq is not None else None,
-                    }
-                )
-            except Exception:
-                continue
+    # Plain rows for all IDs in one query; id order keeps insertion order
+    try:
+        rows = read_item_columns(
+            ("measurement_id", "measurement_distance_m", "value", "frequency_hz"),
+            order_by=("measurement_id", "id"),
+            measurement_id__in=ids,
+            measurement_type=measurement_type,
+        )
+    except Exception as e:
+        mids = ids[0] if single else ids
+        logger.error("Error reading items for measurement %s: %s", mids, e)
+        raise RuntimeError(f"Failed to load data for measurement {mids}") from e
 
-        all_results[mid] = data_points
+    all_results: Dict[int, List[Dict[str, Any]]] = {mid: [] for mid in ids}
+    for mid, dist, value, freq in rows:
+        if dist is None or value is None or mid not in all_results:
+            continue
+        try:
+            point = {
+                "distance": float(dist),
+                "value": float(value),
+                "frequency": None if freq is None else float(freq),
+            }
+        except (TypeError, ValueError):
+            continue
+        all_results[mid].append(point)
 
     return all_results[ids[0]] if single else all_results
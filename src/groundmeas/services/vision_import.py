@@ -12,11 +12,19 @@ import logging
 import math
 import re
 import os
+import statistics
+import subprocess
 import base64
+import hashlib
+import tempfile
 import requests
+from concurrent.futures import ThreadPoolExecutor
 from dataclasses import dataclass
+from functools import lru_cache, partial
+from itertools import chain
+from operator import attrgetter
 from pathlib import Path
-from typing import Dict, List, Optional, Sequence
+from typing import Dict, List, Optional, Sequence, Union
 
 import cv2
 import numpy as np
@@ -26,8 +34,84 @@ from ..core.db import create_item
 
 logger = logging.getLogger(__name__)
 
-
-@dataclass
+# Compiled once at import; parse_measurement_rows runs these on every OCR line.
+# Each field takes the first match after the previous one (atomic group) within
+# a bounded gap; open-ended lazy gaps backtrack cubically on long near-miss
+# text such as many "mA" lines with a single "mV".
+_COMPACT_NUM = r"-?\d+(?:[.,]\d+)?"
+_COMPACT_ANGLE = rf"\s*(?P<ang{{}}>{_COMPACT_NUM})?\s*[°º]?"
+_COMPACT_SRC = (
+    rf"(?P<dist>{_COMPACT_NUM})\s*m"
+    rf"(?>.{{0,80}}?(?P<cur>{_COMPACT_NUM})\s*mA){_COMPACT_ANGLE.format(1)}"
+    rf"(?>.{{0,80}}?(?P<volt>{_COMPACT_NUM})\s*mV){_COMPACT_ANGLE.format(2)}"
+    rf"(?>.{{0,80}}?(?P<imp>{_COMPACT_NUM})\s*m[Ω0oOQqAa]){_COMPACT_ANGLE.format(3)}"
+)
+_COMPACT_RE = re.compile(_COMPACT_SRC, re.IGNORECASE)
+_FULL_RE = re.compile(_COMPACT_SRC, re.IGNORECASE | re.DOTALL)
+_DIST_RE = re.compile(
+    r"(?:dist|distance|d)\s*[:=]?\s*(-?\d+(?:[.,]\d+)?)\s*(?:m\b|meter|metre|mtr)?",
+    re.IGNORECASE,
+)
+# Also catch bare numbers followed by m
+_DIST_UNIT_RE = re.compile(r"(-?\d+(?:[.,]\d+)?)\s*m\b", re.IGNORECASE)
+_DIST_CELL_RE = re.compile(r"(-?\d+(?:[.,]\d+)?)\s*m", re.IGNORECASE)
+_CUR_LABEL_RE = re.compile(r"(?:earth)?\s*current|i", re.IGNORECASE)
+_CUR_VALUE_RE = re.compile(r"(-?\d+(?:[.,]\d+)?)\s*(?:a\b|amp)", re.IGNORECASE)
+_VOLT_LABEL_RE = re.compile(r"(?:volt|vtp|vt)\b", re.IGNORECASE)
+_VOLT_VALUE_RE = re.compile(r"(-?\d+(?:[.,]\d+)?)\s*v\b", re.IGNORECASE)
+_IMP_LABEL_RE = re.compile(
+    r"(?:impedance|resistance|z|r)\s*[:=]?\s*(-?\d+(?:[.,]\d+)?)",
+    re.IGNORECASE,
+)
+_IMP_UNIT_RE = re.compile(r"(-?\d+(?:[.,]\d+)?)\s*(?:ohm|Ω|ohms)\b", re.IGNORECASE)
+_IMP_OHM_RE = re.compile(r"(-?\d+(?:[.,]\d+)?)\s*Ω", re.IGNORECASE)
+_MO_FINDALL_RE = re.compile(r"(-?\d+(?:[.,]\d+)?)\s*m[Ω0o]", re.IGNORECASE)
+_ANGLE_RE = re.compile(r"(?:angle|phi|∠)\s*[:=]?\s*(-?\d+(?:[.,]\d+)?)")
+# Unit-tagged tokens for the per-line scan; alternatives are tried in order at
+# each position, so "mA"/"mV" win over the milliohm misread class.
+_TOKEN_RE = re.compile(
+    r"(?P<cur>-?\d+(?:[.,]\d+)?)\s*mA"
+    r"|(?P<volt>-?\d+(?:[.,]\d+)?)\s*mV"
+    r"|(?P<imp_m>-?\d+(?:[.,]\d+)?)\s*m[Ω0oOQq]"
+    r"|(?P<dist>-?\d+(?:[.,]\d+)?)\s*m\b"
+    r"|(?P<imp_o>-?\d+(?:[.,]\d+)?)\s*Ω"
+    r"|(?P<deg>-?\d+(?:[.,]\d+)?)\s*[°º]",
+    re.IGNORECASE,
+)
+_VAL_UNIT_RE = re.compile(
+    r"(-?\d+(?:[.,]\d+)?)(?:\s*)?([mk]?)(A|V|Ω|ohm|ohms|0|o)?", re.IGNORECASE
+)
+_ANGLE_DEG_RE = re.compile(r"(-?\d+(?:[.,]\d+)?)\s*°")
+_TESSERACT_CONFIG = "--psm 6 --oem 3"
+# Tesseract preprocessing (longest-side cap, median blur kernel, adaptive
+# threshold block and C)
+_PREPROCESS_MAX_DIM = 2000
+_MEDIAN_BLUR_KSIZE = 3
+_THRESH_BLOCK_SIZE = 31
+_THRESH_C = 10
+_JPEG_QUALITY = 90
+
+
+def _user_cache_dir() -> Path:
+    """Per-user cache root: ``%LOCALAPPDATA%``, ``$XDG_CACHE_HOME`` or ``~/.cache``."""
+    root = os.environ.get("LOCALAPPDATA") if os.name == "nt" else os.environ.get("XDG_CACHE_HOME")
+    return Path(root) if root else Path.home() / ".cache"
+
+
+# Opt-in OCR text cache keyed by image content and every OCR setting; re-imports
+# of the same images skip the OCR call entirely. Oldest entries are evicted
+# beyond _OCR_CACHE_MAX_FILES.
+_OCR_CACHE_DIR = _user_cache_dir() / "groundmeas" / "ocr"
+_OCR_CACHE_MAX_FILES = 1000
+
+# OCR clean-up: single-char fixes via one translate table, then one regex pass
+# for "rn" -> "m" and missing leading zeros (".5" -> "0.5")
+_OCR_TRANS = str.maketrans({"—": "-", "|": " | "})
+_OCR_FIX_RE = re.compile(r"rn|(?<!\d)\.(\d)")
+_BARE_ZERO_RE = re.compile(r"\b0\.(?!\d)")
+
+
+@dataclass(slots=True)
 class ParsedRow:
     distance_m: Optional[float] = None
     current_a: Optional[float] = None
@@ -38,6 +122,11 @@ class ParsedRow:
     impedance_angle_deg: Optional[float] = None
 
 
+def _row_key(row: ParsedRow) -> tuple[float, Optional[float], Optional[float], Optional[float]]:
+    """Deduplication key for a parsed row: distance, current, voltage, impedance."""
+    return (row.distance_m or math.inf, row.current_a, row.voltage_v, row.impedance_ohm)
+
+
 def _normalize_number(raw: str) -> float:
     """
     Convert a numeric string with comma or dot decimal separator to float.
@@ -52,7 +141,35 @@ def _normalize_number(raw: str) -> float:
     float
         Parsed value.
     """
-    return float(raw.replace(",", "."))
+    return float(raw.replace(",", ".") if "," in raw else raw)
+
+
+def _row_from_compact(match: re.Match) -> ParsedRow:
+    """
+    Build a row from a compact ``dist m … mA … mV … mΩ`` match.
+
+    Milli-units are converted to A, V and Ω; angles are optional.
+    """
+
+    def _opt(group: str) -> Optional[float]:
+        raw = match.group(group)
+        return _normalize_number(raw) if raw else None
+
+    return ParsedRow(
+        distance_m=_normalize_number(match.group("dist")),
+        current_a=_normalize_number(match.group("cur")) * 1e-3,
+        current_angle_deg=_opt("ang1"),
+        voltage_v=_normalize_number(match.group("volt")) * 1e-3,
+        voltage_angle_deg=_opt("ang2"),
+        impedance_ohm=_normalize_number(match.group("imp")) * 1e-3,
+        impedance_angle_deg=_opt("ang3"),
+    )
+
+
+def _ocr_fix(match: re.Match) -> str:
+    """Replacement for ``_OCR_FIX_RE``: ``rn`` becomes ``m``, ``.5`` becomes ``0.5``."""
+    digit = match.group(1)
+    return "m" if digit is None else f"0.{digit}"
 
 
 def _normalize_ocr_text(text: str) -> str:
@@ -63,12 +180,12 @@ def _normalize_ocr_text(text: str) -> str:
     - Normalizes stray "0." tokens ("0." -> "0.0")
     - Replaces common OCR artifacts
     """
-    cleaned = text.replace("—", "-").replace("|", " | ").replace("rn", "m")
-    cleaned = re.sub(r"(?<!\d)\.(\d)", r"0.\1", cleaned)
-    cleaned = re.sub(r"\b0\.(?!\d)", "0.0", cleaned)
+    cleaned = _OCR_FIX_RE.sub(_ocr_fix, text.translate(_OCR_TRANS))
+    cleaned = _BARE_ZERO_RE.sub("0.0", cleaned)
     return cleaned
 
 
+@lru_cache(maxsize=4096)
 def _parse_value_angle_unit(chunk: str) -> tuple[Optional[float], Optional[float], Optional[str]]:
     """
     Parse a token string containing value, unit, and optional phase angle.
@@ -86,17 +203,18 @@ def _parse_value_angle_unit(chunk: str) -> tuple[Optional[float], Optional[float
     -------
     tuple[float | None, float | None, str | None]
         Magnitude in base SI units, angle in degrees, and original unit string.
+
+    Notes
+    -----
+    Results are memoized per chunk; table headers and repeated cells across an
+    OCR batch are parsed once.
     """
     if not chunk:
         return None, None, None
     # split into parts: value, unit, angle
     # Accept unit immediately after number (e.g., 118.1mΩ) or separated by space
-    val_unit_match = re.search(
-        r"(-?\d+(?:[.,]\d+)?)(?:\s*)?([mk]?)(A|V|Ω|ohm|ohms|0|o)?",
-        chunk,
-        re.IGNORECASE,
-    )
-    angle_match = re.search(r"(-?\d+(?:[.,]\d+)?)\s*°", chunk)
+    val_unit_match = _VAL_UNIT_RE.search(chunk)
+    angle_match = _ANGLE_DEG_RE.search(chunk)
     if not val_unit_match:
         return None, None, None
     raw_val = _normalize_number(val_unit_match.group(1))
@@ -115,16 +233,32 @@ def _parse_value_angle_unit(chunk: str) -> tuple[Optional[float], Optional[float
     return value, angle, unit
 
 
-def preprocess_image(path: Path) -> np.ndarray:
+@lru_cache(maxsize=None)
+def _opencl_enabled() -> bool:
+    """Return True if OpenCV can dispatch filters to an OpenCL device."""
+    try:
+        return bool(cv2.ocl.haveOpenCL() and cv2.ocl.useOpenCL())
+    except Exception:  # pragma: no cover - depends on the OpenCV build
+        return False
+
+
+def preprocess_image(path: Path, max_dim: int | None = _PREPROCESS_MAX_DIM) -> np.ndarray:
     """
     Load and preprocess an image for Tesseract OCR.
 
-    Applies grayscale conversion, median blur, and adaptive thresholding.
+    Applies grayscale conversion, downscaling of oversized images, median blur,
+    and adaptive thresholding. The
+    filters run through OpenCV's transparent API (``cv2.UMat``) when an OpenCL
+    device is available, otherwise on the CPU.
 
     Parameters
     ----------
     path : Path
         Path to the image file.
+    max_dim : int, optional
+        Longest side after downscaling (aspect ratio kept); None disables it.
+        Filter cost grows with pixel count, and Tesseract reads oversized
+        camera images no better.
 
     Returns
     -------
@@ -140,11 +274,23 @@ def preprocess_image(path: Path) -> np.ndarray:
     if img is None:
         raise FileNotFoundError(f"Image not found: {path}")
     gray = cv2.cvtColor(img, cv2.COLOR_BGR2GRAY)
-    blur = cv2.medianBlur(gray, 3)
+    if max_dim:
+        h, w = gray.shape[:2]
+        if max(h, w) > max_dim:
+            scale = max_dim / float(max(h, w))
+            gray = cv2.resize(gray, (int(w * scale), int(h * scale)), interpolation=cv2.INTER_AREA)
+    if _opencl_enabled():
+        gray = cv2.UMat(gray)
+    blur = cv2.medianBlur(gray, _MEDIAN_BLUR_KSIZE)
     th = cv2.adaptiveThreshold(
-        blur, 255, cv2.ADAPTIVE_THRESH_GAUSSIAN_C, cv2.THRESH_BINARY, 31, 10
+        blur,
+        255,
+        cv2.ADAPTIVE_THRESH_GAUSSIAN_C,
+        cv2.THRESH_BINARY,
+        _THRESH_BLOCK_SIZE,
+        _THRESH_C,
     )
-    return th
+    return th.get() if isinstance(th, cv2.UMat) else th
 
 
 def _read_api_key(env_name: str) -> str:
@@ -201,10 +347,75 @@ def _image_to_base64(path: Path, max_dim: int | None = 1400) -> str:
         if max(h, w) > max_dim:
             scale = max_dim / float(max(h, w))
             img = cv2.resize(img, (int(w * scale), int(h * scale)), interpolation=cv2.INTER_AREA)
-    _, buf = cv2.imencode(".jpg", img, [int(cv2.IMWRITE_JPEG_QUALITY), 90])
+    _, buf = cv2.imencode(".jpg", img, [int(cv2.IMWRITE_JPEG_QUALITY), _JPEG_QUALITY])
     return base64.b64encode(buf).decode("ascii")
 
 
+def _ocr_cache_file(
+    path: Path, provider_model: str, lang: str, max_dim: int | None
+) -> Optional[Path]:
+    """
+    Return the cache file for an image and OCR setting, or None if unreadable.
+
+    The key is a BLAKE2b digest of the image bytes plus every setting that can
+    change the text: provider and model, language, upload resize limit
+    (remote providers only), Tesseract config, the preprocessing parameters
+    and the upload JPEG quality.
+    """
+    try:
+        data = Path(path).read_bytes()
+    except OSError:
+        return None
+    remote = provider_model.split(":", 1)[0].lower() != "tesseract"
+    settings = (
+        provider_model,
+        lang,
+        (max_dim or None) if remote else None,
+        _TESSERACT_CONFIG,
+        _PREPROCESS_MAX_DIM,
+        _MEDIAN_BLUR_KSIZE,
+        _THRESH_BLOCK_SIZE,
+        _THRESH_C,
+        _JPEG_QUALITY,
+    )
+    digest = hashlib.blake2b(data, digest_size=16)
+    digest.update(repr(settings).encode())
+    return _OCR_CACHE_DIR / f"{digest.hexdigest()}.txt"
+
+
+def _ocr_cache_get(cache_file: Optional[Path]) -> Optional[str]:
+    """Return cached OCR text, or None on a miss."""
+    if cache_file is None:
+        return None
+    try:
+        return cache_file.read_text(encoding="utf-8")
+    except OSError:
+        return None
+
+
+def _ocr_cache_put(cache_file: Optional[Path], text: str) -> None:
+    """Store OCR text and evict the oldest entries; failures are logged and ignored."""
+    if cache_file is None:
+        return
+    try:
+        _OCR_CACHE_DIR.mkdir(mode=0o700, parents=True, exist_ok=True)
+        tmp = cache_file.with_suffix(f".{os.getpid()}.tmp")
+        fd = os.open(tmp, os.O_WRONLY | os.O_CREAT | os.O_TRUNC, 0o600)
+        with os.fdopen(fd, "w", encoding="utf-8") as fh:
+            fh.write(text)
+        tmp.replace(cache_file)
+        entries = sorted(
+            (e.stat().st_mtime, e.path) for e in os.scandir(_OCR_CACHE_DIR) if e.name.endswith(".txt")
+        )
+        for _, stale in entries[: max(0, len(entries) - _OCR_CACHE_MAX_FILES)]:
+            try:
+                os.remove(stale)
+            except FileNotFoundError:  # evicted concurrently by another worker
+                pass
+    except OSError as exc:
+        logger.debug("Could not write OCR cache %s: %s", cache_file, exc)
+
+
 def ocr_image(
     path: Path,
     lang: str = "eng",
@@ -212,6 +423,7 @@ def ocr_image(
     api_key_env: str = "OPENAI_API_KEY",
     timeout: float = 120.0,
     max_dim: int | None = 1400,
+    use_cache: bool = False,
 ) -> str:
     """
     Perform Optical Character Recognition (OCR) on an image.
@@ -229,9 +441,15 @@ def ocr_image(
     api_key_env : str, default "OPENAI_API_KEY"
         Environment variable for API key (OpenAI).
     timeout : float, default 120.0
-        Timeout for OCR HTTP calls.
+        Timeout in seconds for the Tesseract run or OCR HTTP call.
     max_dim : int, optional
-        Max image dimension for OCR (resize to reduce payload).
+        Max image dimension for the resize applied before upload to a remote
+        provider. Tesseract input is capped by ``preprocess_image`` instead.
+    use_cache : bool, default False
+        Read and write the per-user on-disk OCR cache (``~/.cache/groundmeas/ocr``
+        or the platform equivalent), keyed by image content and all OCR
+        settings. Remote providers are not deterministic; with the cache on,
+        their first answer for an image is reused instead of asking again.
 
     Returns
     -------
@@ -245,6 +463,109 @@ def ocr_image(
     RuntimeError
         If the API call fails.
     """
+    cache_file = _ocr_cache_file(path, provider_model, lang, max_dim) if use_cache else None
+    cached = _ocr_cache_get(cache_file)
+    if cached is not None:
+        return cached
+    text = _ocr_image_uncached(path, lang, provider_model, api_key_env, timeout, max_dim)
+    _ocr_cache_put(cache_file, text)
+    return text
+
+
+def _run_tesseract(
+    source: str,
+    lang: str = "eng",
+    timeout: float = 120.0,
+    input: Optional[bytes] = None,
+    single_thread: bool = False,
+) -> str:
+    """
+    Run the Tesseract CLI on ``source`` and return what it prints to stdout.
+
+    Parameters
+    ----------
+    source : str
+        Image file to read, or ``"stdin"`` to read ``input``.
+    lang : str, default "eng"
+        Language code for Tesseract.
+    timeout : float, default 120.0
+        Seconds before the Tesseract process is killed.
+    input : bytes, optional
+        Encoded image piped to Tesseract when ``source`` is ``"stdin"``.
+    single_thread : bool, default False
+        Limit the engine to one OpenMP thread (``OMP_THREAD_LIMIT=1``) unless
+        the caller's environment already sets a limit. Only the Tesseract
+        process sees the variable.
+
+    Returns
+    -------
+    str
+        Extracted text.
+
+    Raises
+    ------
+    RuntimeError
+        If Tesseract exits with an error.
+    subprocess.TimeoutExpired
+        If Tesseract does not finish within ``timeout``.
+    """
+    cmd = [
+        pytesseract.pytesseract.tesseract_cmd,
+        source,
+        "stdout",
+        "-l",
+        lang,
+        *_TESSERACT_CONFIG.split(),
+    ]
+    env = {"OMP_THREAD_LIMIT": "1", **os.environ} if single_thread else None
+    proc = subprocess.run(cmd, input=input, capture_output=True, timeout=timeout, env=env)
+    if proc.returncode != 0:
+        err = proc.stderr.decode("utf-8", "replace").strip()
+        raise RuntimeError(f"Tesseract failed ({proc.returncode}): {err}")
+    return proc.stdout.decode("utf-8", "replace")
+
+
+def _tesseract_stdin(image: np.ndarray, lang: str = "eng", timeout: float = 120.0) -> str:
+    """
+    OCR an in-memory image by piping PNG bytes through Tesseract's stdin/stdout.
+
+    Avoids the temporary image and output files ``pytesseract.image_to_string``
+    writes per call.
+
+    Parameters
+    ----------
+    image : numpy.ndarray
+        Preprocessed image.
+    lang : str, default "eng"
+        Language code for Tesseract.
+    timeout : float, default 120.0
+        Seconds before the Tesseract process is killed.
+
+    Returns
+    -------
+    str
+        Extracted text.
+
+    Raises
+    ------
+    RuntimeError
+        If the image cannot be encoded or Tesseract exits with an error.
+    """
+    ok, buf = cv2.imencode(".png", image)
+    if not ok:
+        raise RuntimeError("Could not encode image for OCR")
+    return _run_tesseract("stdin", lang=lang, timeout=timeout, input=buf.tobytes())
+
+
+def _ocr_image_uncached(
+    path: Path,
+    lang: str,
+    provider_model: str,
+    api_key_env: str,
+    timeout: float,
+    max_dim: int | None,
+) -> str:
+    """Run the configured OCR backend on one image; see ``ocr_image``."""
     if ":" in provider_model:
         provider, model = provider_model.split(":", 1)
     else:
@@ -252,8 +573,7 @@ def ocr_image(
     provider = provider.lower()
 
     if provider == "tesseract":
-        pre = preprocess_image(path)
-        return pytesseract.image_to_string(pre, lang=lang, config="--psm 6 --oem 3")
+        return _tesseract_stdin(preprocess_image(path), lang=lang, timeout=timeout)
 
     if provider == "openai":
         api_key = _read_api_key(api_key_env)
@@ -303,6 +623,95 @@ def ocr_image(
     raise ValueError(f"Unsupported OCR provider '{provider_model}'")
 
 
+def _ocr_tesseract_batch(
+    paths: Sequence[Path],
+    lang: str = "eng",
+    timeout: float = 120.0,
+    use_cache: bool = False,
+) -> List[Union[str, Exception]]:
+    """
+    Run Tesseract once over several images as one multi-page TIFF.
+
+    The preprocessed pages are written to a single temporary TIFF that one
+    Tesseract process consumes, so engine start-up and model loading are paid
+    once per batch instead of once per image. The output is split on
+    Tesseract's form-feed page separator. With ``use_cache``, images already
+    in the OCR cache are not re-run. The engine runs single-threaded, since
+    batches are OCR'd in parallel.
+
+    Parameters
+    ----------
+    paths : sequence[Path]
+        Image files, in the order results should be returned.
+    lang : str, default "eng"
+        Language code for Tesseract.
+    timeout : float, default 120.0
+        Seconds before the Tesseract process is killed.
+    use_cache : bool, default False
+        Read and write the on-disk OCR cache, as for ``ocr_image``.
+
+    Returns
+    -------
+    list[str | Exception]
+        OCR text per image, or the exception raised while preprocessing it.
+        Falls back to per-image ``ocr_image`` calls if the batch run fails or
+        returns an unexpected number of pages.
+    """
+    results: List[Union[str, Exception]] = [""] * len(paths)
+    with tempfile.TemporaryDirectory(prefix="gm_ocr_") as tmp:
+        tmp_dir = Path(tmp)
+        batch_idx: List[int] = []
+        pages_in: List[np.ndarray] = []
+        cache_files: Dict[int, Optional[Path]] = {}
+        for idx, path in enumerate(paths):
+            cache_files[idx] = (
+                _ocr_cache_file(path, "tesseract", lang, None) if use_cache else None
+            )
+            cached = _ocr_cache_get(cache_files[idx])
+            if cached is not None:
+                results[idx] = cached
+                continue
+            try:
+                pre = preprocess_image(path)
+            except Exception as exc:
+                results[idx] = exc
+                continue
+            batch_idx.append(idx)
+            pages_in.append(pre)
+
+        if not batch_idx:
+            return results
+
+        # Pages may differ in size; TIFF stores each page with its own dimensions
+        tiff = tmp_dir / "pages.tif"
+        try:
+            if not cv2.imwritemulti(str(tiff), pages_in):
+                raise RuntimeError(f"could not write {tiff}")
+            text = _run_tesseract(str(tiff), lang=lang, timeout=timeout, single_thread=True)
+            pages = text.split("\f")
+        except Exception as exc:
+            logger.warning("Batch OCR failed, falling back to per-image OCR: %s", exc)
+            pages = []
+
+        if len(pages) < len(batch_idx):
+            for idx in batch_idx:
+                try:
+                    results[idx] = ocr_image(
+                        paths[idx],
+                        lang=lang,
+                        timeout=timeout,
+                        use_cache=use_cache,
+                    )
+                except Exception as exc:
+                    results[idx] = exc
+            return results
+
+        for idx, page in zip(batch_idx, pages):
+            results[idx] = page
+            _ocr_cache_put(cache_files[idx], page)
+    return results
+
+
 def parse_measurement_rows(text: str) -> List[ParsedRow]:
     """
     Parse unstructured OCR text into structured measurement rows.
@@ -323,147 +732,63 @@ def parse_measurement_rows(text: str) -> List[ParsedRow]:
     """
     rows: List[ParsedRow] = []
     seen_keys: set[tuple[float, Optional[float], Optional[float], Optional[float]]] = set()
-    compact_pattern = re.compile(
-        r"(?P<dist>-?\d+(?:[.,]\d+)?)\s*m"
-        r".*?(?P<cur>-?\d+(?:[.,]\d+)?)\s*mA\s*(?P<ang1>-?\d+(?:[.,]\d+)?)?\s*[°º]?"
-        r".*?(?P<volt>-?\d+(?:[.,]\d+)?)\s*mV\s*(?P<ang2>-?\d+(?:[.,]\d+)?)?\s*[°º]?"
-        r".*?(?P<imp>-?\d+(?:[.,]\d+)?)\s*m[Ω0oOQqAa]\s*(?P<ang3>-?\d+(?:[.,]\d+)?)?\s*[°º]?",
-        re.IGNORECASE,
-    )
-    full_pattern = re.compile(
-        r"(?P<dist>-?\d+(?:[.,]\d+)?)\s*m"
-        r".*?(?P<cur>-?\d+(?:[.,]\d+)?)\s*mA\s*(?P<ang1>-?\d+(?:[.,]\d+)?)?\s*[°º]?"
-        r".*?(?P<volt>-?\d+(?:[.,]\d+)?)\s*mV\s*(?P<ang2>-?\d+(?:[.,]\d+)?)?\s*[°º]?"
-        r".*?(?P<imp>-?\d+(?:[.,]\d+)?)\s*m[Ω0oOQqAa]\s*(?P<ang3>-?\d+(?:[.,]\d+)?)?\s*[°º]?",
-        re.IGNORECASE | re.DOTALL,
-    )
-    distance_pattern = re.compile(
-        r"(?:dist|distance|d)\s*[:=]?\s*(-?\d+(?:[.,]\d+)?)\s*(?:m\b|meter|metre|mtr)?",
-        re.IGNORECASE,
-    )
-    # Also catch bare numbers followed by m
-    distance_unit_pattern = re.compile(r"(-?\d+(?:[.,]\d+)?)\s*m\b", re.IGNORECASE)
-
-    current_pattern = re.compile(
-        r"(?:earth)?\s*current|i", re.IGNORECASE
-    )
-    current_value_pattern = re.compile(
-        r"(-?\d+(?:[.,]\d+)?)\s*(?:a\b|amp)", re.IGNORECASE
-    )
 
-    voltage_pattern = re.compile(r"(?:volt|vtp|vt)\b", re.IGNORECASE)
-    voltage_value_pattern = re.compile(r"(-?\d+(?:[.,]\d+)?)\s*v\b", re.IGNORECASE)
-
-    impedance_label_pattern = re.compile(
-        r"(?:impedance|resistance|z|r)\s*[:=]?\s*(-?\d+(?:[.,]\d+)?)",
-        re.IGNORECASE,
-    )
-    impedance_unit_pattern = re.compile(
-        r"(-?\d+(?:[.,]\d+)?)\s*(?:ohm|Ω|ohms)\b", re.IGNORECASE
-    )
-
-    angle_pattern = re.compile(r"(?:angle|phi|∠)\s*[:=]?\s*(-?\d+(?:[.,]\d+)?)")
-    degree_pattern = re.compile(r"(-?\d+(?:[.,]\d+)?)\s*[°º]")
-
-    # Pass 1: extract any compact sequences across the whole text (multi-line)
-    full_clean = _normalize_ocr_text(text)
-    for m_full in full_pattern.finditer(full_clean):
-        cur_val = _normalize_number(m_full.group("cur")) * 1e-3  # mA -> A
-        volt_val = _normalize_number(m_full.group("volt")) * 1e-3  # mV -> V
-        row = ParsedRow(
-            distance_m=_normalize_number(m_full.group("dist")),
-            current_a=cur_val,
-            current_angle_deg=_normalize_number(m_full.group("ang1")) if m_full.group("ang1") else None,
-            voltage_v=volt_val,
-            voltage_angle_deg=_normalize_number(m_full.group("ang2")) if m_full.group("ang2") else None,
-            impedance_ohm=_normalize_number(m_full.group("imp")) * 1e-3,  # mΩ → Ω
-            impedance_angle_deg=_normalize_number(m_full.group("ang3")) if m_full.group("ang3") else None,
-        )
-        key = (
-            row.distance_m or math.inf,
-            row.current_a,
-            row.voltage_v,
-            row.impedance_ohm,
-        )
+    def _keep(row: ParsedRow) -> None:
+        key = _row_key(row)
         if key not in seen_keys:
             seen_keys.add(key)
             rows.append(row)
 
-    for m_compact in compact_pattern.finditer(full_clean):
-        cur_val = _normalize_number(m_compact.group("cur")) * 1e-3  # mA -> A
-        volt_val = _normalize_number(m_compact.group("volt")) * 1e-3  # mV -> V
-        row = ParsedRow(
-            distance_m=_normalize_number(m_compact.group("dist")),
-            current_a=cur_val,
-            current_angle_deg=_normalize_number(m_compact.group("ang1")) if m_compact.group("ang1") else None,
-            voltage_v=volt_val,
-            voltage_angle_deg=_normalize_number(m_compact.group("ang2")) if m_compact.group("ang2") else None,
-            impedance_ohm=_normalize_number(m_compact.group("imp")) * 1e-3,  # mΩ → Ω
-            impedance_angle_deg=_normalize_number(m_compact.group("ang3")) if m_compact.group("ang3") else None,
-        )
-        if row.impedance_ohm is None and row.voltage_v is not None and row.current_a not in (None, 0):
-            row.impedance_ohm = abs(row.voltage_v / row.current_a)
-            if row.voltage_angle_deg is not None and row.current_angle_deg is not None:
-                row.impedance_angle_deg = row.voltage_angle_deg - row.current_angle_deg
-        key = (
-            row.distance_m or math.inf,
-            row.current_a,
-            row.voltage_v,
-            row.impedance_ohm,
-        )
-        if key not in seen_keys:
-            seen_keys.add(key)
-            rows.append(row)
+    # Pass 1: extract any compact sequences across the whole text (multi-line)
+    full_clean = _normalize_ocr_text(text)
+    # Compact sequences need both "mA" and "mV"; skip the scans when either is absent
+    lowered = full_clean.lower()
+    has_compact = "ma" in lowered and "mv" in lowered
+    if has_compact:
+        for m in chain(_FULL_RE.finditer(full_clean), _COMPACT_RE.finditer(full_clean)):
+            _keep(_row_from_compact(m))
 
     # Pass 2: per-line parsing for leftovers
-    for raw_line in text.splitlines():
+    # Normalization never adds or removes line breaks, so the cleaned text splits
+    # into the same lines and each line need not be normalized again.
+    for raw_line, cleaned in zip(text.splitlines(), full_clean.splitlines()):
         line = raw_line.strip()
         if not line:
             continue
+        # Every branch below needs a distance anchor ("d"-label or "<num> m"),
+        # so lines without a digit or without "d"/"m" cannot yield a row.
+        low = line.lower()
+        if ("m" not in low and "d" not in low) or not any(ch.isdigit() for ch in line):
+            continue
 
-        cleaned = _normalize_ocr_text(line)
-        m_compact_line = compact_pattern.search(cleaned)
+        m_compact_line = _COMPACT_RE.search(cleaned) if has_compact else None
         if m_compact_line:
-            cur_val = _normalize_number(m_compact_line.group("cur")) * 1e-3  # mA -> A
-            volt_val = _normalize_number(m_compact_line.group("volt")) * 1e-3  # mV -> V
-            row = ParsedRow(
-                distance_m=_normalize_number(m_compact_line.group("dist")),
-                current_a=cur_val,
-                current_angle_deg=_normalize_number(m_compact_line.group("ang1")) if m_compact_line.group("ang1") else None,
-                voltage_v=volt_val,
-                voltage_angle_deg=_normalize_number(m_compact_line.group("ang2")) if m_compact_line.group("ang2") else None,
-                impedance_ohm=_normalize_number(m_compact_line.group("imp")) * 1e-3,  # mΩ → Ω
-                impedance_angle_deg=_normalize_number(m_compact_line.group("ang3")) if m_compact_line.group("ang3") else None,
-            )
-            key = (
-                row.distance_m or math.inf,
-                row.current_a,
-                row.voltage_v,
-                row.impedance_ohm,
-            )
-            if key not in seen_keys:
-                seen_keys.add(key)
-                rows.append(row)
+            _keep(_row_from_compact(m_compact_line))
             continue
 
         # Sequential token extraction: dist, current (mA), voltage (mV), impedance (mΩ/Ω)
-        dist_match_seq = distance_pattern.search(line) or distance_unit_pattern.search(line)
-        cur_match_seq = re.search(r"(-?\d+(?:[.,]\d+)?)\s*mA", line, re.IGNORECASE)
-        volt_match_seq = re.search(r"(-?\d+(?:[.,]\d+)?)\s*mV", line, re.IGNORECASE)
-        imp_match_m = re.search(r"(-?\d+(?:[.,]\d+)?)\s*m[Ω0oOQqAa]", line, re.IGNORECASE)
-        imp_match_O = re.search(r"(-?\d+(?:[.,]\d+)?)\s*Ω", line, re.IGNORECASE)
-        degs = list(degree_pattern.finditer(line))
-
-        if dist_match_seq and (cur_match_seq or volt_match_seq or imp_match_m or imp_match_O):
-            row = ParsedRow(distance_m=_normalize_number(dist_match_seq.group(1)))
-            if cur_match_seq:
-                row.current_a = _normalize_number(cur_match_seq.group(1)) * 1e-3
-            if volt_match_seq:
-                row.voltage_v = _normalize_number(volt_match_seq.group(1)) * 1e-3
-            if imp_match_m:
-                row.impedance_ohm = _normalize_number(imp_match_m.group(1)) * 1e-3
-            elif imp_match_O:
-                row.impedance_ohm = _normalize_number(imp_match_O.group(1))
+        # in one pass; the first token of each kind wins, all degree tokens are kept.
+        tokens: Dict[str, str] = {}
+        degs: List[str] = []
+        for tok in _TOKEN_RE.finditer(line):
+            kind = tok.lastgroup
+            if kind == "deg":
+                degs.append(tok.group(kind))
+            elif kind not in tokens:
+                tokens[kind] = tok.group(kind)
+        dist_label = _DIST_RE.search(line)
+        dist_raw = dist_label.group(1) if dist_label else tokens.get("dist")
+
+        if dist_raw and tokens.keys() & {"cur", "volt", "imp_m", "imp_o"}:
+            row = ParsedRow(distance_m=_normalize_number(dist_raw))
+            if "cur" in tokens:
+                row.current_a = _normalize_number(tokens["cur"]) * 1e-3
+            if "volt" in tokens:
+                row.voltage_v = _normalize_number(tokens["volt"]) * 1e-3
+            if "imp_m" in tokens:
+                row.impedance_ohm = _normalize_number(tokens["imp_m"]) * 1e-3
+            elif "imp_o" in tokens:
+                row.impedance_ohm = _normalize_number(tokens["imp_o"])
             # If we have V and I but no Z, compute Z = V/I
             if row.impedance_ohm is None and row.voltage_v is not None and row.current_a not in (None, 0):
                 row.impedance_ohm = abs(row.voltage_v / row.current_a)
@@ -472,30 +797,22 @@ def parse_measurement_rows(text: str) -> List[ParsedRow]:
 
             if degs:
                 if len(degs) >= 1 and row.current_a is not None:
-                    row.current_angle_deg = _normalize_number(degs[0].group(1))
+                    row.current_angle_deg = _normalize_number(degs[0])
                 if len(degs) >= 2 and row.voltage_v is not None:
-                    row.voltage_angle_deg = _normalize_number(degs[1].group(1))
+                    row.voltage_angle_deg = _normalize_number(degs[1])
                 if len(degs) >= 3 and row.impedance_ohm is not None:
-                    row.impedance_angle_deg = _normalize_number(degs[2].group(1))
+                    row.impedance_angle_deg = _normalize_number(degs[2])
                 elif len(degs) >= 2 and row.impedance_ohm is not None:
-                    row.impedance_angle_deg = _normalize_number(degs[1].group(1))
+                    row.impedance_angle_deg = _normalize_number(degs[1])
 
-            key = (
-                row.distance_m or math.inf,
-                row.current_a,
-                row.voltage_v,
-                row.impedance_ohm,
-            )
-            if key not in seen_keys:
-                seen_keys.add(key)
-                rows.append(row)
+            _keep(row)
             continue
 
         # Table-like lines separated by pipes
         if "|" in line:
             parts = [p.strip() for p in line.split("|") if p.strip()]
             if len(parts) >= 4:
-                dist_match = re.search(r"(-?\d+(?:[.,]\d+)?)\s*m", parts[0], re.IGNORECASE)
+                dist_match = _DIST_CELL_RE.search(parts[0])
                 if dist_match:
                     row = ParsedRow(distance_m=_normalize_number(dist_match.group(1)))
                     cur_val, cur_ang, _ = _parse_value_angle_unit(parts[1])
@@ -507,18 +824,10 @@ def parse_measurement_rows(text: str) -> List[ParsedRow]:
                     imp_val, imp_ang, _ = _parse_value_angle_unit(parts[3])
                     row.impedance_ohm = imp_val
                     row.impedance_angle_deg = imp_ang
-                    key = (
-                        row.distance_m or math.inf,
-                        row.current_a,
-                        row.voltage_v,
-                        row.impedance_ohm,
-                    )
-                    if key not in seen_keys:
-                        seen_keys.add(key)
-                        rows.append(row)
+                    _keep(row)
                     continue
 
-        dist_match = distance_pattern.search(line) or distance_unit_pattern.search(line)
+        dist_match = _DIST_RE.search(line) or _DIST_UNIT_RE.search(line)
         if not dist_match:
             # skip lines without distance anchors to avoid misalignment
             continue
@@ -526,87 +835,109 @@ def parse_measurement_rows(text: str) -> List[ParsedRow]:
         row = ParsedRow(distance_m=_normalize_number(dist_match.group(1)))
 
         # Current
-        if current_pattern.search(line):
-            cur_match = current_value_pattern.search(line)
+        if _CUR_LABEL_RE.search(line):
+            cur_match = _CUR_VALUE_RE.search(line)
             if cur_match:
                 row.current_a = _normalize_number(cur_match.group(1))
         else:
-            cur_match = current_value_pattern.search(line)
+            cur_match = _CUR_VALUE_RE.search(line)
             if cur_match:
                 row.current_a = _normalize_number(cur_match.group(1))
 
-        ang_match = angle_pattern.search(line)
+        ang_match = _ANGLE_RE.search(line)
         if ang_match and row.current_a is not None:
             row.current_angle_deg = _normalize_number(ang_match.group(1))
 
         # Voltage
-        if voltage_pattern.search(line):
-            volt_match = voltage_value_pattern.search(line)
+        if _VOLT_LABEL_RE.search(line):
+            volt_match = _VOLT_VALUE_RE.search(line)
             if volt_match:
                 row.voltage_v = _normalize_number(volt_match.group(1))
         else:
-            volt_match = voltage_value_pattern.search(line)
+            volt_match = _VOLT_VALUE_RE.search(line)
             if volt_match:
                 row.voltage_v = _normalize_number(volt_match.group(1))
         if ang_match and row.voltage_v is not None and row.current_angle_deg is None:
             row.voltage_angle_deg = _normalize_number(ang_match.group(1))
 
         # Impedance / resistance
-        imp_match = impedance_label_pattern.search(line) or impedance_unit_pattern.search(line)
+        imp_match = _IMP_LABEL_RE.search(line) or _IMP_UNIT_RE.search(line)
         if imp_match:
             row.impedance_ohm = _normalize_number(imp_match.group(1))
         else:
-            mo_matches = re.findall(r"(-?\d+(?:[.,]\d+)?)\s*m[Ω0o]", line, re.IGNORECASE)
+            mo_matches = _MO_FINDALL_RE.findall(line)
             if mo_matches:
                 row.impedance_ohm = _normalize_number(mo_matches[-1]) * 1e-3
             else:
-                o_matches = re.findall(r"(-?\d+(?:[.,]\d+)?)\s*Ω", line, re.IGNORECASE)
+                o_matches = _IMP_OHM_RE.findall(line)
                 if o_matches:
                     row.impedance_ohm = _normalize_number(o_matches[-1])
 
         if ang_match and row.impedance_ohm is not None and row.current_angle_deg is None:
             row.impedance_angle_deg = _normalize_number(ang_match.group(1))
 
-        key = (
-            row.distance_m or math.inf,
-            row.current_a,
-            row.voltage_v,
-            row.impedance_ohm,
-        )
-        if key in seen_keys:
-            continue
-        seen_keys.add(key)
-        rows.append(row)
+        _keep(row)
+
+    # Every parsed row is anchored on a distance, so the key is never None
+    rows.sort(key=attrgetter("distance_m"))
 
-    rows.sort(key=lambda r: r.distance_m if r.distance_m is not None else math.inf)
+    if not rows:
+        return rows
 
     # Fill missing or obviously wrong currents with median of reasonable currents
-    cur_candidates = [r.current_a for r in rows if r.current_a is not None and 0.01 < abs(r.current_a) < 0.3]
-    median_cur = float(np.median(cur_candidates)) if cur_candidates else None
-    if median_cur is not None:
-        for r in rows:
-            if r.current_a is None or abs(r.current_a) > 0.3:
-                r.current_a = median_cur
-                if r.current_angle_deg is None:
-                    r.current_angle_deg = 0.0
-            if r.current_a is not None and r.current_a < 0:
-                r.current_a = abs(r.current_a)
+    n = len(rows)
+    cur = np.fromiter((np.nan if r.current_a is None else r.current_a for r in rows), dtype=np.float64, count=n)
+    abs_cur = np.abs(cur)
+    reasonable = (abs_cur > 0.01) & (abs_cur < 0.3)
+    if reasonable.any():
+        median_cur = _median(cur[reasonable])
+        fill = np.isnan(cur) | (abs_cur > 0.3)
+        cur = np.where(fill, abs(median_cur), abs_cur)
+
         # Recompute impedance from V/I when missing or clearly off
-        for r in rows:
-            if r.voltage_v is not None and r.current_a not in (None, 0):
-                z_calc = abs(r.voltage_v / r.current_a)
-                if r.impedance_ohm is None or r.impedance_ohm <= 0 or abs(r.impedance_ohm - z_calc) / z_calc > 0.2:
-                    r.impedance_ohm = z_calc
-                    if r.voltage_angle_deg is not None and r.current_angle_deg is not None:
-                        r.impedance_angle_deg = r.voltage_angle_deg - r.current_angle_deg
+        volt = np.fromiter((np.nan if r.voltage_v is None else r.voltage_v for r in rows), dtype=np.float64, count=n)
+        imp = np.fromiter((np.nan if r.impedance_ohm is None else r.impedance_ohm for r in rows), dtype=np.float64, count=n)
+        with np.errstate(divide="ignore", invalid="ignore"):
+            z_calc = np.abs(volt / cur)
+            off = np.abs(imp - z_calc) / z_calc > 0.2
+        replace = ~np.isnan(volt) & (cur != 0) & (np.isnan(imp) | (imp <= 0) | off)
+
+        for i, r in enumerate(rows):
+            r.current_a = float(cur[i])
+            if fill[i] and r.current_angle_deg is None:
+                r.current_angle_deg = 0.0
+            if replace[i]:
+                r.impedance_ohm = float(z_calc[i])
+                if r.voltage_angle_deg is not None and r.current_angle_deg is not None:
+                    r.impedance_angle_deg = r.voltage_angle_deg - r.current_angle_deg
 
     return rows
 
 
-def _relative_spread(values: Sequence[float]) -> float:
+def _median(values: Sequence[float]) -> float:
+    """
+    Median of a short sequence.
+
+    OCR batches yield only a handful of currents/angles, where building a NumPy
+    array costs more than the median itself; tiny inputs use ``statistics``,
+    larger ones an O(n) ``np.partition``.
+    """
+    n = len(values)
+    if n < 8:
+        return float(statistics.median(values))
+    arr = np.array(values, dtype=np.float64)
+    k = n // 2
+    arr.partition(k)
+    if n % 2:
+        return float(arr[k])
+    return float(0.5 * (arr[k] + arr[:k].max()))
+
+
+def _relative_spread(values: Sequence[float], median: Optional[float] = None) -> float:
+    """Range of ``values`` relative to their median; pass ``median`` if already known."""
     if not values:
         return 0.0
-    med = float(np.median(values))
+    med = _median(values) if median is None else median
     if med == 0:
         return float("inf")
     return (max(values) - min(values)) / med
@@ -653,6 +984,12 @@ def build_items_from_rows(
 
     # Deduplicate impedance rows (exact-ish match)
     seen_imp: dict[float, Dict[str, object]] = {}
+
+    # Prefer item with angle, otherwise larger magnitude
+    def _score(it: Dict[str, object]) -> tuple[int, float]:
+        has_ang = 1 if it.get("value_angle_deg") is not None else 0
+        return (has_ang, float(it.get("value", 0.0)))
+
     for row in rows_with_dist:
         if row.impedance_ohm is not None and row.impedance_ohm > 0:
             dist_key = round(row.distance_m, 3)
@@ -666,10 +1003,6 @@ def build_items_from_rows(
                 "distance_to_current_injection_m": distance_to_current_injection_m,
             }
             prev = seen_imp.get(dist_key)
-            # Prefer item with angle, otherwise larger magnitude
-            def _score(it: Dict[str, object]) -> tuple[int, float]:
-                has_ang = 1 if it.get("value_angle_deg") is not None else 0
-                return (has_ang, float(it.get("value", 0.0)))
             if prev is None or _score(candidate) > _score(prev):
                 seen_imp[dist_key] = candidate
     impedance_items.extend(seen_imp.values())
@@ -686,11 +1019,11 @@ def build_items_from_rows(
     chosen_pairs = valid_pairs if valid_pairs else current_pairs
     if chosen_pairs:
         values = [val for val, _ in chosen_pairs]
-        spread = _relative_spread(values)
+        median_val = _median(values)
+        spread = _relative_spread(values, median_val)
         if spread <= 0.4:
-            median_val = float(np.median(values))
             angles = [ang for _, ang in chosen_pairs if ang is not None]
-            median_angle = float(np.median(angles)) if angles else None
+            median_angle = _median(angles) if angles else None
             earthing_currents.append(
                 {
                     "measurement_type": "earthing_current",
@@ -723,9 +1056,14 @@ def build_items_from_rows(
     if voltage_rows:
         min_delta = min(abs(r.distance_m - 1.0) for r in voltage_rows)
         candidates = [r for r in voltage_rows if abs(r.distance_m - 1.0) <= min_delta + 0.02 * max(1.0, r.distance_m)]
+        # Sweep in distance order: only recently accepted rows can be within the
+        # distance tolerance, so the backwards scan stops at the first one that is not.
+        candidates.sort(key=lambda r: (r.distance_m, r.voltage_v))
         for r in candidates:
             dup = False
-            for existing in seen_ptv:
+            for existing in reversed(seen_ptv):
+                if r.distance_m - existing.distance_m > 0.02 * max(r.distance_m, 1e-6):
+                    break
                 dist_tol = 0.02 * max(existing.distance_m, r.distance_m, 1e-6)
                 val_tol = 0.02 * max(existing.voltage_v, r.voltage_v, 1e-6)
                 ang_ok = True
@@ -757,6 +1095,79 @@ def build_items_from_rows(
     }
 
 
+def _ocr_images(
+    paths: Sequence[Path],
+    provider_model: str = "tesseract",
+    api_key_env: str = "OPENAI_API_KEY",
+    timeout: float = 120.0,
+    max_dim: int | None = 1400,
+    workers: Optional[int] = None,
+    use_cache: bool = False,
+) -> List[Union[str, Exception]]:
+    """
+    OCR several images concurrently, preserving input order.
+
+    Tesseract imports are split into one contiguous chunk per worker, each
+    OCR'd by a single-threaded engine run via ``_ocr_tesseract_batch``. Remote providers are I/O-bound and get one
+    request per image. Threads suffice in both cases because the work happens
+    in Tesseract subprocesses or HTTP calls, outside the GIL.
+
+    Parameters
+    ----------
+    paths : sequence[Path]
+        Image files.
+    provider_model : str, default "tesseract"
+        OCR backend, as for ``ocr_image``.
+    api_key_env : str, default "OPENAI_API_KEY"
+        Environment variable for API key (OpenAI).
+    timeout : float, default 120.0
+        Timeout for each Tesseract run or OCR HTTP call.
+    max_dim : int, optional
+        Max image dimension for remote uploads, as for ``ocr_image``.
+    workers : int, optional
+        Number of concurrent OCR jobs; defaults to ``os.cpu_count()``.
+    use_cache : bool, default False
+        Read and write the on-disk OCR cache, as for ``ocr_image``.
+
+    Returns
+    -------
+    list[str | Exception]
+        OCR text per image, or the exception raised for that image.
+    """
+    n_workers = max(1, min(workers or os.cpu_count() or 1, len(paths)))
+
+    if provider_model.lower() == "tesseract":
+        if len(paths) == 1:
+            try:
+                return [
+                    ocr_image(paths[0], timeout=timeout, max_dim=max_dim, use_cache=use_cache)
+                ]
+            except Exception as exc:
+                return [exc]
+        # Parallel engines each on one core beat one multi-threaded engine
+        size = -(-len(paths) // n_workers)
+        chunks = [list(paths[i : i + size]) for i in range(0, len(paths), size)]
+        run_batch = partial(_ocr_tesseract_batch, timeout=timeout, use_cache=use_cache)
+        with ThreadPoolExecutor(max_workers=len(chunks)) as pool:
+            return [text for part in pool.map(run_batch, chunks) for text in part]
+
+    def _one(path: Path) -> Union[str, Exception]:
+        try:
+            return ocr_image(
+                path,
+                provider_model=provider_model,
+                api_key_env=api_key_env,
+                timeout=timeout,
+                max_dim=max_dim,
+                use_cache=use_cache,
+            )
+        except Exception as exc:
+            return exc
+
+    with ThreadPoolExecutor(max_workers=n_workers) as pool:
+        return list(pool.map(_one, paths))
+
+
 def import_items_from_images(
     images_dir: Path,
     measurement_id: int,
@@ -767,12 +1178,14 @@ def import_items_from_images(
     api_key_env: str = "OPENAI_API_KEY",
     ocr_timeout: float = 120.0,
     ocr_max_dim: int | None = 1400,
+    ocr_workers: Optional[int] = None,
+    ocr_cache: bool = False,
 ) -> Dict[str, object]:
     """
     Batch process images in a directory to extract and import measurement items.
 
-    Iterates through images, runs OCR, parses the text, and creates MeasurementItem
-    records in the database. Supports directory-based frequency handling (if
+    Runs OCR over all images concurrently, then parses the text and creates
+    MeasurementItem records in the database image by image. Supports directory-based frequency handling (if
     subdirectories are named by frequency).
 
     Parameters
@@ -792,9 +1205,15 @@ def import_items_from_images(
     api_key_env : str, default "OPENAI_API_KEY"
         Environment variable for API key (for OpenAI).
     ocr_timeout : float, default 120.0
-        OCR request timeout.
+        Timeout in seconds for each Tesseract run or OCR request.
     ocr_max_dim : int, optional
-        Max image dimension for OCR; set 0/None to disable downscale.
+        Max image dimension for remote-provider uploads; set 0/None to disable
+        downscale. Tesseract input is capped by ``preprocess_image``.
+    ocr_workers : int, optional
+        Number of concurrent OCR jobs; defaults to the CPU count.
+    ocr_cache : bool, default False
+        Reuse OCR text from the per-user on-disk cache and store new results
+        there; see ``ocr_image``.
 
     Returns
     -------
@@ -839,15 +1258,21 @@ def import_items_from_images(
     skipped: List[str] = []
     parsed_rows: List[ParsedRow] = []
 
-    for img, freq in img_freq_pairs:
+    texts = _ocr_images(
+        [img for img, _ in img_freq_pairs],
+        provider_model=ocr_provider,
+        api_key_env=api_key_env,
+        timeout=ocr_timeout,
+        max_dim=ocr_max_dim,
+        workers=ocr_workers,
+        use_cache=ocr_cache,
+    )
+
+    # Parsing and inserts stay sequential (single DB session per create_item)
+    for (img, freq), text in zip(img_freq_pairs, texts):
         try:
-            text = ocr_image(
-                img,
-                provider_model=ocr_provider,
-                api_key_env=api_key_env,
-                timeout=ocr_timeout,
-                max_dim=ocr_max_dim,
-            )
+            if isinstance(text, Exception):
+                raise text
             rows = parse_measurement_rows(text)
             parsed_rows.extend(rows)
             # build and create items per image (frequency-specific)
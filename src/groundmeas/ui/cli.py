@@ -871,12 +871,17 @@ def cli_import_from_images(
     ocr_timeout: float = typer.Option(
         120.0,
         "--ocr-timeout",
-        help="Timeout in seconds for OCR HTTP calls (openai/ollama)",
+        help="Timeout in seconds for each Tesseract run or OCR HTTP call",
     ),
     ocr_max_dim: int = typer.Option(
         1400,
         "--ocr-max-dim",
-        help="Max image dimension (pixels) when sending to OCR provider; set 0 to disable downscale",
+        help="Max image dimension (pixels) for remote OCR uploads; set 0 to disable downscale",
+    ),
+    ocr_cache: bool = typer.Option(
+        False,
+        "--ocr-cache/--no-ocr-cache",
+        help="Reuse OCR text cached per user for identical images and settings",
     ),
     json_out: Optional[Path] = typer.Option(None, "--json-out", help="Write summary to JSON file"),
 ) -> None:
@@ -894,6 +899,7 @@ def cli_import_from_images(
         api_key_env=api_key_env,
         ocr_timeout=ocr_timeout,
         ocr_max_dim=ocr_max_dim or None,
+        ocr_cache=ocr_cache,
     )
 
     if json_out:
@@ -13,9 +13,9 @@ Provides functions to visualize:
 """
 
 import warnings
-from typing import List, Optional, Tuple, Union
+from functools import cache
+from typing import TYPE_CHECKING, List, Optional, Tuple, Union
 
-import matplotlib.pyplot as plt
 import numpy as np
 
 from ..services.analytics import (
@@ -28,10 +28,31 @@ from ..services.analytics import (
     DX_DEFAULT,
 )
 
+if TYPE_CHECKING:
+    from matplotlib.axes import Axes
+    from matplotlib.figure import Figure
+
+# Upper bound on drawn markers per line; dense curves show every n-th point
+_MAX_MARKERS = 50
+
+# Structured dtype for (frequency, value) curve points
+_CURVE_DTYPE = np.dtype([("f", np.float64), ("v", np.float64)])
+
+
+@cache
+def _plt():
+    """Import ``matplotlib.pyplot`` on first use to keep package import fast."""
+    import matplotlib.pyplot as plt
+
+    return plt
+
 
 def plot_imp_over_f(
-    measurement_ids: Union[int, List[int]], normalize_freq_hz: Optional[float] = None
-) -> plt.Figure:
+    measurement_ids: Union[int, List[int]],
+    normalize_freq_hz: Optional[float] = None,
+    ax: Optional["Axes"] = None,
+    tight: bool = True,
+) -> "Figure":
     """
     Plot earthing impedance versus frequency on one figure.
 
@@ -41,28 +62,44 @@ def plot_imp_over_f(
         Single measurement ID or list of IDs.
     normalize_freq_hz : float, optional
         Normalize each curve by its impedance at this frequency.
+    ax : matplotlib.axes.Axes, optional
+        Existing axes to draw into; a new figure is created when omitted.
+    tight : bool, default True
+        Run ``fig.tight_layout()`` before returning. Disable for batch
+        rendering where the extra text-measuring pass is not needed.
 
     Returns
     -------
     matplotlib.figure.Figure
-        Figure with one curve per measurement.
+        Figure with one curve per measurement (the parent of ``ax`` if given).
 
     Raises
     ------
     ValueError
         If normalization frequency is missing or no data is available.
+
+    Notes
+    -----
+    Both axes are logarithmic (the y-axis is linear when normalizing).
+    Impedance values <= 0 cannot be drawn on the log y-axis and are masked by
+    Matplotlib; a ``UserWarning`` names the affected measurement.
     """
     # Normalize input to list
     single = isinstance(measurement_ids, int)
     ids: List[int] = [measurement_ids] if single else list(measurement_ids)
 
-    # Create a single figure and axis
-    fig, ax = plt.subplots()
+    # Create a single figure and axis unless the caller supplied one
+    if ax is None:
+        fig, ax = _plt().subplots()
+    else:
+        fig = ax.get_figure()
+
+    # Retrieve all impedance-frequency maps up front in one query
+    imp_by_id = impedance_over_frequency(ids)
 
     plotted = False
     for mid in ids:
-        # Retrieve impedance-frequency map
-        freq_imp = impedance_over_frequency(mid)
+        freq_imp = imp_by_id.get(mid, {})
         if not freq_imp:
             warnings.warn(
                 f"No earthing_impedance data for measurement_id={mid}; skipping curve",
@@ -70,21 +107,38 @@ def plot_imp_over_f(
             )
             continue
 
-        # Sort frequencies
-        freqs = sorted(freq_imp.keys())
-        imps = [freq_imp[f] for f in freqs]
-
-        # Normalize if requested
+        # Validate the normalization baseline before building point lists
         if normalize_freq_hz is not None:
             baseline = freq_imp.get(normalize_freq_hz)
             if baseline is None:
                 raise ValueError(
                     f"Measurement {mid} has no impedance at {normalize_freq_hz} Hz for normalization"
                 )
-            imps = [val / baseline for val in imps]
+
+        # impedance_over_frequency keeps fetch order, so curves are ordered
+        # here and only here: one (frequency, impedance) array sorted by frequency
+        pts = np.fromiter(freq_imp.items(), dtype=_CURVE_DTYPE, count=len(freq_imp))
+        pts.sort(order="f")
+        freqs, imps = pts["f"], pts["v"]
+
+        # Normalize if requested; otherwise the log y-axis hides values <= 0
+        if normalize_freq_hz is not None:
+            imps = imps / baseline
+        elif (imps <= 0).any():
+            warnings.warn(
+                f"measurement_id={mid} has impedance values <= 0 that the log axis cannot show",
+                UserWarning,
+            )
 
         # Plot the curve
-        ax.plot(freqs, imps, marker="o", linestyle="-", label=f"ID {mid}")
+        ax.plot(
+            freqs,
+            imps,
+            marker="o",
+            markevery=max(1, len(freqs) // _MAX_MARKERS),
+            linestyle="-",
+            label=f"ID {mid}",
+        )
         plotted = True
 
     if not plotted:
@@ -108,13 +162,16 @@ def plot_imp_over_f(
         title += f" (Normalized @ {normalize_freq_hz} Hz)"
     ax.set_title(title)
 
-    # Grid and scientific tick formatting
+    # Grid and log-scaled axes (impedance data typically spans decades)
     ax.grid(True, which="both", linestyle="--", linewidth=0.5)
-    ax.ticklabel_format(axis="y", style="sci", scilimits=(0, 0))
+    ax.set_xscale("log")
+    if normalize_freq_hz is None:
+        ax.set_yscale("log")
 
     # Legend
     ax.legend()
-    fig.tight_layout()
+    if tight:
+        fig.tight_layout()
     return fig
 
 
@@ -122,7 +179,7 @@ def plot_rho_f_model(
     measurement_ids: List[int],
     rho_f: Tuple[float, float, float, float, float],
     rho: Union[float, List[float]] = 100,
-) -> plt.Figure:
+) -> "Figure":
     """
     Plot measured impedance and rho–f model curves.
 
@@ -175,7 +232,7 @@ def plot_rho_f_model(
 def plot_voltage_vt_epr(
     measurement_ids: Union[int, List[int]],
     frequency: float = 50.0,
-) -> plt.Figure:
+) -> "Figure":
     """
     Plot EPR and touch voltages (prospective and actual) as grouped bars.
 
@@ -199,7 +256,7 @@ def plot_voltage_vt_epr(
         data = {measurement_ids: data}
 
     # 2) prepare figure
-    fig, ax = plt.subplots()
+    fig, ax = _plt().subplots()
     x = np.arange(len(ids))
     width = 0.25
 
@@ -234,7 +291,7 @@ def plot_voltage_vt_epr(
 def plot_value_over_distance(
     measurement_ids: Union[int, List[int]],
     measurement_type: str = "earthing_impedance",
-) -> plt.Figure:
+) -> "Figure":
     """
     Plot value versus measurement distance for one or multiple measurements.
 
@@ -253,7 +310,7 @@ def plot_value_over_distance(
     single = isinstance(measurement_ids, int)
     ids: List[int] = [measurement_ids] if single else list(measurement_ids)
 
-    fig, ax = plt.subplots()
+    fig, ax = _plt().subplots()
     plotted = False
 
     for mid in ids:
@@ -262,10 +319,18 @@ def plot_value_over_distance(
             continue
 
         # Sort by distance
-        dists = sorted(dist_val.keys())
-        vals = [dist_val[d] for d in dists]
+        pairs = sorted(dist_val.items())
+        dists = [x for x, _ in pairs]
+        vals = [y for _, y in pairs]
 
-        ax.plot(dists, vals, marker="o", linestyle="-", label=f"ID {mid}")
+        ax.plot(
+            dists,
+            vals,
+            marker="o",
+            markevery=max(1, len(dists) // _MAX_MARKERS),
+            linestyle="-",
+            label=f"ID {mid}",
+        )
         plotted = True
 
     if not plotted:
@@ -289,7 +354,7 @@ def plot_soil_model(
     rho_layers: List[float],
     thicknesses_m: Optional[List[float]] = None,
     max_depth_m: Optional[float] = None,
-) -> plt.Figure:
+) -> "Figure":
     """
     Plot a layered soil model as a resistivity-vs-depth step curve.
 
@@ -315,7 +380,7 @@ def plot_soil_model(
     total_thickness = float(model.get("total_thickness_m", 0.0))
     plot_bottom = float(max_depth_m) if max_depth_m is not None else max(total_thickness, 1.0)
 
-    fig, ax = plt.subplots()
+    fig, ax = _plt().subplots()
     x_step: List[float] = []
     y_step: List[float] = []
     prev_rho: Optional[float] = None
@@ -360,7 +425,7 @@ def plot_soil_inversion(
     tol: float = 1e-4,
     initial_rho: Optional[List[float]] = None,
     initial_thicknesses: Optional[List[float]] = None,
-) -> plt.Figure:
+) -> "Figure":
     """
     Plot apparent resistivity data and the layered-earth inversion fit.
 
@@ -434,7 +499,7 @@ def plot_soil_inversion(
     if not obs or not pred:
         raise ValueError(f"No soil_resistivity data for measurement_id={measurement_id}")
 
-    fig, ax = plt.subplots()
+    fig, ax = _plt().subplots()
     ax.plot(
         [p["spacing_m"] for p in obs],
         [p["rho_ohm_m"] for p in obs],
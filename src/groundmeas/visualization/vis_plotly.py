@@ -5,6 +5,7 @@ groundmeas.vis_plotly
 Interactive Plotly visualizations for the dashboard.
 """
 
+import warnings
 from typing import List, Optional, Tuple, Union
 
 import plotly.graph_objects as go
@@ -48,6 +49,11 @@ def plot_imp_over_f_plotly(
     -------
     plotly.graph_objects.Figure
         Interactive impedance plot.
+
+    Notes
+    -----
+    Axes are logarithmic like ``plot_imp_over_f`` (linear y when normalizing);
+    impedance values <= 0 cannot be shown there and trigger a ``UserWarning``.
     """
     single = isinstance(measurement_ids, int)
     ids: List[int] = [measurement_ids] if single else list(measurement_ids)
@@ -59,14 +65,20 @@ def plot_imp_over_f_plotly(
         if not freq_imp:
             continue
 
-        freqs = sorted(freq_imp.keys())
-        imps = [freq_imp[f] for f in freqs]
+        pairs = sorted(freq_imp.items())
+        freqs = [x for x, _ in pairs]
+        imps = [y for _, y in pairs]
 
         if normalize_freq_hz is not None:
             baseline = freq_imp.get(normalize_freq_hz)
             if baseline is None:
                 continue  # Or raise error
             imps = [val / baseline for val in imps]
+        elif any(val <= 0 for val in imps):
+            warnings.warn(
+                f"measurement_id={mid} has impedance values <= 0 that the log axis cannot show",
+                UserWarning,
+            )
 
         fig.add_trace(go.Scatter(
             x=freqs,
@@ -89,9 +101,9 @@ def plot_imp_over_f_plotly(
         margin=dict(l=20, r=20, t=40, b=20),
     )
 
-    # Engineering notation
-    fig.update_yaxes(tickformat="s")
-    fig.update_xaxes(tickformat="s")
+    # Engineering notation on log axes (impedance data typically spans decades)
+    fig.update_yaxes(tickformat="s", type="linear" if normalize_freq_hz is not None else "log")
+    fig.update_xaxes(tickformat="s", type="log")
 
     return fig
 
@@ -0,0 +1,10 @@
+"""Small stubs shared across the test modules."""
+
+
+def raiser(exc):
+    """Return a stub that raises ``exc`` whatever it is called with."""
+
+    def _f(*args, **kwargs):
+        raise exc
+
+    return _f
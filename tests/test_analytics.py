@@ -1,11 +1,31 @@
 # tests/test_analytics.py
 
 import math
+import warnings
+from contextlib import contextmanager
+
 import pytest
 import numpy as np
 
 from groundmeas.services import analytics
 
+from tests.helpers import raiser
+
+
+@pytest.fixture(autouse=True)
+def _clear_analytics_caches():
+    analytics._select_rho_depths.cache_clear()
+    analytics._fit_rho_f.cache_clear()
+    yield
+
+
+@contextmanager
+def _captured_warnings():
+    """Record every warning raised in the block, whatever the active filters."""
+    with warnings.catch_warnings(record=True) as caught:
+        warnings.simplefilter("always")
+        yield caught
+
 
 # ─── distance_profile_value ─────────────────────────────────────────────────────
 
@@ -143,6 +163,15 @@ def test_distance_profile_requires_injection(monkeypatch):
         analytics.distance_profile_value(5, algorithm="62_percent")
 
 
+def test_distance_profile_rejects_unknown_algorithm_before_read(monkeypatch):
+    def fail_read(**_):
+        raise AssertionError("database should not be read")
+
+    monkeypatch.setattr(analytics, "read_items_by", fail_read)
+    with pytest.raises(ValueError, match="Unsupported algorithm 'median'"):
+        analytics.distance_profile_value(5, algorithm="median")
+
+
 def test_resolve_math_backend_env(monkeypatch):
     monkeypatch.setenv("GROUNDMEAS_MATH_BACKEND", "numpy")
     name, backend = analytics._resolve_math_backend("auto")
@@ -158,23 +187,71 @@ def test_resolve_math_backend_mlx_fallback(monkeypatch):
     assert backend is np
 
 
+def test_resolve_math_backend_cache_tracks_env(monkeypatch):
+    monkeypatch.setattr(analytics, "_MLX_AVAILABLE", False)
+    monkeypatch.setenv("GROUNDMEAS_MATH_BACKEND", "numpy")
+    assert analytics._resolve_math_backend("auto")[0] == "numpy"
+    monkeypatch.setenv("GROUNDMEAS_MATH_BACKEND", "mlx")
+    with pytest.warns(UserWarning):
+        assert analytics._resolve_math_backend("auto")[0] == "numpy"
+    with pytest.warns(UserWarning):
+        analytics._resolve_math_backend("auto")
+
+
 # ─── impedance_over_frequency ───────────────────────────────────────────────────
 
-def test_impedance_over_frequency_single_success(monkeypatch):
+@pytest.mark.parametrize(
+    "items, expected, warn_substr",
+    [
+        pytest.param(
+            [{"id": 1, "frequency_hz": 50, "value": 100}], {50.0: 100.0}, None, id="success"
+        ),
+        pytest.param(
+            [],
+            {},
+            "No earthing_impedance measurements found for measurement_id=1",
+            id="no_items",
+        ),
+        pytest.param(
+            [{"id": 7, "frequency_hz": None, "value": 5}],
+            {},
+            "missing frequency_hz; skipping",
+            id="missing_freq",
+        ),
+        pytest.param(
+            [{"id": 8, "frequency_hz": "bad", "value": "bad"}],
+            {},
+            "Could not convert item 8 to floats; skipping",
+            id="conversion_error",
+        ),
+    ],
+)
+def test_impedance_over_frequency_single(monkeypatch, items, expected, warn_substr):
     monkeypatch.setattr(
         analytics,
         "read_items_by",
-        lambda measurement_id, measurement_type: (
-            [{"id": 1, "frequency_hz": 50, "value": 100}], None
-        ),
+        lambda measurement_id, measurement_type: (items, None),
     )
-    out = analytics.impedance_over_frequency(1)
-    assert out == {50.0: 100.0}
+    if warn_substr is None:
+        out = analytics.impedance_over_frequency(1)
+    else:
+        with _captured_warnings() as w:
+            out = analytics.impedance_over_frequency(1)
+        assert issubclass(w[0].category, UserWarning)
+        assert warn_substr in str(w[0].message)
+        assert w[0].filename == __file__
+    assert out == expected
 
 
 def test_impedance_over_frequency_multiple_success(monkeypatch):
-    def fake_read(measurement_id, measurement_type):
-        return ([{"id": measurement_id, "frequency_hz": 1, "value": measurement_id}], None)
+    def fake_read(measurement_id__in, measurement_type):
+        return (
+            [
+                {"id": mid, "measurement_id": mid, "frequency_hz": 1, "value": mid}
+                for mid in measurement_id__in
+            ],
+            None,
+        )
     monkeypatch.setattr(analytics, "read_items_by", fake_read)
 
     out = analytics.impedance_over_frequency([1, 2])
@@ -184,131 +261,155 @@ def test_impedance_over_frequency_multiple_success(monkeypatch):
     }
 
 
-def test_impedance_over_frequency_read_error(monkeypatch):
-    monkeypatch.setattr(
-        analytics,
-        "read_items_by",
-        lambda measurement_id, measurement_type: (_ for _ in ()).throw(Exception("db fail")),
-    )
-    with pytest.raises(RuntimeError) as exc:
-        analytics.impedance_over_frequency(1)
-    assert "Failed to load impedance data for measurement 1" in str(exc.value)
+def test_impedance_over_frequency_dedupes_ids(monkeypatch):
+    calls = []
 
+    def fake_read(measurement_id__in, measurement_type):
+        calls.append(list(measurement_id__in))
+        return (
+            [
+                {"id": mid, "measurement_id": mid, "frequency_hz": 1, "value": mid}
+                for mid in measurement_id__in
+            ],
+            None,
+        )
+    monkeypatch.setattr(analytics, "read_items_by", fake_read)
 
-def test_impedance_over_frequency_no_items_warn(monkeypatch):
-    monkeypatch.setattr(
-        analytics,
-        "read_items_by",
-        lambda measurement_id, measurement_type: ([], None),
-    )
-    with pytest.warns(UserWarning) as w:
-        out = analytics.impedance_over_frequency(3)
-    assert "No earthing_impedance measurements found for measurement_id=3" in str(w.list[0].message)
-    assert out == {}
+    out = analytics.impedance_over_frequency([2, 1, 2])
+    assert calls == [[2, 1]]
+    assert out == {2: {1.0: 2.0}, 1: {1.0: 1.0}}
 
 
-def test_impedance_over_frequency_skip_missing_freq(monkeypatch):
-    monkeypatch.setattr(
-        analytics,
-        "read_items_by",
-        lambda measurement_id, measurement_type: ([{"id": 7, "frequency_hz": None, "value": 5}], None),
-    )
-    with pytest.warns(UserWarning) as w:
-        out = analytics.impedance_over_frequency(7)
-    assert "missing frequency_hz; skipping" in str(w.list[0].message)
-    assert out == {}
+def test_impedance_over_frequency_read_error(monkeypatch):
+    monkeypatch.setattr(analytics, "read_items_by", raiser(Exception("db fail")))
+    with pytest.raises(RuntimeError) as exc:
+        analytics.impedance_over_frequency(1)
+    assert "Failed to load impedance data for measurement 1" in str(exc.value)
 
 
-def test_impedance_over_frequency_skip_conversion_error(monkeypatch):
+def test_impedance_over_frequency_warns_once_per_batch(monkeypatch):
+    items = [
+        {"id": 1, "frequency_hz": 50, "value": 2.0},
+        {"id": 2, "frequency_hz": "bad", "value": 1.0},
+        {"id": 3, "frequency_hz": 60, "value": None},
+        {"id": 4, "frequency_hz": None, "value": 1.0},
+        {"id": 5, "frequency_hz": "70", "value": "3.5"},
+    ]
     monkeypatch.setattr(
         analytics,
         "read_items_by",
-        lambda measurement_id, measurement_type: ([{"id": 8, "frequency_hz": "bad", "value": "bad"}], None),
-    )
-    with pytest.warns(UserWarning) as w:
-        out = analytics.impedance_over_frequency(8)
-    assert "Could not convert item 8 to floats; skipping" in str(w.list[0].message)
-    assert out == {}
+        lambda measurement_id, measurement_type: (items, None),
+    )
+    with _captured_warnings() as w:
+        out = analytics.impedance_over_frequency(1)
+    assert all(issubclass(x.category, UserWarning) for x in w)
+    messages = [str(x.message) for x in w]
+    assert messages == [
+        "MeasurementItem id=4 missing frequency_hz; skipping",
+        "Could not convert item 2, 3 to floats; skipping",
+    ]
+    assert out == {50.0: 2.0, 70.0: 3.5}
 
 
 # ─── real_imag_over_frequency ──────────────────────────────────────────────────
 
-def test_real_imag_over_frequency_single_success(monkeypatch):
+@pytest.mark.parametrize(
+    "items, expected, warn_substr",
+    [
+        pytest.param(
+            [{"id": 1, "frequency_hz": 20, "value_real": 1.5, "value_imag": -2.5}],
+            {20.0: {"real": 1.5, "imag": -2.5}},
+            None,
+            id="success",
+        ),
+        pytest.param(
+            [{"id": 3, "frequency_hz": 3, "value_real": None, "value_imag": 7}],
+            {3.0: {"real": None, "imag": 7.0}},
+            None,
+            id="missing_r_or_i",
+        ),
+        pytest.param(
+            [],
+            {},
+            "No earthing_impedance measurements found for measurement_id=1",
+            id="no_items",
+        ),
+        pytest.param(
+            [{"id": 2, "frequency_hz": None, "value_real": 0, "value_imag": 0}],
+            {},
+            "missing frequency_hz; skipping",
+            id="missing_freq",
+        ),
+        pytest.param(
+            [{"id": 4, "frequency_hz": 4, "value_real": "bad", "value_imag": "0"}],
+            {},
+            "Could not convert real/imag for item 4; skipping",
+            id="conversion_error",
+        ),
+    ],
+)
+def test_real_imag_over_frequency_single(monkeypatch, items, expected, warn_substr):
     monkeypatch.setattr(
         analytics,
         "read_items_by",
-        lambda measurement_id, measurement_type: (
-            [{"id": 1, "frequency_hz": 20, "value_real": 1.5, "value_imag": -2.5}], None
-        ),
+        lambda measurement_id, measurement_type: (items, None),
     )
-    out = analytics.real_imag_over_frequency(1)
-    assert out == {20.0: {"real": 1.5, "imag": -2.5}}
+    if warn_substr is None:
+        out = analytics.real_imag_over_frequency(1)
+    else:
+        with _captured_warnings() as w:
+            out = analytics.real_imag_over_frequency(1)
+        assert issubclass(w[0].category, UserWarning)
+        assert warn_substr in str(w[0].message)
+    assert out == expected
 
 
 def test_real_imag_over_frequency_multiple_success(monkeypatch):
-    def fake_read(measurement_id, measurement_type):
-        return ([{"id": measurement_id, "frequency_hz": 2, "value_real": measurement_id * 1.0, "value_imag": measurement_id * -1.0}], None)
+    calls = []
+
+    def fake_read(measurement_id__in, measurement_type):
+        calls.append(list(measurement_id__in))
+        return (
+            [
+                {"id": mid, "measurement_id": mid, "frequency_hz": 2, "value_real": mid * 1.0, "value_imag": mid * -1.0}
+                for mid in measurement_id__in
+            ],
+            None,
+        )
     monkeypatch.setattr(analytics, "read_items_by", fake_read)
 
     out = analytics.real_imag_over_frequency([5, 6])
+    assert calls == [[5, 6]]
     assert out == {
         5: {2.0: {"real": 5.0, "imag": -5.0}},
         6: {2.0: {"real": 6.0, "imag": -6.0}},
     }
 
 
-def test_real_imag_over_frequency_missing_freq(monkeypatch):
-    monkeypatch.setattr(
-        analytics,
-        "read_items_by",
-        lambda measurement_id, measurement_type: ([{"id": 2, "frequency_hz": None, "value_real": 0, "value_imag": 0}], None),
-    )
-    with pytest.warns(UserWarning) as w:
-        out = analytics.real_imag_over_frequency(2)
-    assert "missing frequency_hz; skipping" in str(w.list[0].message)
-    assert out == {}
-
-
-def test_real_imag_over_frequency_missing_r_or_i(monkeypatch):
-    monkeypatch.setattr(
-        analytics,
-        "read_items_by",
-        lambda measurement_id, measurement_type: ([{"id": 3, "frequency_hz": 3, "value_real": None, "value_imag": 7}], None),
-    )
-    out = analytics.real_imag_over_frequency(3)
-    assert out == {3.0: {"real": None, "imag": 7.0}}
-
-
-def test_real_imag_over_frequency_conversion_error(monkeypatch):
-    monkeypatch.setattr(
-        analytics,
-        "read_items_by",
-        lambda measurement_id, measurement_type: ([{"id": 4, "frequency_hz": 4, "value_real": "bad", "value_imag": "0"}], None),
-    )
-    with pytest.warns(UserWarning) as w:
-        out = analytics.real_imag_over_frequency(4)
-    assert "Could not convert real/imag for item 4; skipping" in str(w.list[0].message)
-    assert out == {}
-
-
-def test_real_imag_over_frequency_no_items_warn(monkeypatch):
+def test_real_imag_over_frequency_summarizes_skips(monkeypatch):
+    items = [
+        {"id": 1, "frequency_hz": None},
+        {"id": 2, "frequency_hz": None},
+        {"id": 3, "frequency_hz": 5, "value_real": "bad", "value_imag": 0},
+        {"id": 4, "frequency_hz": 6, "value_real": 1, "value_imag": 2},
+    ]
     monkeypatch.setattr(
         analytics,
         "read_items_by",
-        lambda measurement_id, measurement_type: ([], None),
-    )
-    with pytest.warns(UserWarning) as w:
-        out = analytics.real_imag_over_frequency(9)
-    assert "No earthing_impedance measurements found for measurement_id=9" in str(w.list[0].message)
-    assert out == {}
+        lambda measurement_id, measurement_type: (items, None),
+    )
+    with _captured_warnings() as w:
+        out = analytics.real_imag_over_frequency(1)
+    assert all(issubclass(x.category, UserWarning) for x in w)
+    assert [str(x.message) for x in w] == [
+        "MeasurementItem id=1, 2 missing frequency_hz; skipping",
+        "Could not convert real/imag for item 3; skipping",
+    ]
+    assert out == {6.0: {"real": 1.0, "imag": 2.0}}
 
 
 def test_real_imag_over_frequency_read_error(monkeypatch):
-    monkeypatch.setattr(
-        analytics,
-        "read_items_by",
-        lambda measurement_id, measurement_type: (_ for _ in ()).throw(Exception("oops")),
-    )
+    monkeypatch.setattr(analytics, "read_items_by", raiser(Exception("oops")))
     with pytest.raises(RuntimeError) as exc:
         analytics.real_imag_over_frequency(1)
     assert "Failed to load impedance data for measurement 1" in str(exc.value)
@@ -317,20 +418,28 @@ def test_real_imag_over_frequency_read_error(monkeypatch):
 # ─── voltage_vt_epr ────────────────────────────────────────────────────────────
 
 def test_voltage_vt_epr_single(monkeypatch):
+    calls = []
+
     def fake_read_items_by(**filters):
-        mtype = filters.get("measurement_type")
-        if mtype == "earthing_impedance":
-            return ([{"value": 10.0}], [1])
-        if mtype == "earthing_current":
-            return ([{"value": 2.0}], [2])
-        if mtype == "prospective_touch_voltage":
-            return ([{"value": 4.0}, {"value": 6.0}], [3, 4])
-        if mtype == "touch_voltage":
-            return ([{"value": 2.0}], [5])
-        return ([], [])
+        calls.append(filters)
+        rows = [
+            ("earthing_impedance", 10.0),
+            ("earthing_current", 2.0),
+            ("prospective_touch_voltage", 4.0),
+            ("prospective_touch_voltage", 6.0),
+            ("touch_voltage", 2.0),
+        ]
+        items = [
+            {"measurement_id": 1, "measurement_type": mtype, "value": value}
+            for mtype, value in rows
+            if mtype in filters["measurement_type__in"]
+        ]
+        return (items, [1])
 
     monkeypatch.setattr(analytics, "read_items_by", fake_read_items_by)
     out = analytics.voltage_vt_epr(1, frequency=50.0)
+    assert len(calls) == 1
+    assert calls[0]["frequency_hz"] == 50.0
     assert out["epr"] == pytest.approx(10.0)
     assert out["vtp_min"] == pytest.approx(2.0)
     assert out["vtp_max"] == pytest.approx(3.0)
@@ -338,41 +447,79 @@ def test_voltage_vt_epr_single(monkeypatch):
     assert out["vt_max"] == pytest.approx(1.0)
 
 
+def test_voltage_vt_epr_read_error_warns_and_skips(monkeypatch):
+    monkeypatch.setattr(analytics, "read_items_by", raiser(Exception("db down")))
+    with _captured_warnings() as w:
+        out = analytics.voltage_vt_epr([1, 2], frequency=50.0)
+    assert out == {}
+    assert [str(x.message) for x in w] == [
+        f"Measurement {mid}: missing earthing_impedance@50.0Hz → skipping" for mid in (1, 2)
+    ]
+
+
 # ─── value_over_distance ───────────────────────────────────────────────────────
 
 def test_value_over_distance(monkeypatch):
+    def fake_arrays(columns, order_by, measurement_id__in, measurement_type):
+        assert measurement_type == "earthing_impedance"
+        return {
+            "measurement_id": np.array([1.0, 1.0, 1.0, 2.0]),
+            "measurement_distance_m": np.array([1.0, 2.0, np.nan, 5.0]),
+            "value": np.array([2.0, 4.0, 9.0, 7.0]),
+        }
+
+    monkeypatch.setattr(analytics, "read_item_arrays", fake_arrays)
+    out = analytics.value_over_distance(1, measurement_type="earthing_impedance")
+    assert out == {1.0: 2.0, 2.0: 4.0}
+    out = analytics.value_over_distance([1, 2, 3])
+    assert out == {1: {1.0: 2.0, 2.0: 4.0}, 2: {5.0: 7.0}, 3: {}}
+
+
+def test_value_over_distance_skips_non_numeric_rows(monkeypatch):
     monkeypatch.setattr(
         analytics,
-        "read_items_by",
-        lambda measurement_id, measurement_type: (
-            [
-                {"measurement_distance_m": 1.0, "value": 2.0},
-                {"measurement_distance_m": 2.0, "value": 4.0},
-            ],
-            None,
-        ),
+        "read_item_arrays",
+        lambda columns, order_by, measurement_id__in, measurement_type: {
+            "measurement_id": np.array([1.0, 1.0, 1.0]),
+            "measurement_distance_m": np.array([1.0, "far", 3.0], dtype=object),
+            "value": np.array([2.0, 4.0, None], dtype=object),
+        },
     )
-    out = analytics.value_over_distance(1, measurement_type="earthing_impedance")
-    assert out == {1.0: 2.0, 2.0: 4.0}
+    assert analytics.value_over_distance(1) == {1.0: 2.0}
 
 
 def test_value_over_distance_detailed(monkeypatch):
     monkeypatch.setattr(
         analytics,
-        "read_items_by",
-        lambda measurement_id, measurement_type: (
-            [
-                {"measurement_distance_m": 1.0, "value": 2.0, "frequency_hz": 50.0},
-                {"measurement_distance_m": 2.0, "value": 4.0, "frequency_hz": None},
-            ],
-            None,
-        ),
+        "read_item_columns",
+        lambda columns, order_by, measurement_id__in, measurement_type: [
+            (1, 1.0, 2.0, 50.0),
+            (1, 2.0, 4.0, None),
+            (1, None, 5.0, 50.0),
+            (2, 3.0, 6.0, 20.0),
+        ],
     )
     out = analytics.value_over_distance_detailed(1)
     assert out == [
         {"distance": 1.0, "value": 2.0, "frequency": 50.0},
         {"distance": 2.0, "value": 4.0, "frequency": None},
     ]
+    out = analytics.value_over_distance_detailed([1, 2])
+    assert out[2] == [{"distance": 3.0, "value": 6.0, "frequency": 20.0}]
+
+
+def test_value_over_distance_detailed_skips_malformed_rows(monkeypatch):
+    monkeypatch.setattr(
+        analytics,
+        "read_item_columns",
+        lambda columns, order_by, measurement_id__in, measurement_type: [
+            (1, "far", 2.0, 50.0),
+            (1, 2.0, 4.0, "fifty"),
+            (1, 3.0, 6.0, 50.0),
+        ],
+    )
+    out = analytics.value_over_distance_detailed(1)
+    assert out == [{"distance": 3.0, "value": 6.0, "frequency": 50.0}]
 
 
 # ─── _current_item_to_complex ──────────────────────────────────────────────────
@@ -390,6 +537,20 @@ def test_current_item_to_complex_polar():
     assert out.imag == pytest.approx(2.0, rel=1e-6)
 
 
+def test_current_items_to_complex_array_matches_scalar():
+    items = [
+        {"value_real": 1.0, "value_imag": 2.0},
+        {"value_real": 3.0},
+        {"value": 2.0, "value_angle_deg": 90.0},
+        {"value": 4.0},
+    ]
+    out = analytics._current_items_to_complex_array(items)
+    expected = [analytics._current_item_to_complex(it) for it in items]
+    assert out == pytest.approx(expected)
+    with pytest.raises(ValueError, match="id=9 has no current value"):
+        analytics._current_items_to_complex_array([{"id": 9}])
+
+
 # ─── rho_f_model ────────────────────────────────────────────────────────────────
 
 def test_rho_f_model_no_soil_data(monkeypatch):
@@ -397,7 +558,7 @@ def test_rho_f_model_no_soil_data(monkeypatch):
     monkeypatch.setattr(
         analytics,
         "read_items_by",
-        lambda measurement_id, measurement_type: ([], None),
+        lambda measurement_id__in, measurement_type: ([], None),
     )
     with pytest.raises(ValueError) as exc:
         analytics.rho_f_model([1])
@@ -409,8 +570,8 @@ def test_rho_f_model_no_overlap(monkeypatch):
     monkeypatch.setattr(
         analytics,
         "read_items_by",
-        lambda measurement_id, measurement_type: (
-            [{"id": 1, "measurement_distance_m": 1.0, "value": 10.0}], None
+        lambda measurement_id__in, measurement_type: (
+            [{"id": 1, "measurement_id": 1, "measurement_distance_m": 1.0, "value": 10.0}], None
         ),
     )
     with pytest.raises(ValueError) as exc:
@@ -427,20 +588,49 @@ def test_rho_f_model_least_squares_error(monkeypatch):
     monkeypatch.setattr(
         analytics,
         "read_items_by",
-        lambda measurement_id, measurement_type: (
-            [{"id": 1, "measurement_distance_m": 2.0, "value": 3.0}], None
+        lambda measurement_id__in, measurement_type: (
+            [{"id": 1, "measurement_id": 1, "measurement_distance_m": 2.0, "value": 3.0}], None
         ),
     )
-    monkeypatch.setattr(
-        np.linalg,
-        "lstsq",
-        lambda *args, **kwargs: (_ for _ in ()).throw(Exception("bad solve")),
-    )
+    monkeypatch.setattr(analytics, "_lstsq", raiser(Exception("bad solve")))
     with pytest.raises(RuntimeError) as exc:
         analytics.rho_f_model([1])
     assert "Failed to solve rho-f least-squares problem" in str(exc.value)
 
 
+def test_rho_f_model_recovers_coefficients(monkeypatch):
+    k1, k2, k3, k4, k5 = 0.5, 0.01, 0.02, 0.001, -0.002
+    rhos = {1: 100.0, 2: 250.0}
+    freqs = [20.0, 50.0, 100.0, 200.0]
+    rimap = {
+        mid: {
+            f: {"real": k1 * rho + k2 * f + k4 * rho * f, "imag": k3 * f + k5 * rho * f}
+            for f in freqs
+        }
+        for mid, rho in rhos.items()
+    }
+    monkeypatch.setattr(analytics, "real_imag_over_frequency", lambda ids: rimap)
+    calls = []
+
+    def fake_read(measurement_id__in, measurement_type):
+        calls.append(list(measurement_id__in))
+        return (
+            [
+                {"id": mid, "measurement_id": mid, "measurement_distance_m": 1.0, "value": rhos[mid]}
+                for mid in measurement_id__in
+            ],
+            None,
+        )
+
+    monkeypatch.setattr(analytics, "read_items_by", fake_read)
+    out = analytics.rho_f_model([1, 2])
+    assert out == pytest.approx((k1, k2, k3, k4, k5))
+    assert analytics.rho_f_model([1, 2]) == out
+    assert analytics._fit_rho_f.cache_info().hits == 1
+    assert analytics._select_rho_depths.cache_info().hits == 1
+    assert calls == [[1, 2], [1, 2]]
+
+
 # ─── soil resistivity + multilayer model ───────────────────────────────────────
 
 def test_soil_resistivity_profile_wenner_resistance(monkeypatch):
@@ -485,6 +675,30 @@ def test_soil_resistivity_profile_schlumberger_resistance(monkeypatch):
     assert out[5.0] == pytest.approx(math.pi * 99.0, rel=1e-6)
 
 
+def test_soil_resistivity_profile_summarizes_skips(monkeypatch):
+    items = [
+        {"id": 1, "measurement_distance_m": None, "value": 1.0},
+        {"id": 2, "measurement_distance_m": 2.0, "value": None},
+        {"id": 3, "measurement_distance_m": -1.0, "value": 1.0},
+        {"id": 4, "measurement_distance_m": 2.0, "value": 5.0, "unit": "ohm"},
+    ]
+    monkeypatch.setattr(
+        analytics,
+        "read_items_by",
+        lambda measurement_id, measurement_type: (items, None),
+    )
+    with _captured_warnings() as w:
+        out = analytics.soil_resistivity_profile(
+            1, method="wenner", value_kind="resistance"
+        )
+    assert all(issubclass(x.category, UserWarning) for x in w)
+    assert [str(x.message) for x in w] == [
+        "MeasurementItem id=1, 2 missing spacing or value; skipping",
+        "MeasurementItem id=3 has invalid spacing; skipping",
+    ]
+    assert list(out) == [1.0]
+
+
 def test_multilayer_soil_model_three_layers():
     model = analytics.multilayer_soil_model(
         rho_layers=[100.0, 300.0, 50.0],
@@ -538,6 +752,28 @@ def test_invert_layered_earth_two_layers():
     assert result["thicknesses_m"][0] == pytest.approx(2.0, rel=2e-1)
 
 
+def test_invert_layered_earth_scipy_solver():
+    pytest.importorskip("scipy")
+    spacings = [1.0, 2.0, 4.0, 8.0, 16.0]
+    rho_obs = analytics.layered_earth_forward(
+        spacings, [100.0, 20.0], thicknesses_m=[2.0], method="wenner"
+    )
+
+    result = analytics.invert_layered_earth(
+        spacings_m=spacings,
+        rho_obs=rho_obs,
+        layers=2,
+        initial_rho=[80.0, 30.0],
+        initial_thicknesses=[1.5],
+        solver="scipy",
+    )
+    assert result["rho_layers"][0] == pytest.approx(100.0, rel=1e-2)
+    assert result["rho_layers"][1] == pytest.approx(20.0, rel=1e-1)
+    assert result["misfit"]["rmse_log"] < 1e-3
+    with pytest.raises(ValueError):
+        analytics.invert_layered_earth(spacings, rho_obs, solver="bogus")
+
+
 def test_invert_soil_resistivity_layers_from_items(monkeypatch):
     monkeypatch.setattr(
         analytics,
@@ -564,47 +800,49 @@ def test_invert_soil_resistivity_layers_from_items(monkeypatch):
 # ─── shield_currents_for_location ───────────────────────────────────────────────
 
 
-def test_shield_currents_for_location_collects(monkeypatch):
-    def fake_read_measurements_by(location_id):
-        return (
-            [
+_SHIELD_COLLECT_MEASUREMENTS = (
+    [
+        {
+            "id": 10,
+            "items": [
                 {
-                    "id": 10,
-                    "items": [
-                        {
-                            "id": 1,
-                            "measurement_type": "shield_current",
-                            "frequency_hz": 50.0,
-                            "value": 5.0,
-                            "value_angle_deg": 0.0,
-                            "unit": "A",
-                        },
-                        {
-                            "id": 2,
-                            "measurement_type": "earthing_current",
-                            "value": 1.0,
-                            "unit": "A",
-                        },
-                    ],
+                    "id": 1,
+                    "measurement_type": "shield_current",
+                    "frequency_hz": 50.0,
+                    "value": 5.0,
+                    "value_angle_deg": 0.0,
+                    "unit": "A",
                 },
                 {
-                    "id": 11,
-                    "items": [
-                        {
-                            "id": 3,
-                            "measurement_type": "shield_current",
-                            "frequency_hz": 50.0,
-                            "value_real": 1.0,
-                            "value_imag": 1.0,
-                            "unit": "A",
-                        }
-                    ],
+                    "id": 2,
+                    "measurement_type": "earthing_current",
+                    "value": 1.0,
+                    "unit": "A",
                 },
             ],
-            [10, 11],
-        )
+        },
+        {
+            "id": 11,
+            "items": [
+                {
+                    "id": 3,
+                    "measurement_type": "shield_current",
+                    "frequency_hz": 50.0,
+                    "value_real": 1.0,
+                    "value_imag": 1.0,
+                    "unit": "A",
+                }
+            ],
+        },
+    ],
+    [10, 11],
+)
+
 
-    monkeypatch.setattr(analytics, "read_measurements_by", fake_read_measurements_by)
+def test_shield_currents_for_location_collects(monkeypatch):
+    monkeypatch.setattr(
+        analytics, "read_measurements_by", lambda location_id: _SHIELD_COLLECT_MEASUREMENTS
+    )
 
     out = analytics.shield_currents_for_location(5, frequency_hz=50.0)
     assert [c["id"] for c in out] == [1, 3]
@@ -623,57 +861,91 @@ def test_shield_currents_for_location_warns(monkeypatch):
 
 
 def test_shield_currents_for_location_error(monkeypatch):
-    monkeypatch.setattr(
-        analytics,
-        "read_measurements_by",
-        lambda location_id: (_ for _ in ()).throw(Exception("db down")),
-    )
+    monkeypatch.setattr(analytics, "read_measurements_by", raiser(Exception("db down")))
     with pytest.raises(RuntimeError):
         analytics.shield_currents_for_location(1)
 
 
+def test_shield_currents_for_location_reads_fresh_data(monkeypatch):
+    calls = []
+
+    def fake_read(location_id):
+        calls.append(location_id)
+        return (
+            [{"id": 1, "items": [{"id": 3, "measurement_type": "shield_current", "value": 2.0}]}],
+            [1],
+        )
+
+    monkeypatch.setattr(analytics, "read_measurements_by", fake_read)
+    analytics.shield_currents_for_location(7)
+    analytics.shield_currents_for_location(7)
+    assert calls == [7, 7]
+
+
 # ─── calculate_split_factor ─────────────────────────────────────────────────────
 
 
-def test_calculate_split_factor_success(monkeypatch):
+def _earth_fault_reply(item_id, value):
+    item = {
+        "id": item_id,
+        "measurement_type": "earth_fault_current",
+        "value": value,
+        "value_angle_deg": 0.0,
+        "unit": "A",
+    }
+    return [item], [item_id]
+
+
+def _polar_shield(item_id, value):
+    return {
+        "id": item_id,
+        "measurement_type": "shield_current",
+        "value": value,
+        "value_angle_deg": 0.0,
+        "unit": "A",
+    }
+
+
+_SPLIT_SUCCESS_READS = {
+    "earth_fault_current": _earth_fault_reply(200, 100.0),
+    "shield_current": (
+        [
+            _polar_shield(1, 30.0),
+            {
+                "id": 2,
+                "measurement_type": "shield_current",
+                "value_real": 10.0,
+                "value_imag": 0.0,
+                "unit": "A",
+            },
+        ],
+        [1, 2],
+    ),
+}
+_SPLIT_MISSING_READS = {
+    "earth_fault_current": _earth_fault_reply(50, 50.0),
+    "shield_current": ([_polar_shield(2, 10.0)], [2]),
+}
+_SPLIT_ZERO_EARTH_READS = {
+    "earth_fault_current": _earth_fault_reply(1, 0.0),
+    "shield_current": ([_polar_shield(2, 1.0)], [2]),
+}
+
+
+def _reads_by_type(replies):
+    """Fake ``read_items_by`` answering from prebuilt replies per measurement_type."""
+
     def fake_read_items_by(**filters):
-        if filters.get("measurement_type") == "earth_fault_current":
-            return (
-                [
-                    {
-                        "id": filters.get("id"),
-                        "measurement_type": "earth_fault_current",
-                        "value": 100.0,
-                        "value_angle_deg": 0.0,
-                        "unit": "A",
-                    }
-                ],
-                [filters.get("id")],
-            )
-        if filters.get("measurement_type") == "shield_current":
-            ids = filters.get("id__in", [])
-            return (
-                [
-                    {
-                        "id": ids[0],
-                        "measurement_type": "shield_current",
-                        "value": 30.0,
-                        "value_angle_deg": 0.0,
-                        "unit": "A",
-                    },
-                    {
-                        "id": ids[1],
-                        "measurement_type": "shield_current",
-                        "value_real": 10.0,
-                        "value_imag": 0.0,
-                        "unit": "A",
-                    },
-                ],
-                ids,
-            )
-        raise AssertionError("unexpected filters")
+        try:
+            return replies[filters.get("measurement_type")]
+        except KeyError:
+            raise AssertionError("unexpected filters") from None
 
-    monkeypatch.setattr(analytics, "read_items_by", fake_read_items_by)
+    return fake_read_items_by
+
+
+def test_calculate_split_factor_success(monkeypatch):
+    monkeypatch.setattr(analytics, "read_items_by", _reads_by_type(_SPLIT_SUCCESS_READS))
 
     result = analytics.calculate_split_factor(200, [1, 2])
     assert result["split_factor"] == pytest.approx(0.6)
@@ -682,36 +954,7 @@ def test_calculate_split_factor_success(monkeypatch):
 
 
 def test_calculate_split_factor_warns_missing(monkeypatch):
-    def fake_read_items_by(**filters):
-        if filters.get("measurement_type") == "earth_fault_current":
-            return (
-                [
-                    {
-                        "id": 50,
-                        "measurement_type": "earth_fault_current",
-                        "value": 50.0,
-                        "value_angle_deg": 0.0,
-                        "unit": "A",
-                    }
-                ],
-                [50],
-            )
-        if filters.get("measurement_type") == "shield_current":
-            return (
-                [
-                    {
-                        "id": 2,
-                        "measurement_type": "shield_current",
-                        "value": 10.0,
-                        "value_angle_deg": 0.0,
-                        "unit": "A",
-                    }
-                ],
-                [2],
-            )
-        raise AssertionError("unexpected filters")
-
-    monkeypatch.setattr(analytics, "read_items_by", fake_read_items_by)
+    monkeypatch.setattr(analytics, "read_items_by", _reads_by_type(_SPLIT_MISSING_READS))
 
     with pytest.warns(UserWarning):
         result = analytics.calculate_split_factor(50, [1, 2])
@@ -720,36 +963,7 @@ def test_calculate_split_factor_warns_missing(monkeypatch):
 
 
 def test_calculate_split_factor_zero_earth_current(monkeypatch):
-    def fake_read_items_by(**filters):
-        if filters.get("measurement_type") == "earth_fault_current":
-            return (
-                [
-                    {
-                        "id": 1,
-                        "measurement_type": "earth_fault_current",
-                        "value": 0.0,
-                        "value_angle_deg": 0.0,
-                        "unit": "A",
-                    }
-                ],
-                [1],
-            )
-        if filters.get("measurement_type") == "shield_current":
-            return (
-                [
-                    {
-                        "id": 2,
-                        "measurement_type": "shield_current",
-                        "value": 1.0,
-                        "value_angle_deg": 0.0,
-                        "unit": "A",
-                    }
-                ],
-                [2],
-            )
-        raise AssertionError("unexpected filters")
-
-    monkeypatch.setattr(analytics, "read_items_by", fake_read_items_by)
+    monkeypatch.setattr(analytics, "read_items_by", _reads_by_type(_SPLIT_ZERO_EARTH_READS))
 
     with pytest.raises(ValueError):
         analytics.calculate_split_factor(1, [2])
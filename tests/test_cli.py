@@ -7,10 +7,93 @@ import typer
 
 from groundmeas.ui import cli
 
+from tests.helpers import raiser
+
+
+# Serialized JSON inputs, built once at import
+_CONFIG_JSON = json.dumps({"db_path": "cfg.db"})
+_MEASUREMENT_JSON = json.dumps({"method": "wenner", "asset_type": "substation"})
+_MEASUREMENT_WITH_ITEM_JSON = json.dumps(
+    {"method": "wenner", "asset_type": "substation", "items": [{"value": 1}]}
+)
+_TWO_ITEMS_JSON = json.dumps([{"value": 1}, {"value": 2}])
+_STRING_JSON = json.dumps("string")
+
 
 def _seq(values):
-    iterator = iter(values)
-    return lambda *args, **kwargs: next(iterator)
+    """Stub returning ``values`` one per call; raises StopIteration when exhausted."""
+    values = tuple(values)
+    position = [0]
+
+    def _next(*args, **kwargs):
+        index = position[0]
+        if index >= len(values):
+            raise StopIteration
+        position[0] = index + 1
+        return values[index]
+
+    return _next
+
+
+class _CliStubs:
+    """Install the usual ``cli`` stubs through a test's ``monkeypatch``."""
+
+    def __init__(self, monkeypatch):
+        self._monkeypatch = monkeypatch
+
+    def set(self, **stubs):
+        for name, stub in stubs.items():
+            self._monkeypatch.setattr(cli, name, stub)
+
+    def prompts(self, text=(), floats=(), choices=()):
+        """Answer text, float and choice prompts from the given sequences."""
+        self.set(
+            _prompt_text=_seq(text),
+            _prompt_float=_seq(floats),
+            _prompt_choice=_seq(choices),
+        )
+
+    def suggestions(self, locations=()):
+        """Stub the ``_existing_*`` lookups used for prompt suggestions."""
+        self.set(
+            _existing_locations=lambda: list(locations),
+            _existing_measurement_values=lambda field: [],
+            _existing_item_values=lambda field, measurement_type=None: [],
+            _existing_item_units=lambda measurement_type: [],
+        )
+
+
+@pytest.fixture
+def patch_cli(monkeypatch):
+    return _CliStubs(monkeypatch)
+
+
+class _MemoryPath:
+    """In-memory stand-in for an output ``Path`` that is written with ``write_text``."""
+
+    def __init__(self, name):
+        self.name = name
+        self.text = None
+
+    def write_text(self, data, *args, **kwargs):
+        self.text = data
+        return len(data)
+
+    def read_text(self, *args, **kwargs):
+        return self.text
+
+    def __str__(self):
+        return self.name
+
+
+class _RecordingFig:
+    """Figure stub that records ``savefig`` targets instead of writing images."""
+
+    def __init__(self):
+        self.saved = []
+
+    def savefig(self, path):
+        self.saved.append(path)
 
 
 def test_resolve_db_uses_arg(tmp_path, monkeypatch):
@@ -20,7 +103,7 @@ def test_resolve_db_uses_arg(tmp_path, monkeypatch):
 
 def test_resolve_db_uses_config(tmp_path, monkeypatch):
     cfg = tmp_path / "cfg.json"
-    cfg.write_text(json.dumps({"db_path": "cfg.db"}))
+    cfg.write_text(_CONFIG_JSON)
     monkeypatch.setattr(cli, "CONFIG_PATH", cfg)
     assert cli._resolve_db(None) == "cfg.db"
 
@@ -38,29 +121,19 @@ def test_save_default_db(tmp_path, monkeypatch):
     assert json.loads(cfg.read_text())["db_path"] == "x.db"
 
 
+_MEASUREMENTS_AB = (
+    {"location": {"name": "A"}, "operator": "Op1", "voltage_level_kv": 10},
+    {"location": {"name": "B"}, "operator": "Op2", "voltage_level_kv": 20},
+)
+_ITEMS_OHM_A = (
+    {"unit": "ohm", "frequency_hz": 50},
+    {"unit": "A", "frequency_hz": 60},
+)
+
+
 def test_existing_helpers(monkeypatch):
-    monkeypatch.setattr(
-        cli,
-        "read_measurements_by",
-        lambda **kwargs: (
-            [
-                {"location": {"name": "A"}, "operator": "Op1", "voltage_level_kv": 10},
-                {"location": {"name": "B"}, "operator": "Op2", "voltage_level_kv": 20},
-            ],
-            None,
-        ),
-    )
-    monkeypatch.setattr(
-        cli,
-        "read_items_by",
-        lambda **kwargs: (
-            [
-                {"unit": "ohm", "frequency_hz": 50},
-                {"unit": "A", "frequency_hz": 60},
-            ],
-            None,
-        ),
-    )
+    monkeypatch.setattr(cli, "read_measurements_by", lambda **kwargs: (list(_MEASUREMENTS_AB), None))
+    monkeypatch.setattr(cli, "read_items_by", lambda **kwargs: (list(_ITEMS_OHM_A), None))
     assert cli._existing_locations() == ["A", "B"]
     assert cli._existing_measurement_values("operator") == ["Op1", "Op2"]
     assert cli._existing_item_units("earthing_impedance") == ["A", "ohm"]
@@ -68,8 +141,8 @@ def test_existing_helpers(monkeypatch):
 
 
 def test_existing_helpers_error(monkeypatch):
-    monkeypatch.setattr(cli, "read_measurements_by", lambda **kwargs: (_ for _ in ()).throw(Exception("fail")))
-    monkeypatch.setattr(cli, "read_items_by", lambda **kwargs: (_ for _ in ()).throw(Exception("fail")))
+    monkeypatch.setattr(cli, "read_measurements_by", raiser(Exception("fail")))
+    monkeypatch.setattr(cli, "read_items_by", raiser(Exception("fail")))
     assert cli._existing_locations() == []
     assert cli._existing_measurement_values("operator") == []
     assert cli._existing_item_units("earthing_impedance") == []
@@ -130,8 +203,8 @@ def test_load_item_success(monkeypatch):
     assert cli._load_item(1)["id"] == 1
 
 
-def test_dump_or_print_json(tmp_path):
-    out = tmp_path / "out.json"
+def test_dump_or_print_json():
+    out = _MemoryPath("out.json")
     cli._dump_or_print({"a": 1}, out)
     assert json.loads(out.read_text()) == {"a": 1}
 
@@ -167,18 +240,12 @@ def test_connect_callback(tmp_path, monkeypatch, capsys):
     assert f"Connected to {db_path}" in out
 
 
-def test_add_measurement(monkeypatch, capsys):
-    monkeypatch.setattr(cli, "_existing_locations", lambda: ["Site"])
-    monkeypatch.setattr(cli, "_existing_measurement_values", lambda field: [])
-    monkeypatch.setattr(cli, "_existing_item_values", lambda field, measurement_type=None: [])
-    monkeypatch.setattr(cli, "_existing_item_units", lambda measurement_type: [])
-
-    monkeypatch.setattr(cli, "_prompt_text", _seq(["Site", "desc", "op", "ohm", "item desc"]))
-    monkeypatch.setattr(cli, "_prompt_float", _seq([1.0, 2.0, 3.0, 10.0, 0.5, 50.0, 100.0, 0.0, 1.0, 2.0, 0.1]))
-    monkeypatch.setattr(
-        cli,
-        "_prompt_choice",
-        _seq(["staged_fault_test", "cable", "earthing_impedance", "magnitude_angle", "done"]),
+def test_add_measurement(patch_cli, capsys):
+    patch_cli.suggestions(locations=["Site"])
+    patch_cli.prompts(
+        text=["Site", "desc", "op", "ohm", "item desc"],
+        floats=[1.0, 2.0, 3.0, 10.0, 0.5, 50.0, 100.0, 0.0, 1.0, 2.0, 0.1],
+        choices=["staged_fault_test", "cable", "earthing_impedance", "magnitude_angle", "done"],
     )
 
     created = {"measurement": None, "items": []}
@@ -191,12 +258,10 @@ def test_add_measurement(monkeypatch, capsys):
         created["items"].append(item)
         return 11
 
-    monkeypatch.setattr(cli, "create_measurement", fake_create_measurement)
-    monkeypatch.setattr(cli, "create_item", fake_create_item)
-    monkeypatch.setattr(
-        cli,
-        "read_measurements_by",
-        lambda **kwargs: ([{"id": 7, "items": created["items"]}], None),
+    patch_cli.set(
+        create_measurement=fake_create_measurement,
+        create_item=fake_create_item,
+        read_measurements_by=lambda **kwargs: ([{"id": 7, "items": created["items"]}], None),
     )
 
     cli.add_measurement()
@@ -246,75 +311,80 @@ def test_cli_delete_item_not_found(monkeypatch):
         cli.cli_delete_item(5, force=True)
 
 
-def test_add_item(monkeypatch):
-    monkeypatch.setattr(cli, "_prompt_choice", _seq(["earthing_impedance", "magnitude_angle"]))
-    monkeypatch.setattr(cli, "_prompt_float", _seq([50.0, 10.0, 0.0, 1.0, 2.0, 0.1]))
-    monkeypatch.setattr(cli, "_prompt_text", _seq(["ohm", "desc"]))
-    monkeypatch.setattr(cli, "_existing_item_values", lambda field, measurement_type=None: [])
-    monkeypatch.setattr(cli, "_existing_item_units", lambda measurement_type: [])
-    monkeypatch.setattr(cli, "create_item", lambda item, measurement_id: 1)
+def test_add_item(patch_cli):
+    patch_cli.suggestions()
+    patch_cli.prompts(
+        text=["ohm", "desc"],
+        floats=[50.0, 10.0, 0.0, 1.0, 2.0, 0.1],
+        choices=["earthing_impedance", "magnitude_angle"],
+    )
+    patch_cli.set(create_item=lambda item, measurement_id: 1)
     cli.add_item(1)
 
 
-def test_edit_measurement(monkeypatch):
-    record = {
-        "location": {"name": "Site"},
-        "method": "wenner",
-        "asset_type": "substation",
-    }
-    monkeypatch.setattr(cli, "_load_measurement", lambda mid: record)
-    monkeypatch.setattr(cli, "_existing_locations", lambda: ["Site"])
-    monkeypatch.setattr(cli, "_existing_measurement_values", lambda field: [])
-    monkeypatch.setattr(cli, "_prompt_text", _seq(["Site", "desc", "op"]))
-    monkeypatch.setattr(cli, "_prompt_float", _seq([1.0, 2.0, 3.0, 10.0, 0.5]))
-    monkeypatch.setattr(cli, "_prompt_choice", _seq(["wenner", "substation"]))
-    monkeypatch.setattr(cli, "update_measurement", lambda mid, updates: True)
+_EDIT_MEASUREMENT_RECORD = {
+    "location": {"name": "Site"},
+    "method": "wenner",
+    "asset_type": "substation",
+}
+
+
+def _stub_edit_measurement(patch_cli, updated):
+    patch_cli.suggestions(locations=["Site"])
+    patch_cli.prompts(
+        text=["Site", "desc", "op"],
+        floats=[1.0, 2.0, 3.0, 10.0, 0.5],
+        choices=["wenner", "substation"],
+    )
+    patch_cli.set(
+        _load_measurement=lambda mid: dict(_EDIT_MEASUREMENT_RECORD),
+        update_measurement=lambda mid, updates: updated,
+    )
+
+
+def test_edit_measurement(patch_cli):
+    _stub_edit_measurement(patch_cli, updated=True)
     cli.edit_measurement(1)
 
 
-def test_edit_measurement_not_found(monkeypatch):
-    record = {
-        "location": {"name": "Site"},
-        "method": "wenner",
-        "asset_type": "substation",
-    }
-    monkeypatch.setattr(cli, "_load_measurement", lambda mid: record)
-    monkeypatch.setattr(cli, "_existing_locations", lambda: ["Site"])
-    monkeypatch.setattr(cli, "_existing_measurement_values", lambda field: [])
-    monkeypatch.setattr(cli, "_prompt_text", _seq(["Site", "desc", "op"]))
-    monkeypatch.setattr(cli, "_prompt_float", _seq([1.0, 2.0, 3.0, 10.0, 0.5]))
-    monkeypatch.setattr(cli, "_prompt_choice", _seq(["wenner", "substation"]))
-    monkeypatch.setattr(cli, "update_measurement", lambda mid, updates: False)
+def test_edit_measurement_not_found(patch_cli):
+    _stub_edit_measurement(patch_cli, updated=False)
     with pytest.raises(typer.Exit):
         cli.edit_measurement(1)
 
 
-def test_edit_item(monkeypatch):
+def test_edit_item(patch_cli):
     item = {
         "measurement_type": "earthing_impedance",
         "frequency_hz": 50.0,
         "value": 10.0,
         "value_angle_deg": 0.0,
     }
-    monkeypatch.setattr(cli, "_load_item", lambda item_id: item)
-    monkeypatch.setattr(cli, "_existing_item_values", lambda field, measurement_type=None: [])
-    monkeypatch.setattr(cli, "_existing_item_units", lambda measurement_type: [])
-    monkeypatch.setattr(cli, "_prompt_choice", _seq(["earthing_impedance", "real_imag"]))
-    monkeypatch.setattr(cli, "_prompt_float", _seq([60.0, 1.0, 2.0, 3.0, 4.0, 5.0]))
-    monkeypatch.setattr(cli, "_prompt_text", _seq(["ohm", "desc"]))
-    monkeypatch.setattr(cli, "update_item", lambda item_id, updates: True)
+    patch_cli.suggestions()
+    patch_cli.prompts(
+        text=["ohm", "desc"],
+        floats=[60.0, 1.0, 2.0, 3.0, 4.0, 5.0],
+        choices=["earthing_impedance", "real_imag"],
+    )
+    patch_cli.set(
+        _load_item=lambda item_id: item,
+        update_item=lambda item_id, updates: True,
+    )
     cli.edit_item(1)
 
 
-def test_edit_item_not_found(monkeypatch):
+def test_edit_item_not_found(patch_cli):
     item = {"measurement_type": "earthing_impedance", "frequency_hz": 50.0}
-    monkeypatch.setattr(cli, "_load_item", lambda item_id: item)
-    monkeypatch.setattr(cli, "_existing_item_values", lambda field, measurement_type=None: [])
-    monkeypatch.setattr(cli, "_existing_item_units", lambda measurement_type: [])
-    monkeypatch.setattr(cli, "_prompt_choice", _seq(["earthing_impedance", "magnitude_angle"]))
-    monkeypatch.setattr(cli, "_prompt_float", _seq([50.0, 1.0, 2.0, 3.0, 4.0, 5.0]))
-    monkeypatch.setattr(cli, "_prompt_text", _seq(["ohm", "desc"]))
-    monkeypatch.setattr(cli, "update_item", lambda item_id, updates: False)
+    patch_cli.suggestions()
+    patch_cli.prompts(
+        text=["ohm", "desc"],
+        floats=[50.0, 1.0, 2.0, 3.0, 4.0, 5.0],
+        choices=["earthing_impedance", "magnitude_angle"],
+    )
+    patch_cli.set(
+        _load_item=lambda item_id: item,
+        update_item=lambda item_id, updates: False,
+    )
     with pytest.raises(typer.Exit):
         cli.edit_item(1)
 
@@ -351,7 +421,7 @@ def test_cli_import_from_images_json_out(monkeypatch, tmp_path):
         "import_items_from_images",
         lambda **kwargs: {"created_item_ids": [1], "skipped": [], "parsed_row_count": 2},
     )
-    out = tmp_path / "summary.json"
+    out = _MemoryPath("summary.json")
     cli.cli_import_from_images(1, tmp_path, measurement_type="earthing_impedance", json_out=out)
     assert json.loads(out.read_text())["parsed_row_count"] == 2
 
@@ -372,68 +442,91 @@ def test_cli_import_from_images_skipped(monkeypatch, tmp_path, capsys):
     assert "Skipped:" in out
 
 
-def test_cli_impedance_over_frequency(monkeypatch):
+# Thin commands that forward one analytics call to _dump_or_print:
+# (patched backend, its stub, command, args, kwargs, check on the dumped data)
+_DUMP_CASES = [
+    pytest.param(
+        "impedance_over_frequency",
+        lambda ids: {"a": 1},
+        "cli_impedance_over_frequency",
+        ([1],),
+        {},
+        lambda data: data == {"a": 1},
+        id="impedance_over_frequency",
+    ),
+    pytest.param(
+        "real_imag_over_frequency",
+        lambda ids: {"a": 1},
+        "cli_real_imag_over_frequency",
+        ([1],),
+        {},
+        lambda data: data == {"a": 1},
+        id="real_imag_over_frequency",
+    ),
+    pytest.param(
+        "soil_resistivity_profile_detailed",
+        lambda **kwargs: [{"depth_m": 1.0}],
+        "cli_soil_profile",
+        (1,),
+        {},
+        lambda data: data == [{"depth_m": 1.0}],
+        id="soil_profile",
+    ),
+    pytest.param(
+        "invert_soil_resistivity_layers",
+        lambda **kwargs: {"layers": []},
+        "cli_soil_inversion",
+        (1,),
+        {},
+        lambda data: "layers" in data,
+        id="soil_inversion",
+    ),
+    pytest.param(
+        "rho_f_model",
+        lambda ids: (1, 2, 3, 4, 5),
+        "cli_rho_f_model",
+        ([1],),
+        {},
+        lambda data: data["k5"] == 5,
+        id="rho_f_model",
+    ),
+    pytest.param(
+        "voltage_vt_epr",
+        lambda ids, frequency=50.0: {"epr": 1.0},
+        "cli_voltage_vt_epr",
+        ([1],),
+        {"frequency": 60.0},
+        lambda data: data["epr"] == 1.0,
+        id="voltage_vt_epr",
+    ),
+    pytest.param(
+        "shield_currents_for_location",
+        lambda **kwargs: [{"id": 1}],
+        "cli_shield_currents",
+        (1,),
+        {},
+        lambda data: data == [{"id": 1}],
+        id="shield_currents",
+    ),
+    pytest.param(
+        "calculate_split_factor",
+        lambda **kwargs: {"split_factor": 0.5},
+        "cli_calculate_split_factor",
+        (),
+        {"earth_fault_current_id": 1, "shield_current_ids": [2]},
+        lambda data: data["split_factor"] == 0.5,
+        id="calculate_split_factor",
+    ),
+]
+
+
+@pytest.mark.parametrize("backend, stub, command, args, kwargs, check", _DUMP_CASES)
+def test_cli_dump_commands(monkeypatch, backend, stub, command, args, kwargs, check):
     seen = {}
-    monkeypatch.setattr(cli, "impedance_over_frequency", lambda ids: {"a": 1})
+    monkeypatch.setattr(cli, backend, stub)
     monkeypatch.setattr(cli, "_dump_or_print", lambda data, json_out: seen.setdefault("data", data))
-    cli.cli_impedance_over_frequency([1])
-    assert seen["data"] == {"a": 1}
-
-
-def test_cli_real_imag_over_frequency(monkeypatch):
-    seen = {}
-    monkeypatch.setattr(cli, "real_imag_over_frequency", lambda ids: {"a": 1})
-    monkeypatch.setattr(cli, "_dump_or_print", lambda data, json_out: seen.setdefault("data", data))
-    cli.cli_real_imag_over_frequency([1])
-    assert seen["data"] == {"a": 1}
-
-
-def test_cli_soil_profile(monkeypatch):
-    seen = {}
-    monkeypatch.setattr(cli, "soil_resistivity_profile_detailed", lambda **kwargs: [{"depth_m": 1.0}])
-    monkeypatch.setattr(cli, "_dump_or_print", lambda data, json_out: seen.setdefault("data", data))
-    cli.cli_soil_profile(1)
-    assert seen["data"] == [{"depth_m": 1.0}]
-
-
-def test_cli_soil_inversion(monkeypatch):
-    seen = {}
-    monkeypatch.setattr(cli, "invert_soil_resistivity_layers", lambda **kwargs: {"layers": []})
-    monkeypatch.setattr(cli, "_dump_or_print", lambda data, json_out: seen.setdefault("data", data))
-    cli.cli_soil_inversion(1)
-    assert "layers" in seen["data"]
-
-
-def test_cli_rho_f_model(monkeypatch):
-    seen = {}
-    monkeypatch.setattr(cli, "rho_f_model", lambda ids: (1, 2, 3, 4, 5))
-    monkeypatch.setattr(cli, "_dump_or_print", lambda data, json_out: seen.setdefault("data", data))
-    cli.cli_rho_f_model([1])
-    assert seen["data"]["k5"] == 5
-
-
-def test_cli_voltage_vt_epr(monkeypatch):
-    seen = {}
-    monkeypatch.setattr(cli, "voltage_vt_epr", lambda ids, frequency=50.0: {"epr": 1.0})
-    monkeypatch.setattr(cli, "_dump_or_print", lambda data, json_out: seen.setdefault("data", data))
-    cli.cli_voltage_vt_epr([1], frequency=60.0)
-    assert seen["data"]["epr"] == 1.0
-
-
-def test_cli_shield_currents(monkeypatch):
-    seen = {}
-    monkeypatch.setattr(cli, "shield_currents_for_location", lambda **kwargs: [{"id": 1}])
-    monkeypatch.setattr(cli, "_dump_or_print", lambda data, json_out: seen.setdefault("data", data))
-    cli.cli_shield_currents(1)
-    assert seen["data"] == [{"id": 1}]
-
-
-def test_cli_calculate_split_factor(monkeypatch):
-    seen = {}
-    monkeypatch.setattr(cli, "calculate_split_factor", lambda **kwargs: {"split_factor": 0.5})
-    monkeypatch.setattr(cli, "_dump_or_print", lambda data, json_out: seen.setdefault("data", data))
-    cli.cli_calculate_split_factor(earth_fault_current_id=1, shield_current_ids=[2])
-    assert seen["data"]["split_factor"] == 0.5
+    getattr(cli, command)(*args, **kwargs)
+    assert check(seen["data"])
 
 
 def test_cli_soil_model(monkeypatch):
@@ -445,16 +538,38 @@ def test_cli_soil_model(monkeypatch):
     assert "predicted_curve" in seen["data"]
 
 
-def test_cli_plot_impedance(monkeypatch, tmp_path):
-    out = tmp_path / "plot.png"
-
-    class DummyFig:
-        def savefig(self, path):
-            Path(path).write_text("img")
-
-    monkeypatch.setattr(cli, "plot_imp_over_f", lambda *args, **kwargs: DummyFig())
-    cli.cli_plot_impedance([1], output=out)
-    assert out.exists()
+# Plot commands: (patched plot function, command, args, kwargs, extra stubs)
+_PLOT_CASES = [
+    pytest.param("plot_imp_over_f", "cli_plot_impedance", ([1],), {}, {}, id="impedance"),
+    pytest.param(
+        "plot_rho_f_model",
+        "cli_plot_rho_f_model",
+        ([1],),
+        {"rho_f_coeffs": None, "rho": [100.0]},
+        {"rho_f_model": lambda ids: (1, 2, 3, 4, 5)},
+        id="rho_f_model",
+    ),
+    pytest.param(
+        "plot_voltage_vt_epr", "cli_plot_voltage_vt_epr", ([1],), {}, {}, id="voltage_vt_epr"
+    ),
+    pytest.param(
+        "plot_soil_model", "cli_plot_soil_model", (), {"rho": [100.0]}, {}, id="soil_model"
+    ),
+    pytest.param(
+        "plot_soil_inversion", "cli_plot_soil_inversion", (1,), {}, {}, id="soil_inversion"
+    ),
+]
+
+
+@pytest.mark.parametrize("plot_fn, command, args, kwargs, extra", _PLOT_CASES)
+def test_cli_plot_commands(monkeypatch, plot_fn, command, args, kwargs, extra):
+    out = Path("plot.png")
+    fig = _RecordingFig()
+    monkeypatch.setattr(cli, plot_fn, lambda *a, **kw: fig)
+    for name, stub in extra.items():
+        monkeypatch.setattr(cli, name, stub)
+    getattr(cli, command)(*args, output=out, **kwargs)
+    assert fig.saved == [out]
 
 
 def test_cli_plot_rho_f_model_coeff_error():
@@ -462,59 +577,9 @@ def test_cli_plot_rho_f_model_coeff_error():
         cli.cli_plot_rho_f_model([1], rho_f_coeffs=[1, 2, 3], output=Path("x.png"))
 
 
-def test_cli_plot_rho_f_model(monkeypatch, tmp_path):
-    out = tmp_path / "plot.png"
-
-    class DummyFig:
-        def savefig(self, path):
-            Path(path).write_text("img")
-
-    monkeypatch.setattr(cli, "plot_rho_f_model", lambda *args, **kwargs: DummyFig())
-    monkeypatch.setattr(cli, "rho_f_model", lambda ids: (1, 2, 3, 4, 5))
-    cli.cli_plot_rho_f_model([1], rho_f_coeffs=None, rho=[100.0], output=out)
-    assert out.exists()
-
-
-def test_cli_plot_voltage_vt_epr(monkeypatch, tmp_path):
-    out = tmp_path / "plot.png"
-
-    class DummyFig:
-        def savefig(self, path):
-            Path(path).write_text("img")
-
-    monkeypatch.setattr(cli, "plot_voltage_vt_epr", lambda *args, **kwargs: DummyFig())
-    cli.cli_plot_voltage_vt_epr([1], output=out)
-    assert out.exists()
-
-
-def test_cli_plot_soil_model(monkeypatch, tmp_path):
-    out = tmp_path / "plot.png"
-
-    class DummyFig:
-        def savefig(self, path):
-            Path(path).write_text("img")
-
-    monkeypatch.setattr(cli, "plot_soil_model", lambda *args, **kwargs: DummyFig())
-    cli.cli_plot_soil_model(rho=[100.0], output=out)
-    assert out.exists()
-
-
-def test_cli_plot_soil_inversion(monkeypatch, tmp_path):
-    out = tmp_path / "plot.png"
-
-    class DummyFig:
-        def savefig(self, path):
-            Path(path).write_text("img")
-
-    monkeypatch.setattr(cli, "plot_soil_inversion", lambda *args, **kwargs: DummyFig())
-    cli.cli_plot_soil_inversion(1, output=out)
-    assert out.exists()
-
-
 def test_import_json_single(tmp_path, monkeypatch, capsys):
-    payload = {"method": "wenner", "asset_type": "substation", "items": [{"value": 1}]}
     file_path = tmp_path / "one.json"
-    file_path.write_text(json.dumps(payload))
+    file_path.write_text(_MEASUREMENT_WITH_ITEM_JSON)
 
     created = {"items": 0}
     monkeypatch.setattr(cli, "create_measurement", lambda m: 1)
@@ -528,8 +593,8 @@ def test_import_json_single(tmp_path, monkeypatch, capsys):
 def test_import_json_directory_merge(tmp_path, monkeypatch, capsys):
     meas_path = tmp_path / "sample_measurement.json"
     items_path = tmp_path / "sample_items.json"
-    meas_path.write_text(json.dumps({"method": "wenner", "asset_type": "substation"}))
-    items_path.write_text(json.dumps([{"value": 1}, {"value": 2}]))
+    meas_path.write_text(_MEASUREMENT_JSON)
+    items_path.write_text(_TWO_ITEMS_JSON)
 
     created = {"items": 0}
     monkeypatch.setattr(cli, "create_measurement", lambda m: 1)
@@ -555,23 +620,23 @@ def test_import_json_invalid_json(tmp_path, monkeypatch, capsys):
 
 def test_import_json_unsupported_structure(tmp_path, monkeypatch, capsys):
     bad = tmp_path / "bad2.json"
-    bad.write_text(json.dumps("string"))
+    bad.write_text(_STRING_JSON)
     monkeypatch.setattr(cli, "create_measurement", lambda m: 1)
     cli.import_json(bad)
     assert "Unsupported JSON structure" in capsys.readouterr().out
 
 
-def test_export_json(monkeypatch, tmp_path):
+def test_export_json(monkeypatch):
     seen = {}
     monkeypatch.setattr(cli, "export_measurements_to_json", lambda path, **filters: seen.setdefault("filters", filters))
-    cli.export_json(tmp_path / "out.json", measurement_ids=[1, 2])
+    cli.export_json(Path("out.json"), measurement_ids=[1, 2])
     assert seen["filters"]["id__in"] == [1, 2]
 
 
-def test_export_json_no_filters(monkeypatch, tmp_path):
+def test_export_json_no_filters(monkeypatch):
     seen = {}
     monkeypatch.setattr(cli, "export_measurements_to_json", lambda path, **filters: seen.setdefault("filters", filters))
-    cli.export_json(tmp_path / "out.json", measurement_ids=None)
+    cli.export_json(Path("out.json"), measurement_ids=None)
     assert seen["filters"] == {}
 
 
@@ -583,25 +648,33 @@ def test_cli_map_success(monkeypatch):
 
 def test_cli_map_error(monkeypatch):
     monkeypatch.setattr(cli, "read_measurements_by", lambda **kwargs: ([], None))
-    monkeypatch.setattr(cli, "generate_map", lambda *args, **kwargs: (_ for _ in ()).throw(RuntimeError("x")))
+    monkeypatch.setattr(cli, "generate_map", raiser(RuntimeError("x")))
     with pytest.raises(typer.Exit):
         cli.cli_map(output=Path("map.html"))
 
 
-def test_cli_dashboard_subprocess_error(monkeypatch):
-    def fake_run(*args, **kwargs):
-        raise subprocess.CalledProcessError(1, "cmd")
-
-    monkeypatch.setattr(subprocess, "run", fake_run)
-    with pytest.raises(typer.Exit):
+@pytest.fixture
+def failing_subprocess_run(monkeypatch, request):
+    """Make ``subprocess.run`` raise the exception given as the fixture param."""
+    monkeypatch.setattr(subprocess, "run", raiser(request.param))
+
+
+@pytest.mark.parametrize(
+    "failing_subprocess_run, exits",
+    [
+        pytest.param(subprocess.CalledProcessError(1, "cmd"), True, id="subprocess_error"),
+        pytest.param(KeyboardInterrupt(), False, id="keyboard_interrupt"),
+    ],
+    indirect=["failing_subprocess_run"],
+)
+def test_cli_dashboard_errors(failing_subprocess_run, exits):
+    if exits:
+        with pytest.raises(typer.Exit):
+            cli.cli_dashboard()
+    else:
         cli.cli_dashboard()
 
 
-def test_cli_dashboard_keyboard_interrupt(monkeypatch):
-    monkeypatch.setattr(subprocess, "run", lambda *args, **kwargs: (_ for _ in ()).throw(KeyboardInterrupt()))
-    cli.cli_dashboard()
-
-
 def test_set_default_db(tmp_path, monkeypatch, capsys):
     cfg = tmp_path / "cfg.json"
     monkeypatch.setattr(cli, "CONFIG_PATH", cfg)
@@ -1,5 +1,7 @@
 from types import SimpleNamespace
 
+import pytest
+
 from groundmeas.ui import dashboard
 
 
@@ -11,63 +13,34 @@ class DummyContext:
         return False
 
 
+def _ignore(*args, **kwargs):
+    return None
+
+
+def _sidebar_multiselect(label, options, default=None, **kwargs):
+    return default if default is not None else []
+
+
 class DummyStreamlit:
+    # Stateless widgets are shared class attributes; only session_state and the
+    # button sequence are per instance.
+    sidebar = SimpleNamespace(header=_ignore, multiselect=_sidebar_multiselect, write=_ignore)
+
     def __init__(self, button_sequence=None):
         self.session_state = {}
         self._button_iter = iter(button_sequence or [])
-        self.sidebar = SimpleNamespace(
-            header=self._noop,
-            multiselect=self._sidebar_multiselect,
-            write=self._noop,
-        )
 
     def _noop(self, *args, **kwargs):
         return None
 
-    def _sidebar_multiselect(self, label, options, default=None, **kwargs):
-        return default if default is not None else []
+    set_page_config = title = write = info = warning = error = _noop
+    divider = header = subheader = json = dataframe = plotly_chart = rerun = _noop
 
     def cache_data(self, func=None):
         if func is None:
             return lambda f: f
         return func
 
-    def set_page_config(self, *args, **kwargs):
-        return None
-
-    def title(self, *args, **kwargs):
-        return None
-
-    def write(self, *args, **kwargs):
-        return None
-
-    def info(self, *args, **kwargs):
-        return None
-
-    def warning(self, *args, **kwargs):
-        return None
-
-    def error(self, *args, **kwargs):
-        return None
-
-    def divider(self, *args, **kwargs):
-        return None
-
-    def header(self, *args, **kwargs):
-        return None
-
-    def subheader(self, *args, **kwargs):
-        return None
-
-    def json(self, *args, **kwargs):
-        return None
-
-    def dataframe(self, *args, **kwargs):
-        return None
-
-    def plotly_chart(self, *args, **kwargs):
-        return None
-
     def checkbox(self, *args, value=False, **kwargs):
         return value
 
@@ -97,8 +70,50 @@ class DummyStreamlit:
         except StopIteration:
             return False
 
-    def rerun(self):
-        return None
+
+@pytest.fixture(scope="module")
+def dashboard_stubs():
+    """Backend stubs for ``dashboard.main``, built once per module."""
+    return SimpleNamespace(
+        st_folium=lambda *args, **kwargs: {"last_object_clicked_tooltip": None},
+        read_measurements_by=lambda **kwargs: (
+            [
+                {
+                    "id": 1,
+                    "asset_type": "substation",
+                    "location": {"name": "Site", "latitude": 1.0, "longitude": 2.0},
+                    "items": [],
+                }
+            ],
+            None,
+        ),
+        plot_imp_over_f_plotly=lambda ids: "fig",
+        plot_rho_f_model_plotly=lambda ids, coeffs: "fig",
+        plot_voltage_vt_epr_plotly=lambda ids, frequency=50.0: "fig",
+        value_over_distance_detailed=lambda ids, measurement_type="earthing_impedance": {
+            1: [{"frequency": 50.0}]
+        },
+        plot_value_over_distance_plotly=lambda *args, **kwargs: "fig",
+        soil_resistivity_curve=lambda **kwargs: [{"spacing_m": 1.0, "rho_ohm_m": 10.0}],
+        multilayer_soil_model=lambda **kwargs: {"layers": []},
+        plot_soil_model_plotly=lambda **kwargs: "fig",
+        layered_earth_forward=lambda **kwargs: [1.0],
+        invert_soil_resistivity_layers=lambda **kwargs: {
+            "layers": [],
+            "misfit": {},
+            "observed_curve": [],
+            "predicted_curve": [],
+        },
+        plot_soil_inversion_plotly=lambda **kwargs: "fig",
+    )
+
+
+@pytest.fixture
+def stubbed_dashboard(monkeypatch, dashboard_stubs):
+    """Apply the shared stubs for one test; monkeypatch still undoes them."""
+    for name, stub in vars(dashboard_stubs).items():
+        monkeypatch.setattr(dashboard, name, stub)
+    return dashboard
 
 
 def test_resolve_db_path_env(monkeypatch):
@@ -110,56 +125,13 @@ def test_parse_float_list():
     assert dashboard._parse_float_list("1, 2; 3") == [1.0, 2.0, 3.0]
 
 
-def test_main_runs_with_stubs(monkeypatch):
+def test_main_runs_with_stubs(monkeypatch, stubbed_dashboard):
     dummy = DummyStreamlit(button_sequence=[True, True, True, True, True, True])
     dummy.session_state["multiselect_ids"] = [1]
-    monkeypatch.setattr(dashboard, "st", dummy)
-    monkeypatch.setattr(
-        dashboard,
-        "st_folium",
-        lambda *args, **kwargs: {"last_object_clicked_tooltip": None},
-    )
-    monkeypatch.setattr(
-        dashboard,
-        "read_measurements_by",
-        lambda **kwargs: (
-            [
-                {
-                    "id": 1,
-                    "asset_type": "substation",
-                    "location": {"name": "Site", "latitude": 1.0, "longitude": 2.0},
-                    "items": [],
-                }
-            ],
-            None,
-        ),
-    )
-    monkeypatch.setattr(dashboard, "plot_imp_over_f_plotly", lambda ids: "fig")
-    monkeypatch.setattr(dashboard, "plot_rho_f_model_plotly", lambda ids, coeffs: "fig")
-    monkeypatch.setattr(dashboard, "plot_voltage_vt_epr_plotly", lambda ids, frequency=50.0: "fig")
-    monkeypatch.setattr(
-        dashboard,
-        "value_over_distance_detailed",
-        lambda ids, measurement_type="earthing_impedance": {1: [{"frequency": 50.0}]},
-    )
-    monkeypatch.setattr(dashboard, "plot_value_over_distance_plotly", lambda *args, **kwargs: "fig")
-    monkeypatch.setattr(
-        dashboard,
-        "soil_resistivity_curve",
-        lambda **kwargs: [{"spacing_m": 1.0, "rho_ohm_m": 10.0}],
-    )
-    monkeypatch.setattr(dashboard, "multilayer_soil_model", lambda **kwargs: {"layers": []})
-    monkeypatch.setattr(dashboard, "plot_soil_model_plotly", lambda **kwargs: "fig")
-    monkeypatch.setattr(dashboard, "layered_earth_forward", lambda **kwargs: [1.0])
-    monkeypatch.setattr(
-        dashboard,
-        "invert_soil_resistivity_layers",
-        lambda **kwargs: {"layers": [], "misfit": {}, "observed_curve": [], "predicted_curve": []},
-    )
-    monkeypatch.setattr(dashboard, "plot_soil_inversion_plotly", lambda **kwargs: "fig")
+    monkeypatch.setattr(stubbed_dashboard, "st", dummy)
 
     import groundmeas.analytics as analytics
 
     monkeypatch.setattr(analytics, "rho_f_model", lambda ids: (1.0, 2.0, 3.0, 4.0, 5.0))
 
-    dashboard.main()
+    stubbed_dashboard.main()
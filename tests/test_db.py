@@ -1,9 +1,13 @@
 # tests/test_db.py
 
+import math
+
 import pytest
 
 from sqlalchemy.exc import SQLAlchemyError
 from sqlalchemy.orm import Session as SA_Session
+from sqlalchemy.pool import StaticPool
+from sqlmodel import SQLModel, create_engine
 
 import groundmeas.core.db as db
 from groundmeas.core.db import (
@@ -14,58 +18,126 @@ from groundmeas.core.db import (
     read_measurements,
     read_measurements_by,
     read_items_by,
+    read_item_columns,
+    read_item_arrays,
     update_measurement,
     update_item,
     delete_measurement,
     delete_item,
 )
 
+from tests.helpers import raiser
 
-def test_connect_db_success(tmp_path):
-    db._engine = None
-    db_path = tmp_path / "test.db"
+
+@pytest.fixture(scope="module")
+def _memory_engine():
+    """One in-memory SQLite engine with the schema, created once per module."""
+    # StaticPool keeps a single connection, so every session sees the same data
+    engine = create_engine(
+        "sqlite://",
+        poolclass=StaticPool,
+        connect_args={"check_same_thread": False},
+    )
+    SQLModel.metadata.create_all(engine)
+    yield engine
+    engine.dispose()
+
+
+@pytest.fixture
+def memory_db(monkeypatch, _memory_engine):
+    """Point the db module at the shared in-memory engine; empty it afterwards."""
+    monkeypatch.setattr(db, "_engine", _memory_engine)
+    yield _memory_engine
+    with _memory_engine.begin() as conn:
+        for table in reversed(SQLModel.metadata.sorted_tables):
+            conn.execute(table.delete())
+
+
+@pytest.fixture
+def no_engine(monkeypatch):
+    """Run the test with no database connected."""
+    monkeypatch.setattr(db, "_engine", None)
+
+
+def test_connect_db_success(no_engine):
     # should not raise
-    connect_db(str(db_path), echo=True)
+    connect_db(":memory:")
     assert db._engine is not None
     # we can get a real Session
     sess = _get_session()
     assert isinstance(sess, SA_Session)
     sess.close()
+    db._engine.dispose()
+
+
+@pytest.mark.slow
+def test_connect_db_creates_file(tmp_path, no_engine):
+    db_path = tmp_path / "test.db"
+    connect_db(str(db_path))
+    assert db_path.exists()
+    db._engine.dispose()
+
+
+def test_connect_db_forwards_echo(monkeypatch, no_engine):
+    # record the flag but build a quiet engine, so no SQL logging handler is installed
+    seen = []
+    real_create_engine = db.create_engine
+
+    def recording_create_engine(url, echo):
+        seen.append(echo)
+        return real_create_engine(url, echo=False)
+
+    monkeypatch.setattr(db, "create_engine", recording_create_engine)
+    connect_db(":memory:", echo=True)
+    assert seen == [True]
+    db._engine.dispose()
 
 
 def test_connect_db_failure(monkeypatch):
     # simulate create_engine raising
-    def fake_create_engine(url, echo):
-        raise SQLAlchemyError("boom")
-    monkeypatch.setattr(db, "create_engine", fake_create_engine)
+    monkeypatch.setattr(db, "create_engine", raiser(SQLAlchemyError("boom")))
     with pytest.raises(RuntimeError) as exc:
         connect_db("dummy.db")
     assert "Could not initialize database" in str(exc.value)
 
 
-def test_get_session_not_initialized():
-    db._engine = None
-    with pytest.raises(RuntimeError):
-        _get_session()
+@pytest.mark.parametrize(
+    "call",
+    [
+        _get_session,
+        lambda: create_measurement({}),
+        lambda: create_item({}, measurement_id=1),
+        lambda: read_measurements_by(id=1),
+    ],
+    ids=["get_session", "create_measurement", "create_item", "read_measurements_by"],
+)
+def test_functions_before_connect_raise(no_engine, call):
+    with pytest.raises(RuntimeError, match="Database not initialized"):
+        call()
 
 
 # Helpers for faking sessions
 class DummyMeas:
+    _DUMP = {"id": 7, "foo": "bar"}
+
     def __init__(self):
         self.id = 7
         # have items attribute for read_measurements_by/tests
         self.items = [DummyItem()]
     def model_dump(self):
-        return {"id": self.id, "foo": "bar"}
+        # read_measurements* add "location"/"items" to the dump, so hand out a copy
+        return self._DUMP.copy()
 
 
 class DummyItem:
+    _DUMP = {"id": 99, "x": 42}
+
     def __init__(self):
         self.id = 99
         self.value = None
         self.unit = None
     def model_dump(self):
-        return {"id": self.id, "x": 42}
+        return self._DUMP.copy()
 
 
 class FakeResult:
@@ -77,36 +149,35 @@ class FakeResult:
         return self._objs
 
 
-class FakeSessionReadMeasurements:
-    """Session stub that always returns DummyMeas."""
+class _FakeSessionBase:
+    """``with``-statement support shared by the session stubs."""
+    __slots__ = ()
+
     def __enter__(self):
         return self
+
     def __exit__(self, *args):
         return False
-    def execute(self, stmt):
-        return FakeResult([DummyMeas()])
 
 
-class FakeSessionReadItems:
-    """Session stub that always returns DummyItem."""
-    def __enter__(self):
-        return self
-    def __exit__(self, *args):
-        return False
+class FakeSessionRead(_FakeSessionBase):
+    """Session stub whose queries always return one fresh ``make_obj()``."""
+    __slots__ = ("_make_obj",)
+
+    def __init__(self, make_obj):
+        self._make_obj = make_obj
     def execute(self, stmt):
-        return FakeResult([DummyItem()])
+        return FakeResult([self._make_obj()])
+
 
+class FakeSessionGet(_FakeSessionBase):
+    __slots__ = ("_to_get", "error_on_commit", "added", "deleted")
 
-class FakeSessionGet:
     def __init__(self, to_get=None, error_on_commit=False):
         self._to_get = to_get
         self.error_on_commit = error_on_commit
-
-    def __enter__(self):
-        return self
-
-    def __exit__(self, *args):
-        return False
+        self.added = None
+        self.deleted = None
 
     def get(self, cls, id_):
         return self._to_get
@@ -145,10 +216,20 @@ class DummyMeasurement:
         self.asset_type = None
 
 
-def test_create_measurement_no_location(monkeypatch):
-    fake = FakeSessionGet(to_get=None)
-    # will be used for the measurement block only
-    monkeypatch.setattr(db, "_get_session", lambda: fake)
+@pytest.fixture
+def fake_session(monkeypatch):
+    """Install a ``FakeSessionGet`` as ``db._get_session`` and return it."""
+
+    def _install(to_get=None, **kwargs):
+        session = FakeSessionGet(to_get=to_get, **kwargs)
+        monkeypatch.setattr(db, "_get_session", lambda: session)
+        return session
+
+    return _install
+
+
+def test_create_measurement_no_location(fake_session):
+    fake_session()
     new_id = create_measurement({"foo": "bar"})
     assert new_id == 123
 
@@ -171,11 +252,7 @@ def test_create_measurement_with_location(monkeypatch):
 
 def test_create_measurement_location_error(monkeypatch):
     # first _get_session raises SQLAlchemyError
-    monkeypatch.setattr(
-        db,
-        "_get_session",
-        lambda: (_ for _ in ()).throw(SQLAlchemyError("loc fail"))
-    )
+    monkeypatch.setattr(db, "_get_session", raiser(SQLAlchemyError("loc fail")))
     with pytest.raises(RuntimeError) as exc:
         create_measurement({"location": {"foo": "bar"}})
     assert "Could not create Location" in str(exc.value)
@@ -196,16 +273,14 @@ def test_create_measurement_error_on_meas(monkeypatch):
     assert "Could not create Measurement" in str(exc.value)
 
 
-def test_create_item_success(monkeypatch):
-    fake = FakeSessionGet(to_get=None)
-    monkeypatch.setattr(db, "_get_session", lambda: fake)
+def test_create_item_success(fake_session):
+    fake_session()
     item_id = create_item({"x": 5}, measurement_id=9)
     assert item_id == 123
 
 
-def test_create_item_error(monkeypatch):
-    bad = FakeSessionGet(to_get=None, error_on_commit=True)
-    monkeypatch.setattr(db, "_get_session", lambda: bad)
+def test_create_item_error(fake_session):
+    fake_session(error_on_commit=True)
     with pytest.raises(RuntimeError) as exc:
         create_item({"x": 5}, measurement_id=9)
     assert "Could not create MeasurementItem" in str(exc.value)
@@ -213,18 +288,14 @@ def test_create_item_error(monkeypatch):
 
 def test_read_measurements_error(monkeypatch):
     # _get_session raises
-    monkeypatch.setattr(
-        db,
-        "_get_session",
-        lambda: (_ for _ in ()).throw(RuntimeError("no db"))
-    )
+    monkeypatch.setattr(db, "_get_session", raiser(RuntimeError("no db")))
     with pytest.raises(RuntimeError) as exc:
         read_measurements()
     assert "Could not read measurements" in str(exc.value)
 
 
 def test_read_measurements_success(monkeypatch):
-    monkeypatch.setattr(db, "_get_session", lambda: FakeSessionReadMeasurements())
+    monkeypatch.setattr(db, "_get_session", lambda: FakeSessionRead(DummyMeas))
     recs, ids = read_measurements(where="something")
     assert isinstance(recs, list) and isinstance(ids, list)
     assert recs[0]["foo"] == "bar"
@@ -244,24 +315,20 @@ def test_read_measurements_by_unsupported_op():
 
 
 def test_read_measurements_by_error(monkeypatch):
-    monkeypatch.setattr(
-        db,
-        "_get_session",
-        lambda: (_ for _ in ()).throw(RuntimeError("boom"))
-    )
+    monkeypatch.setattr(db, "_get_session", raiser(RuntimeError("boom")))
     with pytest.raises(RuntimeError) as exc:
         read_measurements_by(id=1)
     assert "Could not read measurements_by" in str(exc.value)
 
 
 def test_read_measurements_by_success(monkeypatch):
-    monkeypatch.setattr(db, "_get_session", lambda: FakeSessionReadMeasurements())
+    monkeypatch.setattr(db, "_get_session", lambda: FakeSessionRead(DummyMeas))
     recs, ids = read_measurements_by(id=7)
     assert recs[0]["foo"] == "bar"
     assert ids == [7]
 
 def test_read_items_by_success(monkeypatch):
-    monkeypatch.setattr(db, "_get_session", lambda: FakeSessionReadItems())
+    monkeypatch.setattr(db, "_get_session", lambda: FakeSessionRead(DummyItem))
     recs, ids = read_items_by(measurement_id=5)
     assert recs[0]["x"] == 42
     assert ids == [99]
@@ -272,12 +339,46 @@ def test_read_items_by_unsupported_op():
         read_items_by(id__bad=1)
 
 
-def test_update_measurement_updates_location(monkeypatch):
+def test_read_item_columns_returns_tuples(memory_db):
+    mid = create_measurement({"method": "wenner", "asset_type": "cable"})
+    create_item(
+        {"measurement_type": "earthing_impedance", "value": 2.0, "frequency_hz": 50.0, "unit": "Ω"},
+        measurement_id=mid,
+    )
+    create_item(
+        {"measurement_type": "earthing_impedance", "value": 1.0, "frequency_hz": 20.0, "unit": "Ω"},
+        measurement_id=mid,
+    )
+    rows = read_item_columns(
+        ("frequency_hz", "value"), order_by=("frequency_hz",), measurement_id__in=[mid]
+    )
+    assert rows == [(20.0, 1.0), (50.0, 2.0)]
+    with pytest.raises(ValueError):
+        read_item_columns(("bogus",))
+
+
+def test_read_item_arrays_returns_columns(memory_db):
+    mid = create_measurement({"method": "wenner", "asset_type": "cable"})
+    create_item(
+        {"measurement_type": "earthing_impedance", "value": 2.0, "frequency_hz": 50.0, "unit": "Ω"},
+        measurement_id=mid,
+    )
+    create_item(
+        {"measurement_type": "earthing_impedance", "value": 1.0, "unit": "Ω"},
+        measurement_id=mid,
+    )
+    cols = read_item_arrays(("frequency_hz", "value", "unit"), order_by=("id",))
+    assert cols["value"].dtype == float
+    assert cols["value"].tolist() == [2.0, 1.0]
+    assert cols["frequency_hz"][0] == 50.0 and math.isnan(cols["frequency_hz"][1])
+    assert cols["unit"].tolist() == ["Ω", "Ω"]
+
+
+def test_update_measurement_updates_location(fake_session):
     loc = DummyLocation(name="Old")
     meas = DummyMeasurement(location_id=1, location=loc)
 
-    session = FakeSessionGet(to_get=meas)
-    monkeypatch.setattr(db, "_get_session", lambda: session)
+    fake_session(to_get=meas)
 
     updated = update_measurement(1, {"method": "wenner", "location": {"name": "New"}})
     assert updated is True
@@ -302,50 +403,43 @@ def test_update_measurement_creates_location(monkeypatch):
     assert meas.location_id == 999
 
 
-def test_update_measurement_not_found(monkeypatch):
-    session = FakeSessionGet(to_get=None)
-    monkeypatch.setattr(db, "_get_session", lambda: session)
+def test_update_measurement_not_found(fake_session):
+    fake_session()
     assert update_measurement(5, {"method": "wenner"}) is False
 
 
-def test_update_item_success(monkeypatch):
+def test_update_item_success(fake_session):
     item = DummyItem()
-    session = FakeSessionGet(to_get=item)
-    monkeypatch.setattr(db, "_get_session", lambda: session)
+    fake_session(to_get=item)
     assert update_item(5, {"value": 1.5, "unit": "ohm"}) is True
     assert item.value == 1.5
     assert item.unit == "ohm"
 
 
-def test_update_item_not_found(monkeypatch):
-    session = FakeSessionGet(to_get=None)
-    monkeypatch.setattr(db, "_get_session", lambda: session)
+def test_update_item_not_found(fake_session):
+    fake_session()
     assert update_item(5, {"value": 1.5}) is False
 
 
-def test_delete_measurement_success(monkeypatch):
+def test_delete_measurement_success(fake_session):
     meas = DummyMeasurement()
-    session = FakeSessionGet(to_get=meas)
-    monkeypatch.setattr(db, "_get_session", lambda: session)
+    session = fake_session(to_get=meas)
     assert delete_measurement(3) is True
     assert session.deleted is meas
 
 
-def test_delete_measurement_not_found(monkeypatch):
-    session = FakeSessionGet(to_get=None)
-    monkeypatch.setattr(db, "_get_session", lambda: session)
+def test_delete_measurement_not_found(fake_session):
+    fake_session()
     assert delete_measurement(3) is False
 
 
-def test_delete_item_success(monkeypatch):
+def test_delete_item_success(fake_session):
     item = DummyItem()
-    session = FakeSessionGet(to_get=item)
-    monkeypatch.setattr(db, "_get_session", lambda: session)
+    session = fake_session(to_get=item)
     assert delete_item(4) is True
     assert session.deleted is item
 
 
-def test_delete_item_not_found(monkeypatch):
-    session = FakeSessionGet(to_get=None)
-    monkeypatch.setattr(db, "_get_session", lambda: session)
+def test_delete_item_not_found(fake_session):
+    fake_session()
     assert delete_item(4) is False
@@ -9,94 +9,71 @@ import pytest
 
 import groundmeas.services.export as export_module
 
+from tests.helpers import raiser
 
-def test_export_json_success(tmp_path, monkeypatch):
+_EXPORTERS = [
+    (export_module.export_measurements_to_json, "json", "JSON"),
+    (export_module.export_measurements_to_csv, "csv", "CSV"),
+    (export_module.export_measurements_to_xml, "xml", "XML"),
+]
+
+
+@pytest.fixture
+def stub_measurements(monkeypatch):
+    """Return a function making ``read_measurements_by`` return ``data``."""
+
+    def _stub(data):
+        monkeypatch.setattr(
+            export_module, "read_measurements_by", lambda **filters: (data, None)
+        )
+
+    return _stub
+
+
+def test_export_json_success(tmp_path, stub_measurements):
     # prepare fake data including a datetime
     data = [
         {"id": 1, "ts": datetime.datetime(2020, 1, 1, 12, 0), "value": 3},
         {"id": 2, "ts": datetime.datetime(2021, 6, 15, 8, 30), "value": None},
     ]
-    # stub read_measurements_by
-    monkeypatch.setattr(
-        export_module,
-        "read_measurements_by",
-        lambda **filters: (data, None),
-    )
+    stub_measurements(data)
 
     out_file = tmp_path / "out.json"
     # run
     export_module.export_measurements_to_json(str(out_file), some_filter=5)
 
-    # verify file exists and content is valid JSON
-    assert out_file.exists()
-    text = out_file.read_text(encoding="utf-8")
-    loaded = json.loads(text)
+    # content should be valid JSON (read_text fails if the file is missing)
+    loaded = json.loads(out_file.read_text(encoding="utf-8"))
     # datetime fields should be isoformat strings
     assert loaded[0]["ts"] == "2020-01-01T12:00:00"
     assert loaded[1]["value"] is None
 
 
-def test_export_json_read_error(monkeypatch):
-    # stub to raise
-    def fake_read(**filters):
-        raise RuntimeError("DB down")
-    monkeypatch.setattr(export_module, "read_measurements_by", fake_read)
-
-    with pytest.raises(RuntimeError) as exc:
-        export_module.export_measurements_to_json("dummy.json", foo=1)
-    assert "Could not read measurements: DB down" in str(exc.value)
-
-
-def test_export_json_write_error(tmp_path, monkeypatch):
-    data = [{"id": 1}]
-    monkeypatch.setattr(
-        export_module,
-        "read_measurements_by",
-        lambda **f: (data, None),
-    )
-    # force Path.open to error
-    def fake_open(self, *args, **kwargs):
-        raise OSError("disk full")
-    monkeypatch.setattr(Path, "open", fake_open)
-
-    with pytest.raises(IOError) as exc:
-        export_module.export_measurements_to_json(str(tmp_path / "x.json"))
-    assert "Could not write JSON file" in str(exc.value)
 
 
-def test_export_csv_success(tmp_path, monkeypatch):
+def test_export_csv_success(tmp_path, stub_measurements):
     data = [
         {"id": 1, "name": "A", "items": [{"id": 10}, {"id": 11}]},
         {"id": 2, "name": "B", "items": []},
     ]
-    monkeypatch.setattr(
-        export_module,
-        "read_measurements_by",
-        lambda **f: (data, None),
-    )
+    stub_measurements(data)
 
     out_file = tmp_path / "out.csv"
     export_module.export_measurements_to_csv(str(out_file), foo="bar")
 
-    assert out_file.exists()
-    with out_file.open(encoding="utf-8", newline="") as f:
-        reader = csv.DictReader(f)
-        rows = list(reader)
+    header, *rows = csv.reader(out_file.read_text(encoding="utf-8").splitlines())
     # header should have id, name, items
-    assert set(reader.fieldnames) == {"id", "name", "items"}
+    assert set(header) == {"id", "name", "items"}
     # two rows
     assert len(rows) == 2
     # items column should be JSON-encoded list
-    assert json.loads(rows[0]["items"]) == [{"id": 10}, {"id": 11}]
-    assert json.loads(rows[1]["items"]) == []
+    items = header.index("items")
+    assert json.loads(rows[0][items]) == [{"id": 10}, {"id": 11}]
+    assert json.loads(rows[1][items]) == []
 
 
-def test_export_csv_empty_data(tmp_path, monkeypatch, caplog):
-    monkeypatch.setattr(
-        export_module,
-        "read_measurements_by",
-        lambda **f: ([], None),
-    )
+def test_export_csv_empty_data(tmp_path, stub_measurements, caplog):
+    stub_measurements([])
     caplog.set_level("WARNING")
     out_file = tmp_path / "empty.csv"
     # should not raise, just warn
@@ -105,34 +82,9 @@ def test_export_csv_empty_data(tmp_path, monkeypatch, caplog):
     assert not out_file.exists()
 
 
-def test_export_csv_read_error(monkeypatch):
-    monkeypatch.setattr(
-        export_module,
-        "read_measurements_by",
-        lambda **f: (_ for _ in ()).throw(Exception("fail read")),
-    )
-    with pytest.raises(RuntimeError) as exc:
-        export_module.export_measurements_to_csv("dummy.csv")
-    assert "Could not read measurements: fail read" in str(exc.value)
-
-
-def test_export_csv_write_error(tmp_path, monkeypatch):
-    data = [{"id": 1, "foo": "bar", "items": []}]
-    monkeypatch.setattr(
-        export_module,
-        "read_measurements_by",
-        lambda **f: (data, None),
-    )
-    def fake_open(self, *args, **kwargs):
-        raise OSError("no space")
-    monkeypatch.setattr(Path, "open", fake_open)
-
-    with pytest.raises(IOError) as exc:
-        export_module.export_measurements_to_csv(str(tmp_path / "c.csv"))
-    assert "Could not write CSV file" in str(exc.value)
 
 
-def test_export_xml_success(tmp_path, monkeypatch):
+def test_export_xml_success(monkeypatch, stub_measurements):
     data = [
         {
             "id": 1,
@@ -144,18 +96,17 @@ def test_export_xml_success(tmp_path, monkeypatch):
             ],
         }
     ]
+    stub_measurements(data)
+
+    # capture the tree the exporter builds instead of re-parsing a file
+    written = []
     monkeypatch.setattr(
-        export_module,
-        "read_measurements_by",
-        lambda **f: (data, None),
+        ET.ElementTree, "write", lambda self, path, **kwargs: written.append((path, self.getroot()))
     )
+    export_module.export_measurements_to_xml("out.xml", x=2)
 
-    out_file = tmp_path / "out.xml"
-    export_module.export_measurements_to_xml(str(out_file), x=2)
-
-    # parse and verify structure
-    tree = ET.parse(out_file)
-    root = tree.getroot()
+    (path, root), = written
+    assert path == Path("out.xml")
     meas = root.find("measurement")
     assert meas is not None and meas.attrib["id"] == "1"
     # foo child should exist with empty text
@@ -174,31 +125,22 @@ def test_export_xml_success(tmp_path, monkeypatch):
     assert second_val.text == "5"
 
 
-def test_export_xml_read_error(monkeypatch):
-    monkeypatch.setattr(
-        export_module,
-        "read_measurements_by",
-        lambda **f: (_ for _ in ()).throw(Exception("no db")),
-    )
+@pytest.mark.parametrize("export_fn,ext,label", _EXPORTERS, ids=["json", "csv", "xml"])
+def test_export_read_error(monkeypatch, export_fn, ext, label):
+    monkeypatch.setattr(export_module, "read_measurements_by", raiser(RuntimeError("DB down")))
+
     with pytest.raises(RuntimeError) as exc:
-        export_module.export_measurements_to_xml("dummy.xml")
-    assert "Could not read measurements: no db" in str(exc.value)
+        export_fn(f"dummy.{ext}", foo=1)
+    assert "Could not read measurements: DB down" in str(exc.value)
 
 
-def test_export_xml_write_error(tmp_path, monkeypatch):
-    data = [{"id": 1, "items": []}]
-    monkeypatch.setattr(
-        export_module,
-        "read_measurements_by",
-        lambda **f: (data, None),
-    )
-    # stub ElementTree.write to raise
-    monkeypatch.setattr(
-        ET.ElementTree,
-        "write",
-        lambda self, path, encoding, xml_declaration: (_ for _ in ()).throw(IOError("full")),
-    )
+@pytest.mark.parametrize("export_fn,ext,label", _EXPORTERS, ids=["json", "csv", "xml"])
+def test_export_write_error(tmp_path, monkeypatch, stub_measurements, export_fn, ext, label):
+    stub_measurements([{"id": 1, "items": []}])
+    # JSON and CSV write through Path.open, XML through ElementTree.write
+    monkeypatch.setattr(Path, "open", raiser(OSError("disk full")))
+    monkeypatch.setattr(ET.ElementTree, "write", raiser(OSError("disk full")))
 
     with pytest.raises(IOError) as exc:
-        export_module.export_measurements_to_xml(str(tmp_path / "x.xml"))
-    assert "Could not write XML file" in str(exc.value)
+        export_fn(str(tmp_path / f"x.{ext}"))
+    assert f"Could not write {label} file" in str(exc.value)
@@ -1,17 +1,42 @@
 # tests/test_plots.py
 import pytest
+import matplotlib
+
+matplotlib.use("Agg")  # headless: select the backend before pyplot is imported
 import matplotlib.pyplot as plt
 
 from groundmeas.visualization import plots
 
 
-def test_plot_imp_over_f_single_success(monkeypatch):
+@pytest.fixture(autouse=True)
+def _close_figures():
+    """Release every figure a test created."""
+    yield
+    plt.close("all")
+
+
+@pytest.fixture
+def stub_impedance(monkeypatch):
+    """Return a function making every measurement report the impedance ``curve``."""
+
+    def _stub(curve):
+        monkeypatch.setattr(
+            plots, "impedance_over_frequency", lambda ids: {mid: dict(curve) for mid in ids}
+        )
+
+    return _stub
+
+
+def _fake_measured_plot(ids):
+    """Stand-in for ``plot_imp_over_f`` drawing one measured curve."""
+    fig, ax = plt.subplots()
+    ax.plot([1, 2], [3, 4], label="measured")
+    return fig
+
+
+def test_plot_imp_over_f_single_success(stub_impedance):
     # stub a simple two‐point impedance curve
-    monkeypatch.setattr(
-        plots,
-        "impedance_over_frequency",
-        lambda mid: {10.0: 1.0, 100.0: 2.0},
-    )
+    stub_impedance({10.0: 1.0, 100.0: 2.0})
     fig = plots.plot_imp_over_f(1)
     assert isinstance(fig, plt.Figure)
     ax = fig.axes[0]
@@ -24,15 +49,35 @@ def test_plot_imp_over_f_single_success(monkeypatch):
     assert ax.get_xlabel() == "Frequency (Hz)"
     assert ax.get_ylabel() == "Impedance (Ω)"
     assert ax.get_title() == "Impedance vs Frequency"
+    assert ax.get_xscale() == "log"
+    assert ax.get_yscale() == "log"
+    assert lines[0].get_markevery() == 1
+
+
+def test_plot_imp_over_f_sorts_points_by_frequency(stub_impedance):
+    stub_impedance({100.0: 2.0, 10.0: 1.0, 50.0: 1.5})
+    line = plots.plot_imp_over_f(1).axes[0].get_lines()[0]
+    assert list(line.get_xdata()) == [10.0, 50.0, 100.0]
+    assert list(line.get_ydata()) == [1.0, 1.5, 2.0]
+
+
+def test_plot_imp_over_f_warns_on_nonpositive_log_values(stub_impedance):
+    stub_impedance({10.0: 0.0, 100.0: 2.0})
+    with pytest.warns(UserWarning, match="<= 0"):
+        plots.plot_imp_over_f(1)
 
 
-def test_plot_imp_over_f_normalize_success(monkeypatch):
+def test_plot_imp_over_f_dense_curve_thins_markers(stub_impedance):
+    stub_impedance({float(f): 1.0 for f in range(1, 501)})
+    fig = plots.plot_imp_over_f(1)
+    line = fig.axes[0].get_lines()[0]
+    assert len(line.get_xdata()) == 500
+    assert line.get_markevery() == 10
+
+
+def test_plot_imp_over_f_normalize_success(stub_impedance):
     # stub with known baseline at 10 Hz
-    monkeypatch.setattr(
-        plots,
-        "impedance_over_frequency",
-        lambda mid: {10.0: 2.0, 100.0: 6.0},
-    )
+    stub_impedance({10.0: 2.0, 100.0: 6.0})
     fig = plots.plot_imp_over_f(1, normalize_freq_hz=10.0)
     ax = fig.axes[0]
     line = ax.get_lines()[0]
@@ -40,40 +85,38 @@ def test_plot_imp_over_f_normalize_success(monkeypatch):
     assert list(line.get_ydata()) == [1.0, 3.0]
     assert ax.get_ylabel() == "Normalized Impedance"
     assert ax.get_title() == "Impedance vs Frequency (Normalized @ 10.0 Hz)"
+    assert ax.get_xscale() == "log"
+    assert ax.get_yscale() == "linear"
 
 
-def test_plot_imp_over_f_normalize_missing_baseline(monkeypatch):
+def test_plot_imp_over_f_normalize_missing_baseline(stub_impedance):
     # stub missing the requested normalize_freq_hz
-    monkeypatch.setattr(
-        plots,
-        "impedance_over_frequency",
-        lambda mid: {100.0: 5.0},
-    )
+    stub_impedance({100.0: 5.0})
     with pytest.raises(ValueError) as exc:
         plots.plot_imp_over_f(1, normalize_freq_hz=10.0)
     assert "has no impedance at 10.0 Hz for normalization" in str(exc.value)
 
 
-def test_plot_imp_over_f_single_no_data(monkeypatch):
+def test_plot_imp_over_f_single_no_data(stub_impedance):
     # stub empty dict
-    monkeypatch.setattr(plots, "impedance_over_frequency", lambda mid: {})
+    stub_impedance({})
     with pytest.raises(ValueError) as exc:
         plots.plot_imp_over_f(42)
     assert "measurement_id=42" in str(exc.value)
 
 
-def test_plot_imp_over_f_multi_all_missing(monkeypatch):
+def test_plot_imp_over_f_multi_all_missing(stub_impedance):
     # stub always empty
-    monkeypatch.setattr(plots, "impedance_over_frequency", lambda mid: {})
+    stub_impedance({})
     with pytest.raises(ValueError) as exc:
         plots.plot_imp_over_f([1, 2, 3])
     assert "provided measurement IDs" in str(exc.value)
 
 
 def test_plot_imp_over_f_multi_partial(monkeypatch):
-    # id=1 missing, id=2 present
-    def imp(mid):
-        return {} if mid == 1 else {1.0: 10.0, 10.0: 20.0}
+    # id=1 missing, id=2 present (fetched in one query)
+    def imp(ids):
+        return {mid: {} if mid == 1 else {1.0: 10.0, 10.0: 20.0} for mid in ids}
     monkeypatch.setattr(plots, "impedance_over_frequency", imp)
 
     with pytest.warns(UserWarning) as record:
@@ -85,13 +128,22 @@ def test_plot_imp_over_f_multi_partial(monkeypatch):
     assert len(ax.get_lines()) == 1
 
 
+def test_plot_imp_over_f_reports_bad_items(monkeypatch):
+    from groundmeas.services import analytics
+
+    items = [
+        {"id": 1, "measurement_id": 1, "frequency_hz": 50.0, "value": 2.0},
+        {"id": 2, "measurement_id": 1, "frequency_hz": None, "value": 3.0},
+    ]
+    monkeypatch.setattr(analytics, "read_items_by", lambda **filters: (items, [1, 2]))
+    with pytest.warns(UserWarning, match="id=2 missing frequency_hz"):
+        fig = plots.plot_imp_over_f(1)
+    assert list(fig.axes[0].get_lines()[0].get_xdata()) == [50.0]
+
+
 def test_plot_rho_f_model_single_rho(monkeypatch):
     # stub plot_imp_over_f to give a figure with one existing curve
-    def fake_plot(ids):
-        fig, ax = plt.subplots()
-        ax.plot([1, 2], [3, 4], label="measured")
-        return fig
-    monkeypatch.setattr(plots, "plot_imp_over_f", fake_plot)
+    monkeypatch.setattr(plots, "plot_imp_over_f", _fake_measured_plot)
 
     # stub real_imag_over_frequency: two frequencies 10 & 100
     rimap = {
@@ -114,12 +166,7 @@ def test_plot_rho_f_model_single_rho(monkeypatch):
 
 
 def test_plot_rho_f_model_multiple_rho(monkeypatch):
-    # same stub
-    def fake_plot(ids):
-        fig, ax = plt.subplots()
-        ax.plot([1, 2], [3, 4], label="measured")
-        return fig
-    monkeypatch.setattr(plots, "plot_imp_over_f", fake_plot)
+    monkeypatch.setattr(plots, "plot_imp_over_f", _fake_measured_plot)
 
     rimap = {1: {1.0: 0+0j}, 2: {1.0: 0+0j}}
     monkeypatch.setattr(plots, "real_imag_over_frequency", lambda ids: rimap)
@@ -196,3 +243,22 @@ def test_plot_value_over_distance(monkeypatch):
     line = ax.get_lines()[0]
     assert list(line.get_xdata()) == [1.0, 2.0]
     assert list(line.get_ydata()) == [2.0, 4.0]
+
+
+def test_plot_imp_over_f_reuses_axes(stub_impedance):
+    stub_impedance({10.0: 1.0, 100.0: 2.0})
+    fig, (ax1, ax2) = plt.subplots(1, 2)
+    assert plots.plot_imp_over_f(1, ax=ax1) is fig
+    assert plots.plot_imp_over_f(1, normalize_freq_hz=10.0, ax=ax2) is fig
+    assert len(ax1.get_lines()) == 1
+    assert list(ax2.get_lines()[0].get_ydata()) == [1.0, 2.0]
+
+
+def test_plot_imp_over_f_tight_opt_out(monkeypatch, stub_impedance):
+    stub_impedance({10.0: 1.0, 100.0: 2.0})
+    calls = []
+    monkeypatch.setattr(plt.Figure, "tight_layout", lambda self, *a, **k: calls.append(1))
+    plots.plot_imp_over_f(1, tight=False)
+    assert calls == []
+    plots.plot_imp_over_f(1)
+    assert calls == [1]
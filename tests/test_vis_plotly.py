@@ -14,6 +14,14 @@ def test_plot_imp_over_f_plotly_normalized(monkeypatch):
     assert isinstance(fig, go.Figure)
     assert len(fig.data) == 1
     assert list(fig.data[0].y) == [1.0, 2.0]
+    assert (fig.layout.xaxis.type, fig.layout.yaxis.type) == ("log", "linear")
+
+
+def test_plot_imp_over_f_plotly_log_axes_warn_on_nonpositive(monkeypatch):
+    monkeypatch.setattr(vis_plotly, "impedance_over_frequency", lambda mid: {10.0: 0.0, 20.0: 4.0})
+    with pytest.warns(UserWarning, match="<= 0"):
+        fig = vis_plotly.plot_imp_over_f_plotly(1)
+    assert (fig.layout.xaxis.type, fig.layout.yaxis.type) == ("log", "log")
 
 
 def test_plot_rho_f_model_plotly_adds_model(monkeypatch):
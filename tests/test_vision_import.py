@@ -1,3 +1,4 @@
+import time
 from pathlib import Path
 
 import numpy as np
@@ -51,6 +52,59 @@ def test_parse_measurement_rows_compact_angles():
     assert rows[0].impedance_angle_deg == pytest.approx(-130.0)
 
 
+def test_parse_measurement_rows_token_scan_keeps_current_and_impedance_apart():
+    rows = parse_measurement_rows("2 m 100 mA 5° 30 mΩ 12°")
+    assert len(rows) == 1
+    assert rows[0].distance_m == 2.0
+    assert rows[0].current_a == pytest.approx(0.1)
+    assert rows[0].current_angle_deg == pytest.approx(5.0)
+    assert rows[0].impedance_ohm == pytest.approx(0.03)
+    assert rows[0].impedance_angle_deg == pytest.approx(12.0)
+
+
+def test_parse_measurement_rows_fills_currents_and_handles_zero_voltage():
+    text = """
+    Distance: 1 m Current: 0.1 A Voltage: 0.02 V
+    Distance: 2 m Current: 0.9 A Voltage: 0 V
+    Distance: 3 m Current: 0.12 A Voltage: 0.03 V Impedance: 9 ohm
+    """
+    rows = parse_measurement_rows(text)
+    by_dist = {r.distance_m: r for r in rows}
+    assert by_dist[2.0].current_a == pytest.approx(0.11)  # outlier -> median
+    assert by_dist[2.0].current_angle_deg == 0.0
+    assert by_dist[2.0].impedance_ohm == 0.0
+    assert by_dist[3.0].impedance_ohm == pytest.approx(0.25)  # off by >20% -> V/I
+
+
+def test_parse_measurement_rows_fills_negative_currents_with_magnitude():
+    text = """
+    Distance: 1 m Current: -0.1 A Voltage: 0.02 V
+    Distance: 2 m Voltage: 0.022 V
+    Distance: 3 m Current: -0.12 A Voltage: 0.03 V
+    Distance: 4 m Current: -0.11 A Voltage: 0.04 V
+    """
+    rows = parse_measurement_rows(text)
+    by_dist = {r.distance_m: r for r in rows}
+    assert [r.current_a for r in rows] == pytest.approx([0.1, 0.11, 0.12, 0.11])
+    assert by_dist[2.0].impedance_ohm == pytest.approx(0.2)
+
+
+def test_parse_measurement_rows_compact_sequence_across_lines():
+    rows = parse_measurement_rows("10 m\n5 mA\n3 mV\n0.6 mΩ")
+    assert rows[0].distance_m == 10.0
+    assert rows[0].current_a == pytest.approx(0.005)
+    assert rows[0].voltage_v == pytest.approx(0.003)
+
+
+def test_parse_measurement_rows_near_miss_text_is_fast():
+    # Many "mA" lines and a single "mV" used to backtrack for over a minute
+    text = "\n".join(f"{i} m 5 mA" for i in range(1, 251)) + "\n3 mV\n"
+    start = time.perf_counter()
+    rows = parse_measurement_rows(text)
+    assert time.perf_counter() - start < 2.0
+    assert len(rows) == 250
+
+
 def test_build_items_median_current_and_ptv():
     rows = [
         ParsedRow(distance_m=0.5, current_a=10.0, voltage_v=50.0, impedance_ohm=0.4),
@@ -106,6 +160,23 @@ def test_prospective_only_from_rows():
     assert items["prospective_items"][0]["value"] == pytest.approx(10.0)
 
 
+def test_prospective_tolerance_dedup_sorted_by_distance():
+    rows = [
+        ParsedRow(distance_m=1.0, voltage_v=10.05),
+        ParsedRow(distance_m=1.0, voltage_v=20.0),
+        ParsedRow(distance_m=1.0, voltage_v=10.0),
+        ParsedRow(distance_m=1.01, voltage_v=10.1),
+    ]
+    items = build_items_from_rows(
+        measurement_id=1,
+        rows=rows,
+        measurement_type="earthing_impedance",
+        frequency_hz=50.0,
+    )
+    values = [it["value"] for it in items["prospective_items"]]
+    assert values == [10.0, 20.0]
+
+
 def test_normalize_ocr_text():
     out = vi._normalize_ocr_text(".5 0. 1.23 rn")
     assert "0.5" in out
@@ -114,6 +185,12 @@ def test_normalize_ocr_text():
     assert "m" in out
 
 
+@pytest.mark.parametrize("n", [1, 2, 5, 8, 9, 20])
+def test_median_matches_numpy(n):
+    values = [float((i * 7) % 11) - 3.5 for i in range(n)]
+    assert vi._median(values) == pytest.approx(float(np.median(values)))
+
+
 def test_parse_value_angle_unit():
     value, angle, unit = vi._parse_value_angle_unit("118.1 mΩ -136.56°")
     assert value == pytest.approx(0.1181)
@@ -121,17 +198,63 @@ def test_parse_value_angle_unit():
     assert unit == "mΩ"
 
 
+@pytest.mark.parametrize("use_umat", [False, True])
+def test_preprocess_image_returns_ndarray(monkeypatch, tmp_path, use_umat):
+    img_path = tmp_path / "img.png"
+    img = np.full((40, 40, 3), 255, dtype=np.uint8)
+    img[10:30, 10:30] = 0
+    vi.cv2.imwrite(str(img_path), img)
+    monkeypatch.setattr(vi, "_opencl_enabled", lambda: use_umat)
+    out = vi.preprocess_image(img_path)
+    assert isinstance(out, np.ndarray)
+    assert out.shape == (40, 40)
+    assert set(np.unique(out)) <= {0, 255}
+
+
+def test_preprocess_image_downscales_large_images(monkeypatch, tmp_path):
+    img_path = tmp_path / "big.png"
+    vi.cv2.imwrite(str(img_path), np.full((300, 600, 3), 255, dtype=np.uint8))
+    monkeypatch.setattr(vi, "_opencl_enabled", lambda: False)
+    assert vi.preprocess_image(img_path, max_dim=200).shape == (100, 200)
+    assert vi.preprocess_image(img_path, max_dim=None).shape == (300, 600)
+
+
 def test_read_api_key_missing(monkeypatch):
     monkeypatch.delenv("MISSING_KEY", raising=False)
     with pytest.raises(RuntimeError):
         vi._read_api_key("MISSING_KEY")
 
 
+class _DummyProc:
+    def __init__(self, stdout=b"TEXT", returncode=0, stderr=b""):
+        self.stdout = stdout
+        self.returncode = returncode
+        self.stderr = stderr
+
+
 def test_ocr_image_tesseract(monkeypatch):
-    monkeypatch.setattr(vi, "preprocess_image", lambda path: np.zeros((2, 2)))
-    monkeypatch.setattr(vi.pytesseract, "image_to_string", lambda img, lang, config: "TEXT")
+    monkeypatch.setattr(vi, "preprocess_image", lambda path, max_dim=None: np.zeros((2, 2), dtype=np.uint8))
+    calls = []
+
+    def fake_run(cmd, input, capture_output, timeout, env):
+        calls.append(cmd)
+        assert input.startswith(b"\x89PNG")
+        assert env is None
+        return _DummyProc()
+
+    monkeypatch.setattr(vi.subprocess, "run", fake_run)
     out = ocr_image(Path("dummy.png"), provider_model="tesseract")
     assert out == "TEXT"
+    assert calls[0][1:3] == ["stdin", "stdout"]
+
+
+def test_ocr_image_tesseract_error(monkeypatch):
+    monkeypatch.setattr(vi, "preprocess_image", lambda path, max_dim=None: np.zeros((2, 2), dtype=np.uint8))
+    monkeypatch.setattr(
+        vi.subprocess, "run", lambda *a, **k: _DummyProc(b"", 1, b"bad lang")
+    )
+    with pytest.raises(RuntimeError, match="bad lang"):
+        ocr_image(Path("dummy.png"), provider_model="tesseract")
 
 
 def test_ocr_image_openai(monkeypatch):
@@ -176,3 +299,140 @@ def test_import_items_from_images_dir_mode(monkeypatch, tmp_path):
         frequency_hz="dir",
     )
     assert out["created_item_ids"] == [123]
+
+
+def test_ocr_tesseract_batch_splits_pages(monkeypatch, tmp_path):
+    def fake_pre(path):
+        if path.name == "bad.png":
+            raise FileNotFoundError("bad")
+        return np.full((4, 4 + len(path.name)), 255, dtype=np.uint8)
+
+    calls = []
+
+    def fake_run(cmd, input, capture_output, timeout, env):
+        ok, pages = vi.cv2.imreadmulti(cmd[1])
+        calls.append(pages)
+        assert timeout == 7.0
+        assert env["OMP_THREAD_LIMIT"] == "1"
+        return _DummyProc(b"page A\fpage B\f")
+
+    monkeypatch.delenv("OMP_THREAD_LIMIT", raising=False)
+    monkeypatch.setattr(vi, "preprocess_image", fake_pre)
+    monkeypatch.setattr(vi.subprocess, "run", fake_run)
+    out = vi._ocr_tesseract_batch(
+        [Path("a.png"), Path("bad.png"), Path("long_b.png")], timeout=7.0
+    )
+    assert len(calls) == 1 and len(calls[0]) == 2
+    assert "OMP_THREAD_LIMIT" not in vi.os.environ
+    assert out[0] == "page A"
+    assert isinstance(out[1], FileNotFoundError)
+    assert out[2] == "page B"
+
+
+def test_tesseract_preprocessing_ignores_upload_max_dim(monkeypatch):
+    seen = []
+
+    def fake_pre(path, **kwargs):
+        seen.append(kwargs)
+        return np.zeros((2, 2), dtype=np.uint8)
+
+    monkeypatch.setattr(vi, "preprocess_image", fake_pre)
+    monkeypatch.setattr(vi.subprocess, "run", lambda *a, **k: _DummyProc(b"A\fB\f"))
+    ocr_image(Path("a.png"), max_dim=800)
+    vi._ocr_tesseract_batch([Path("a.png"), Path("b.png")])
+    # preprocess_image applies its own 2000 px cap
+    assert seen == [{}, {}, {}]
+
+
+def test_ocr_tesseract_batch_falls_back_per_image(monkeypatch):
+    monkeypatch.setattr(vi, "preprocess_image", lambda path, max_dim=None: np.zeros((2, 2), dtype=np.uint8))
+    monkeypatch.setattr(vi.subprocess, "run", lambda *a, **k: _DummyProc(b"only one page"))
+    seen = []
+
+    def fake_ocr_image(path, lang, timeout, use_cache):
+        seen.append(timeout)
+        return f"text {path.name}"
+
+    monkeypatch.setattr(vi, "ocr_image", fake_ocr_image)
+    out = vi._ocr_tesseract_batch([Path("a.png"), Path("b.png")], timeout=3.0)
+    assert out == ["text a.png", "text b.png"]
+    assert seen == [3.0, 3.0]
+
+
+def test_ocr_images_parallel_keeps_order(monkeypatch):
+    def fake_ocr(path, **kwargs):
+        if path.name == "b.png":
+            raise RuntimeError("boom")
+        return path.name
+
+    monkeypatch.setattr(vi, "ocr_image", fake_ocr)
+    paths = [Path("a.png"), Path("b.png"), Path("c.png")]
+    out = vi._ocr_images(paths, provider_model="ollama:x", workers=3)
+    assert out[0] == "a.png" and out[2] == "c.png"
+    assert isinstance(out[1], RuntimeError)
+
+
+def test_ocr_images_tesseract_chunks_per_worker(monkeypatch):
+    chunks = []
+
+    def fake_batch(paths, timeout, use_cache):
+        assert (timeout, use_cache) == (9.0, False)
+        chunks.append([p.name for p in paths])
+        return [p.name for p in paths]
+
+    monkeypatch.delenv("OMP_THREAD_LIMIT", raising=False)
+    monkeypatch.setattr(vi, "_ocr_tesseract_batch", fake_batch)
+    paths = [Path(f"{i}.png") for i in range(5)]
+    out = vi._ocr_images(paths, timeout=9.0, max_dim=900, workers=2)
+    assert out == [p.name for p in paths]
+    assert sorted(len(c) for c in chunks) == [2, 3]
+    assert "OMP_THREAD_LIMIT" not in vi.os.environ
+
+
+def test_ocr_images_single_tesseract_image_gets_timeout(monkeypatch):
+    seen = []
+    monkeypatch.setattr(
+        vi,
+        "ocr_image",
+        lambda path, timeout, max_dim, use_cache: seen.append((timeout, max_dim)) or "text",
+    )
+    assert vi._ocr_images([Path("a.png")], timeout=5.0, max_dim=500) == ["text"]
+    assert seen == [(5.0, 500)]
+
+
+def test_ocr_image_caches_by_content(monkeypatch, tmp_path):
+    monkeypatch.setattr(vi, "_OCR_CACHE_DIR", tmp_path / "cache")
+    img = tmp_path / "a.png"
+    img.write_bytes(b"image-bytes")
+    calls = []
+    monkeypatch.setattr(vi, "preprocess_image", lambda path, max_dim=None: np.zeros((2, 2), dtype=np.uint8))
+    monkeypatch.setattr(vi.subprocess, "run", lambda *a, **k: calls.append(1) or _DummyProc())
+    # off by default
+    ocr_image(img)
+    assert not (tmp_path / "cache").exists()
+    assert ocr_image(img, use_cache=True) == "TEXT"
+    assert ocr_image(img, use_cache=True) == "TEXT"
+    assert len(calls) == 2
+    # the upload size does not affect Tesseract, so it shares the entry
+    ocr_image(img, max_dim=800, use_cache=True)
+    assert len(calls) == 2
+    # different settings or content miss the cache
+    ocr_image(img, lang="deu", use_cache=True)
+    monkeypatch.setattr(vi, "_TESSERACT_CONFIG", "--psm 4 --oem 3")
+    ocr_image(img, use_cache=True)
+    img.write_bytes(b"other-bytes")
+    ocr_image(img, use_cache=True)
+    assert len(calls) == 5
+    if vi.os.name == "posix":
+        assert (tmp_path / "cache").stat().st_mode & 0o077 == 0
+
+
+def test_ocr_cache_evicts_oldest_entries(monkeypatch, tmp_path):
+    cache = tmp_path / "cache"
+    monkeypatch.setattr(vi, "_OCR_CACHE_DIR", cache)
+    monkeypatch.setattr(vi, "_OCR_CACHE_MAX_FILES", 2)
+    for i, name in enumerate(["a", "b", "c"]):
+        vi._ocr_cache_put(cache / f"{name}.txt", name)
+        vi.os.utime(cache / f"{name}.txt", (i, i))
+    vi._ocr_cache_put(cache / "d.txt", "d")
+    assert sorted(p.name for p in cache.iterdir()) == ["c.txt", "d.txt"]